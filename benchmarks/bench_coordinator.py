@@ -0,0 +1,241 @@
+"""Benchmarks for the SCS hot paths against an in-process fake Home Assistant.
+
+    python -m benchmarks.bench_coordinator                 # run and print
+    python -m benchmarks.bench_coordinator --check         # fail on regression
+    python -m benchmarks.bench_coordinator --update-baseline
+
+Two scenarios run for each cover count:
+
+* tick: `SCSCoordinator._async_update_data` plus draining the movement queue,
+  with the fake clock advanced past `min_delta_time` and `move_timeout` and
+  room temperatures flipping every other tick (delivered as sensor events to
+  the temperature filters), so about half of the ticks move covers. Reports per-tick latency percentiles and
+  allocations per tick (tracemalloc, measured in a separate pass).
+* listener: a stream of `state_changed` events, mostly for unrelated entities,
+  pushed through the entity-keyed fake bus into
+  `SCSCoordinator._handle_state_changed`. Reports cost per event and the
+  sustainable event rate against `--event-rate`.
+
+Baselines are stored in benchmarks/baselines.json; `--check` exits non-zero
+when a metric is more than `--tolerance` worse than its baseline.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+from pathlib import Path
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from types import SimpleNamespace
+
+from homeassistant.core import Context
+
+from custom_components.simple_cover_service.coordinator import SCSCoordinator
+from custom_components.simple_cover_service.models import CoverConfig, EntryData, GlobalConfig
+from custom_components.simple_cover_service.util.planner import build_day_plan, geometry_of
+
+from .fake_hass import FakeEntry, FakeHistory, FakeStore, fake_hass
+
+BASELINE_PATH = Path(__file__).with_name("baselines.json")
+DEFAULT_SIZES = (10, 100, 1000, 10000)
+COVERS_PER_ROOM = 10
+START_TS = 1718964000.0  # 2024-06-21 10:00 UTC, sun up over most facades
+
+
+class FakeClock:
+    def __init__(self, start: float) -> None:
+        self.now = start
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def build(n_covers: int) -> tuple[SimpleNamespace, SCSCoordinator, FakeClock]:
+    hass = fake_hass()
+    clock = FakeClock(START_TS)
+    hass.states.async_set("sun.sun", "above_horizon")
+    hass.states.async_set("season.season", "summer")
+    hass.states.async_set("weather.home", "sunny")
+
+    covers: dict[str, CoverConfig] = {}
+    for i in range(n_covers):
+        room = f"sensor.room_{i // COVERS_PER_ROOM}"
+        cfg = CoverConfig(
+            cover_entity=f"cover.bench_{i}",
+            temp_sensor=room,
+            window_azimuth=float((i * 37) % 360),
+            invert_position=i % 4 == 0,
+        )
+        covers[cfg.cover_entity] = cfg
+        hass.states.async_set(room, "22")
+        hass.states.async_set(cfg.cover_entity, "open", {"current_position": 100})
+
+    entry = FakeEntry("bench")
+    # no gateway rate limit, so ticks measure SCS and not the throttle
+    ed = EntryData(global_cfg=GlobalConfig(weather_entity="weather.home", gateway_rate=0), covers=covers)
+    coord = SCSCoordinator(hass, entry, ed, clock=clock)
+    coord._store = FakeStore()
+    coord.history = FakeHistory()
+    # ticks look targets up in the day plan, as they do live
+    day_start = START_TS - START_TS % 86400
+    geometries = [geometry_of(c) for c in covers.values()]
+    coord._plan = build_day_plan(geometries, day_start, day_start + 86400, hass.config.latitude, hass.config.longitude)
+    hass.bus.track(list(covers), coord._handle_state_changed)
+    hass.bus.track(list(coord._temp_rows), coord._handle_dependency_changed)
+    return hass, coord, clock
+
+
+def _rooms(hass: SimpleNamespace, coord: SCSCoordinator, n_covers: int, temp: str) -> None:
+    for room in range((n_covers + COVERS_PER_ROOM - 1) // COVERS_PER_ROOM):
+        hass.bus.fire_state_changed(*hass.states.async_set(f"sensor.room_{room}", temp), None)
+    # the tick below evaluates every cover anyway
+    coord._recompute.async_cancel()
+
+
+def _percentile(sorted_values: list[float], pct: float) -> float:
+    idx = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[idx]
+
+
+async def bench_tick(n_covers: int, ticks: int) -> dict[str, float]:
+    hass, coord, clock = build(n_covers)
+
+    def prepare(i: int) -> None:
+        clock.now += 600
+        _rooms(hass, coord, n_covers, "30" if i % 2 else "20")
+
+    async def one_tick() -> float:
+        t0 = time.perf_counter()
+        await coord._async_update_data()
+        await coord._mover.async_drain()
+        return time.perf_counter() - t0
+
+    prepare(0)
+    await one_tick()  # warm-up
+    durations = []
+    for i in range(1, ticks + 1):
+        prepare(i)
+        durations.append(await one_tick())
+    durations.sort()
+
+    alloc_ticks = max(2, min(ticks, 10))
+    tracemalloc.start()
+    blocks = 0
+    peak = 0
+    for i in range(alloc_ticks):
+        prepare(i)
+        tracemalloc.reset_peak()
+        before = tracemalloc.take_snapshot()
+        await one_tick()
+        after = tracemalloc.take_snapshot()
+        blocks += sum(stat.count_diff for stat in after.compare_to(before, "filename") if stat.count_diff > 0)
+        peak = max(peak, tracemalloc.get_traced_memory()[1])
+    tracemalloc.stop()
+
+    ms = [d * 1000 for d in durations]
+    return {
+        "tick_p50_ms": round(_percentile(ms, 50), 3),
+        "tick_p95_ms": round(_percentile(ms, 95), 3),
+        "tick_p99_ms": round(_percentile(ms, 99), 3),
+        "tick_mean_ms": round(statistics.fmean(ms), 3),
+        "service_calls_per_tick": round(hass.services.calls / (ticks + 1 + alloc_ticks), 2),
+        "peak_alloc_kib": round(peak / 1024, 1),
+        "new_blocks_per_tick": round(blocks / alloc_ticks, 1),
+    }
+
+
+async def bench_listener(n_covers: int, n_events: int, event_rate: int) -> dict[str, float]:
+    hass, coord, clock = build(n_covers)
+    rng = random.Random(n_covers)
+    ours = Context()
+    coord._issued.add(ours.id, clock.now)
+
+    # 90% unrelated entities, 5% moves caused by SCS, 5% manual moves
+    stream = []
+    for i in range(n_events):
+        roll = rng.random()
+        if roll < 0.90:
+            stream.append((f"sensor.noise_{i % 5000}", str(i), None))
+        else:
+            cover = f"cover.bench_{rng.randrange(n_covers)}"
+            stream.append((cover, "open", ours if roll < 0.95 else None))
+
+    # build the State objects up front so only dispatch and the handler are timed
+    prepared = []
+    for i, (entity_id, state, ctx) in enumerate(stream):
+        attrs = {"current_position": i % 101} if entity_id.startswith("cover.") else None
+        prepared.append((*hass.states.async_set(entity_id, state, attrs, context=ctx), ctx))
+
+    bus = hass.bus
+    fire = bus.fire_state_changed
+    t0 = time.perf_counter()
+    for old, new, ctx in prepared:
+        fire(old, new, ctx)
+    elapsed = time.perf_counter() - t0
+
+    capacity = n_events / elapsed
+    return {
+        "listener_us_per_event": round(elapsed / n_events * 1e6, 3),
+        "listener_events_per_s": round(capacity),
+        "listener_headroom": round(capacity / event_rate, 2),
+        "listener_delivered_ratio": round(bus.delivered / bus.fired, 3),
+    }
+
+
+async def run(sizes: list[int], n_events: int, event_rate: int) -> dict[str, dict[str, float]]:
+    results: dict[str, dict[str, float]] = {}
+    for n in sizes:
+        ticks = max(20, min(200, 20000 // n))
+        result = await bench_tick(n, ticks)
+        result.update(await bench_listener(n, n_events, event_rate))
+        results[f"covers_{n}"] = result
+        print(f"covers={n}: {json.dumps(result)}", flush=True)
+    return results
+
+
+# lower is better for these; everything else is informational
+CHECKED = ("tick_p50_ms", "tick_p95_ms", "listener_us_per_event", "new_blocks_per_tick")
+
+
+def check(results: dict[str, dict[str, float]], baseline: dict[str, dict[str, float]], tolerance: float) -> list[str]:
+    regressions = []
+    for scenario, metrics in results.items():
+        base = baseline.get(scenario, {})
+        for key in CHECKED:
+            if key in base and base[key] > 0 and metrics[key] > base[key] * (1 + tolerance):
+                regressions.append(f"{scenario}.{key}: {metrics[key]} > {base[key]} (+{tolerance:.0%})")
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="SCS hot-path benchmarks")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("--events", type=int, default=200_000, help="state_changed events per listener run")
+    parser.add_argument("--event-rate", type=int, default=50_000, help="target state_changed events/s")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--tolerance", type=float, default=0.5, help="allowed slowdown before --check fails")
+    parser.add_argument("--check", action="store_true", help="compare with the stored baseline")
+    parser.add_argument("--update-baseline", action="store_true", help="store these results as the baseline")
+    args = parser.parse_args(argv)
+
+    results = asyncio.run(run(args.sizes, args.events, args.event_rate))
+
+    if args.update_baseline:
+        args.baseline.write_text(json.dumps(results, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+        print(f"baseline written to {args.baseline}")
+    if args.check:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        regressions = check(results, baseline, args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
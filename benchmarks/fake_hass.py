@@ -0,0 +1,163 @@
+"""In-process stand-in for the parts of Home Assistant SCS touches on its hot paths.
+
+Only `hass.states`, `hass.services`, `hass.bus`, `hass.config`, `hass.data`,
+`hass.loop` and `hass.async_create_background_task` are provided. State objects, events and contexts are the real
+Home Assistant classes, so the coordinator code under test runs unchanged.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+import os
+import tempfile
+from types import SimpleNamespace
+from typing import Any
+
+from homeassistant.core import Context, Event, State
+from homeassistant.helpers import entity_registry as er
+
+
+class FakeStates:
+    def __init__(self) -> None:
+        self._states: dict[str, State] = {}
+
+    def get(self, entity_id: str) -> State | None:
+        return self._states.get(entity_id)
+
+    def async_set(
+        self,
+        entity_id: str,
+        new_state: str,
+        attributes: dict[str, Any] | None = None,
+        context: Context | None = None,
+    ) -> tuple[State | None, State]:
+        old = self._states.get(entity_id)
+        new = State(entity_id, new_state, attributes or {}, context=context)
+        self._states[entity_id] = new
+        return old, new
+
+
+class FakeBus:
+    """Routes state_changed events by entity_id, like async_track_state_change_event."""
+
+    def __init__(self) -> None:
+        self._by_entity: dict[str, list[Callable[[Event], None]]] = {}
+        self.fired = 0
+        self.delivered = 0
+
+    def track(self, entity_ids: list[str], action: Callable[[Event], None]) -> Callable[[], None]:
+        for entity_id in entity_ids:
+            self._by_entity.setdefault(entity_id, []).append(action)
+
+        def _remove() -> None:
+            for entity_id in entity_ids:
+                self._by_entity[entity_id].remove(action)
+
+        return _remove
+
+    def fire_state_changed(self, old: State | None, new: State, context: Context | None = None) -> None:
+        self.fired += 1
+        listeners = self._by_entity.get(new.entity_id)
+        if not listeners:
+            return
+        event = Event(
+            "state_changed",
+            {"entity_id": new.entity_id, "old_state": old, "new_state": new},
+            context=context or new.context,
+        )
+        for action in listeners:
+            self.delivered += 1
+            action(event)
+
+
+class FakeServices:
+    """Records service calls; cover.set_cover_position moves covers instantly."""
+
+    def __init__(self, states: FakeStates, bus: FakeBus) -> None:
+        self._states = states
+        self._bus = bus
+        self.calls = 0
+        self.entities_moved = 0
+
+    async def async_call(
+        self,
+        domain: str,
+        service: str,
+        service_data: dict[str, Any] | None = None,
+        blocking: bool = False,
+        context: Context | None = None,
+        **kwargs: Any,
+    ) -> None:
+        self.calls += 1
+        if (domain, service) != ("cover", "set_cover_position") or not service_data:
+            return
+        entity_ids = service_data["entity_id"]
+        if isinstance(entity_ids, str):
+            entity_ids = [entity_ids]
+        for entity_id in entity_ids:
+            self.entities_moved += 1
+            old, new = self._states.async_set(
+                entity_id, "open", {"current_position": service_data["position"]}, context=context
+            )
+            self._bus.fire_state_changed(old, new, context)
+
+
+class FakeEntityRegistry:
+    """Nothing is registered, so every cover falls into the default gateway."""
+
+    def async_get(self, entity_id: str) -> None:
+        return None
+
+
+class FakeStore:
+    """Counts saves instead of writing runtime state to disk."""
+
+    def __init__(self) -> None:
+        self.saves = 0
+
+    async def async_load(self) -> None:
+        return None
+
+    def async_delay_save(self, data_func: Any, delay: float = 0) -> None:
+        self.saves += 1
+
+
+class FakeHistory:
+    """Counts move history records instead of buffering them for SQLite."""
+
+    def __init__(self) -> None:
+        self.records = 0
+
+    def async_record_move(self, *args: Any) -> None:
+        self.records += 1
+
+    def async_record_override(self, *args: Any) -> None:
+        self.records += 1
+
+
+class FakeEntry:
+    def __init__(self, entry_id: str) -> None:
+        self.entry_id = entry_id
+
+    def async_create_background_task(self, hass: Any, target: Any, name: str, eager_start: bool = False):
+        return asyncio.get_running_loop().create_task(target, name=name)
+
+
+def fake_hass(latitude: float = 41.39, longitude: float = 2.17) -> SimpleNamespace:
+    states = FakeStates()
+    bus = FakeBus()
+    loop = asyncio.get_running_loop()
+    return SimpleNamespace(
+        states=states,
+        bus=bus,
+        services=FakeServices(states, bus),
+        config=SimpleNamespace(
+            latitude=latitude,
+            longitude=longitude,
+            path=lambda *parts: os.path.join(tempfile.gettempdir(), *parts),
+        ),
+        data={er.DATA_REGISTRY: FakeEntityRegistry()},
+        loop=loop,
+        async_create_background_task=lambda target, name, eager_start=False: loop.create_task(target, name=name),
+    )
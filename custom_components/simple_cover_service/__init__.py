@@ -3,102 +3,97 @@ from __future__ import annotations
 import logging
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 
 from .const import (
+    CONF_COVER_ENTITY,
     CONF_COVERS,
     CONF_GLOBAL,
     DOMAIN,
     PLATFORMS,
-    SIGNAL_AUTOMATION_STATE_CHANGED,
+    SIGNAL_COVERS_CHANGED,
 )
-from .coordinator import SCSCoordinator
+from .coordinator import SCSCoordinator, runtime_store
+from .history import history_path
 from .models import CoverConfig, EntryData, GlobalConfig
+from .scheduler import async_get_scheduler
+from .services import async_setup_services
+from .util.history import MoveHistory
 
 _LOGGER = logging.getLogger(__name__)
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 
-async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
-    options = entry.options or {}
 
-    global_raw = options.get(CONF_GLOBAL, {})
-    covers_raw = options.get(CONF_COVERS, [])
-
-    global_cfg = GlobalConfig(
-        weather_entity=global_raw.get("weather_entity"),
-        sunrise_offset=int(global_raw.get("sunrise_offset", 0)),
-        sunset_offset=int(global_raw.get("sunset_offset", 0)),
-    )
-
-    covers: dict[str, CoverConfig] = {}
-    for c in covers_raw:
-        cc = CoverConfig(
-            cover_entity=c["cover_entity"],
-            temp_sensor=c["temp_sensor"],
-            window_azimuth=float(c["window_azimuth"]),
-            fov_half=float(c.get("fov_half", 70)),
-            default_day=int(c.get("default_position_day", 60)),
-            min_day=int(c.get("min_position_day", 20)),
-            max_day=int(c.get("max_position_day", 100)),
-            default_night=int(c.get("default_position_night", 0)),
-            t_min=float(c.get("t_min", 20)),
-            t_max=float(c.get("t_max", 24)),
-            min_delta_position=int(c.get("min_delta_position", 10)),
-            min_delta_time=int(c.get("min_delta_time", 300)),
-            invert_position=bool(c.get("invert_position", False)),
-            debug=bool(c.get("debug", False)),
-        )
-        covers[cc.cover_entity] = cc
-
-    ed = EntryData(global_cfg=global_cfg, covers=covers)
-
-    coord = SCSCoordinator(hass, entry, ed)
-    await coord.async_config_entry_first_refresh()
+async def async_setup(hass: HomeAssistant, config: dict) -> bool:
+    async_setup_services(hass)
+    return True
 
-    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coord
 
-    @callback
-    def _handle_state_changed(event: Event) -> None:
-        entity_id: str | None = event.data.get("entity_id")
-        if not entity_id or entity_id not in coord.entry_data.covers:
-            return
+def _covers_from_options(options: dict) -> dict[str, CoverConfig]:
+    return CoverConfig.all_from_options(options.get(CONF_COVERS, {}))
 
-        new_state = event.data.get("new_state")
-        old_state = event.data.get("old_state")
-        if new_state is None or old_state is None:
-            return
 
-        new_pos = new_state.attributes.get("current_position")
-        old_pos = old_state.attributes.get("current_position")
-        if new_pos is None or old_pos is None or new_pos == old_pos:
-            return
+async def async_migrate_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    """Version 2 stores covers as a mapping keyed by cover entity instead of a list."""
+    if entry.version == 1:
+        options = dict(entry.options)
+        options[CONF_COVERS] = {c[CONF_COVER_ENTITY]: c for c in options.get(CONF_COVERS, [])}
+        hass.config_entries.async_update_entry(entry, options=options, version=2)
+        _LOGGER.debug("SCS: migrated entry %s to version 2", entry.entry_id)
+    return True
 
-        runtime = coord.entry_data.get_runtime(entity_id)
-        last_ctx = runtime.last_context_id
-        evt_ctx = event.context.id if event.context else None
 
-        if last_ctx and evt_ctx == last_ctx:
-            return
+async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    options = entry.options or {}
 
-        runtime.automation_enabled = False
-        async_dispatcher_send(
-            hass, SIGNAL_AUTOMATION_STATE_CHANGED, entry.entry_id, entity_id, False
-        )
-        _LOGGER.info("SCS: Manual override detected on %s -> automation OFF", entity_id)
+    global_cfg = GlobalConfig.from_options(options.get(CONF_GLOBAL, {}))
+    ed = EntryData(global_cfg=global_cfg, covers=_covers_from_options(options))
 
-    coord.state_listener_remove = hass.bus.async_listen("state_changed", _handle_state_changed)
+    scheduler = async_get_scheduler(hass)
+    coord = SCSCoordinator(hass, entry, ed, mover=scheduler.movement)
+    await coord.async_restore()
+    coord.async_start_tracking()
+    coord.history.async_start()
+    scheduler.async_register(coord)
+
+    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coord
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
+    # off the setup path: runs once HA has started, spread over the startup window
+    coord.async_start_refresh()
     return True
 
 
+async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Apply cover additions, removals and edits in place; reload only on global changes."""
+    coord: SCSCoordinator = hass.data[DOMAIN][entry.entry_id]
+    options = entry.options or {}
+
+    if GlobalConfig.from_options(options.get(CONF_GLOBAL, {})) != coord.entry_data.global_cfg:
+        await hass.config_entries.async_reload(entry.entry_id)
+        return
+
+    added, removed = coord.async_update_covers(_covers_from_options(options))
+    if added or removed:
+        async_dispatcher_send(hass, SIGNAL_COVERS_CHANGED, entry.entry_id, added, removed)
+    _LOGGER.debug("SCS: options updated in place (+%s, -%s)", added, removed)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     coord: SCSCoordinator = hass.data[DOMAIN][entry.entry_id]
-    if coord.state_listener_remove:
-        coord.state_listener_remove()
-        coord.state_listener_remove = None
+    async_get_scheduler(hass).async_unregister(coord)
+    coord.async_stop_tracking()
+    await coord.history.async_stop()
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
         hass.data[DOMAIN].pop(entry.entry_id, None)
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    await runtime_store(hass, entry.entry_id).async_remove()
+    await hass.async_add_executor_job(MoveHistory(history_path(hass, entry.entry_id)).remove)
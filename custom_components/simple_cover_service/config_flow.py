@@ -1,41 +1,66 @@
 from __future__ import annotations
 
-import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import selector
+import voluptuous as vol
+from voluptuous.humanize import humanize_error
 
 from .const import (
-    CONF_COVERS,
     CONF_COVER_ENTITY,
+    CONF_COVERS,
     CONF_DEBUG,
     CONF_DEFAULT_DAY,
     CONF_DEFAULT_NIGHT,
+    CONF_EXTRA_TEMP_SENSORS,
+    CONF_FORECAST_LOOKAHEAD,
     CONF_FOV_HALF,
+    CONF_GATEWAY_CONCURRENCY,
+    CONF_GATEWAY_RATE,
     CONF_GLOBAL,
     CONF_INVERT,
     CONF_MAX_DAY,
+    CONF_MAX_PARALLEL_CALLS,
     CONF_MIN_DAY,
     CONF_MIN_DELTA_POS,
     CONF_MIN_DELTA_TIME,
+    CONF_MOVE_TIMEOUT,
+    CONF_REPLACE_ALL,
+    CONF_STARTUP_WINDOW,
     CONF_SUNRISE_OFFSET,
     CONF_SUNSET_OFFSET,
     CONF_T_MAX,
     CONF_T_MIN,
+    CONF_TEMP_HYSTERESIS,
     CONF_TEMP_SENSOR,
+    CONF_TEMP_SMOOTHING,
+    CONF_TEMP_WINDOW,
+    CONF_TRANSITION_WINDOW,
     CONF_WEATHER_ENTITY,
     CONF_WINDOW_AZIMUTH,
     DEF_DEFAULT_DAY,
     DEF_DEFAULT_NIGHT,
+    DEF_FORECAST_LOOKAHEAD,
     DEF_FOV_HALF,
+    DEF_GATEWAY_CONCURRENCY,
+    DEF_GATEWAY_RATE,
     DEF_MAX_DAY,
+    DEF_MAX_PARALLEL_CALLS,
     DEF_MIN_DAY,
     DEF_MIN_DELTA_POS,
     DEF_MIN_DELTA_TIME,
+    DEF_MOVE_TIMEOUT,
+    DEF_STARTUP_WINDOW,
     DEF_T_MAX,
     DEF_T_MIN,
+    DEF_TEMP_HYSTERESIS,
+    DEF_TEMP_SMOOTHING,
+    DEF_TEMP_WINDOW,
+    DEF_TRANSITION_WINDOW,
     DOMAIN,
+    TEMP_SMOOTHING_MODES,
 )
+from .util.bulk import dump_covers, parse_covers
 
 
 def _global_schema(hass: HomeAssistant):
@@ -50,6 +75,27 @@ def _global_schema(hass: HomeAssistant):
             vol.Optional(CONF_SUNSET_OFFSET, default=0): selector.NumberSelector(
                 selector.NumberSelectorConfig(min=-120, max=120, step=1, unit_of_measurement="min", mode="box")
             ),
+            vol.Optional(CONF_MAX_PARALLEL_CALLS, default=DEF_MAX_PARALLEL_CALLS): selector.NumberSelector(
+                selector.NumberSelectorConfig(min=1, max=32, step=1, mode="box")
+            ),
+            vol.Optional(CONF_GATEWAY_CONCURRENCY, default=DEF_GATEWAY_CONCURRENCY): selector.NumberSelector(
+                selector.NumberSelectorConfig(min=1, max=16, step=1, mode="box")
+            ),
+            vol.Optional(CONF_GATEWAY_RATE, default=DEF_GATEWAY_RATE): selector.NumberSelector(
+                selector.NumberSelectorConfig(min=0, max=20, step=0.5, mode="box", unit_of_measurement="1/s")
+            ),
+            vol.Optional(CONF_MOVE_TIMEOUT, default=DEF_MOVE_TIMEOUT): selector.NumberSelector(
+                selector.NumberSelectorConfig(min=10, max=600, step=5, mode="box", unit_of_measurement="s")
+            ),
+            vol.Optional(CONF_STARTUP_WINDOW, default=DEF_STARTUP_WINDOW): selector.NumberSelector(
+                selector.NumberSelectorConfig(min=0, max=900, step=5, mode="box", unit_of_measurement="s")
+            ),
+            vol.Optional(CONF_FORECAST_LOOKAHEAD, default=DEF_FORECAST_LOOKAHEAD): selector.NumberSelector(
+                selector.NumberSelectorConfig(min=0, max=360, step=15, mode="box", unit_of_measurement="min")
+            ),
+            vol.Optional(CONF_TRANSITION_WINDOW, default=DEF_TRANSITION_WINDOW): selector.NumberSelector(
+                selector.NumberSelectorConfig(min=0, max=1800, step=5, mode="box", unit_of_measurement="s")
+            ),
         }
     )
 
@@ -63,6 +109,9 @@ def _cover_schema(hass: HomeAssistant):
             vol.Required(CONF_TEMP_SENSOR): selector.EntitySelector(
                 selector.EntitySelectorConfig(domain=["sensor"])
             ),
+            vol.Optional(CONF_EXTRA_TEMP_SENSORS, default=[]): selector.EntitySelector(
+                selector.EntitySelectorConfig(domain=["sensor"], multiple=True)
+            ),
             vol.Required(CONF_WINDOW_AZIMUTH): selector.NumberSelector(
                 selector.NumberSelectorConfig(min=0, max=359, step=1, mode="box", unit_of_measurement="°")
             ),
@@ -87,6 +136,15 @@ def _cover_schema(hass: HomeAssistant):
             vol.Optional(CONF_T_MAX, default=DEF_T_MAX): selector.NumberSelector(
                 selector.NumberSelectorConfig(min=5, max=40, step=0.5, mode="box", unit_of_measurement="°C")
             ),
+            vol.Optional(CONF_TEMP_SMOOTHING, default=DEF_TEMP_SMOOTHING): selector.SelectSelector(
+                selector.SelectSelectorConfig(options=TEMP_SMOOTHING_MODES, translation_key=CONF_TEMP_SMOOTHING)
+            ),
+            vol.Optional(CONF_TEMP_WINDOW, default=DEF_TEMP_WINDOW): selector.NumberSelector(
+                selector.NumberSelectorConfig(min=1, max=60, step=1, mode="box")
+            ),
+            vol.Optional(CONF_TEMP_HYSTERESIS, default=DEF_TEMP_HYSTERESIS): selector.NumberSelector(
+                selector.NumberSelectorConfig(min=0, max=5, step=0.1, mode="box", unit_of_measurement="°C")
+            ),
             vol.Optional(CONF_MIN_DELTA_POS, default=DEF_MIN_DELTA_POS): selector.NumberSelector(
                 selector.NumberSelectorConfig(min=1, max=50, step=1, mode="box", unit_of_measurement="%")
             ),
@@ -99,8 +157,26 @@ def _cover_schema(hass: HomeAssistant):
     )
 
 
+def _validate_covers(hass: HomeAssistant, text: str) -> dict[str, dict]:
+    """Covers of an import, each validated like the add-cover form; ValueError names the first bad one."""
+    schema = _cover_schema(hass)
+    covers: dict[str, dict] = {}
+    for i, raw in enumerate(parse_covers(text), start=1):
+        name = raw.get(CONF_COVER_ENTITY) or f"#{i}"
+        try:
+            cover = schema(raw)
+        except vol.Invalid as err:
+            raise ValueError(f"{name}: {humanize_error(raw, err)}") from err
+        if cover[CONF_COVER_ENTITY] in covers:
+            raise ValueError(f"{name}: listed more than once")
+        covers[cover[CONF_COVER_ENTITY]] = cover
+    if not covers:
+        raise ValueError("no covers found")
+    return covers
+
+
 class SCSConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
-    VERSION = 1
+    VERSION = 2
 
     async def async_step_user(self, user_input=None):
         if user_input is None:
@@ -110,8 +186,15 @@ class SCSConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 CONF_WEATHER_ENTITY: user_input.get(CONF_WEATHER_ENTITY),
                 CONF_SUNRISE_OFFSET: user_input.get(CONF_SUNRISE_OFFSET, 0),
                 CONF_SUNSET_OFFSET: user_input.get(CONF_SUNSET_OFFSET, 0),
+                CONF_MAX_PARALLEL_CALLS: user_input.get(CONF_MAX_PARALLEL_CALLS, DEF_MAX_PARALLEL_CALLS),
+                CONF_GATEWAY_CONCURRENCY: user_input.get(CONF_GATEWAY_CONCURRENCY, DEF_GATEWAY_CONCURRENCY),
+                CONF_GATEWAY_RATE: user_input.get(CONF_GATEWAY_RATE, DEF_GATEWAY_RATE),
+                CONF_MOVE_TIMEOUT: user_input.get(CONF_MOVE_TIMEOUT, DEF_MOVE_TIMEOUT),
+                CONF_STARTUP_WINDOW: user_input.get(CONF_STARTUP_WINDOW, DEF_STARTUP_WINDOW),
+                CONF_FORECAST_LOOKAHEAD: user_input.get(CONF_FORECAST_LOOKAHEAD, DEF_FORECAST_LOOKAHEAD),
+                CONF_TRANSITION_WINDOW: user_input.get(CONF_TRANSITION_WINDOW, DEF_TRANSITION_WINDOW),
             },
-            CONF_COVERS: [],
+            CONF_COVERS: {},
         }
         return self.async_create_entry(title="Simple Cover Service (SCS)", data={}, options=options)
 
@@ -134,6 +217,8 @@ class SCSOptionsFlowHandler(config_entries.OptionsFlow):
             menu_options=[
                 "add_cover",
                 "remove_cover",
+                "import_covers",
+                "export_covers",
                 "edit_global",
             ],
         )
@@ -141,21 +226,22 @@ class SCSOptionsFlowHandler(config_entries.OptionsFlow):
     async def async_step_add_cover(self, user_input=None):
         if user_input is None:
             return self.async_show_form(step_id="add_cover", data_schema=_cover_schema(self.hass))
-        covers = list(self.config_entry.options.get(CONF_COVERS, []))
-        covers.append(user_input)
+        # an entity that is already configured is replaced
+        covers = dict(self.config_entry.options.get(CONF_COVERS, {}))
+        covers[user_input[CONF_COVER_ENTITY]] = user_input
         new_options = dict(self.config_entry.options)
         new_options[CONF_COVERS] = covers
         return self.async_create_entry(title="", data=new_options)
 
     async def async_step_remove_cover(self, user_input=None):
-        covers = list(self.config_entry.options.get(CONF_COVERS, []))
+        covers = dict(self.config_entry.options.get(CONF_COVERS, {}))
         if not covers:
             return self.async_create_entry(title="", data=self.config_entry.options)
         schema = vol.Schema(
             {
                 vol.Required(CONF_COVER_ENTITY): selector.SelectSelector(
                     selector.SelectSelectorConfig(
-                        options=[c[CONF_COVER_ENTITY] for c in covers],
+                        options=sorted(covers),
                         mode=selector.SelectSelectorMode.DROPDOWN,
                     )
                 )
@@ -163,12 +249,56 @@ class SCSOptionsFlowHandler(config_entries.OptionsFlow):
         )
         if user_input is None:
             return self.async_show_form(step_id="remove_cover", data_schema=schema)
-        rem = user_input[CONF_COVER_ENTITY]
-        covers = [c for c in covers if c[CONF_COVER_ENTITY] != rem]
+        covers.pop(user_input[CONF_COVER_ENTITY], None)
         new_options = dict(self.config_entry.options)
         new_options[CONF_COVERS] = covers
         return self.async_create_entry(title="", data=new_options)
 
+    async def async_step_import_covers(self, user_input=None):
+        """Add (or replace) many covers from JSON, YAML or CSV in one options update."""
+        errors: dict[str, str] = {}
+        placeholders = {"error": ""}
+        if user_input is not None:
+            try:
+                imported = _validate_covers(self.hass, user_input.get(CONF_COVERS, ""))
+            except ValueError as err:
+                errors["base"] = "invalid_covers"
+                placeholders["error"] = str(err)
+            else:
+                covers = dict(self.config_entry.options.get(CONF_COVERS, {}))
+                if user_input.get(CONF_REPLACE_ALL):
+                    covers.clear()
+                covers.update(imported)
+                new_options = dict(self.config_entry.options)
+                new_options[CONF_COVERS] = covers
+                return self.async_create_entry(title="", data=new_options)
+
+        schema = vol.Schema(
+            {
+                vol.Required(
+                    CONF_COVERS, default=(user_input or {}).get(CONF_COVERS, "")
+                ): selector.TextSelector(selector.TextSelectorConfig(multiline=True)),
+                vol.Optional(CONF_REPLACE_ALL, default=False): selector.BooleanSelector(),
+            }
+        )
+        return self.async_show_form(
+            step_id="import_covers", data_schema=schema, errors=errors, description_placeholders=placeholders
+        )
+
+    async def async_step_export_covers(self, user_input=None):
+        """Show every cover as YAML that import_covers accepts back; saving changes nothing."""
+        if user_input is not None:
+            return self.async_create_entry(title="", data=self.config_entry.options)
+        text = dump_covers(self.config_entry.options.get(CONF_COVERS, {}))
+        schema = vol.Schema(
+            {
+                vol.Optional(CONF_COVERS, default=text): selector.TextSelector(
+                    selector.TextSelectorConfig(multiline=True)
+                ),
+            }
+        )
+        return self.async_show_form(step_id="export_covers", data_schema=schema)
+
     async def async_step_edit_global(self, user_input=None):
         if user_input is None:
             schema = _global_schema(self.hass)
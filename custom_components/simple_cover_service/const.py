@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+from datetime import timedelta
+
 DOMAIN = "simple_cover_service"
-PLATFORMS = ["switch"]
+PLATFORMS = ["sensor", "switch"]
 
 CONF_GLOBAL = "global"
 CONF_COVERS = "covers"
@@ -10,6 +12,13 @@ CONF_COVERS = "covers"
 CONF_WEATHER_ENTITY = "weather_entity"
 CONF_SUNRISE_OFFSET = "sunrise_offset"
 CONF_SUNSET_OFFSET = "sunset_offset"
+CONF_MAX_PARALLEL_CALLS = "max_parallel_calls"
+CONF_GATEWAY_CONCURRENCY = "gateway_concurrency"
+CONF_GATEWAY_RATE = "gateway_rate"
+CONF_MOVE_TIMEOUT = "move_timeout"
+CONF_STARTUP_WINDOW = "startup_window"
+CONF_FORECAST_LOOKAHEAD = "forecast_lookahead"
+CONF_TRANSITION_WINDOW = "transition_window"
 
 # Per-cover keys
 CONF_COVER_ENTITY = "cover_entity"
@@ -26,6 +35,13 @@ CONF_MIN_DELTA_POS = "min_delta_position"
 CONF_MIN_DELTA_TIME = "min_delta_time"
 CONF_INVERT = "invert_position"
 CONF_DEBUG = "debug"
+CONF_EXTRA_TEMP_SENSORS = "extra_temp_sensors"
+CONF_TEMP_SMOOTHING = "temp_smoothing"
+CONF_TEMP_WINDOW = "temp_window"
+CONF_TEMP_HYSTERESIS = "temp_hysteresis"
+
+# Bulk import
+CONF_REPLACE_ALL = "replace_all"
 
 # Defaults (confirmed by you)
 DEF_T_MIN = 20.0
@@ -36,14 +52,81 @@ DEF_MAX_DAY = 100
 DEF_DEFAULT_NIGHT = 0
 DEF_SUNRISE_OFFSET = 0
 DEF_SUNSET_OFFSET = 0
+DEF_MAX_PARALLEL_CALLS = 4
+DEF_GATEWAY_CONCURRENCY = 2
+DEF_GATEWAY_RATE = 2.0
+DEF_MOVE_TIMEOUT = 120
+DEF_STARTUP_WINDOW = 60
+DEF_FORECAST_LOOKAHEAD = 0  # minutes, 0 = forecast not used
+DEF_TRANSITION_WINDOW = 0  # seconds, 0 = all covers at once
 DEF_FOV_HALF = 70
 DEF_MIN_DELTA_POS = 10
 DEF_MIN_DELTA_TIME = 300
 DEF_INVERT = False
 DEF_DEBUG = False
+DEF_TEMP_SMOOTHING = "none"
+DEF_TEMP_WINDOW = 5
+DEF_TEMP_HYSTERESIS = 0.0
+
+# Indoor temperature smoothing modes
+TEMP_SMOOTHING_MODES = ["none", "ewma", "median"]
+
+# Shared entities every cover depends on
+SUN_ENTITY = "sun.sun"
+SEASON_ENTITY = "season.season"
+
+# Event-driven recomputation: dependency changes are coalesced for this many
+# seconds, and a slow full poll (shared by all entries) remains as a safety net.
+RECOMPUTE_COOLDOWN = 1.0
+SAFETY_POLL_INTERVAL = timedelta(minutes=15)
+
+# Runtime state is persisted per entry, written at most every STORAGE_SAVE_DELAY s
+STORAGE_VERSION = 1
+STORAGE_SAVE_DELAY = 10
+
+# Whole-year sun exposure tables, shared by all entries (in .storage)
+EXPOSURE_CACHE_DIR = f"{DOMAIN}_exposure"
+
+# After a restart, and at sunrise/sunset, covers are evaluated in batches this
+# many seconds apart, spread over the startup (resp. transition) window
+STAGGER_STEP = 5
+
+# hass.data[DOMAIN] key of the scheduler shared by all entries
+DATA_SCHEDULER = "scheduler"
+# A resolved shared environment is reused for this many seconds
+SNAPSHOT_TTL = 1.0
+
+# Contexts SCS issued are remembered this long (seconds) so that every state
+# update caused by one of our own commands is recognised as such.
+CONTEXT_TTL = 600
+
+# A moving cover counts as arrived within this many % of its target
+MOTION_TOLERANCE = 2
+# With a learned travel speed, a move is expected done this many seconds after
+# its predicted arrival; the cover is re-checked then
+TRAVEL_GRACE = 5
 
 # Weather states treated as direct sun
 DIRECT_SUN_STATES = {"sunny", "partlycloudy"}
 
+# Hourly forecasts are fetched at most once per FORECAST_TTL seconds per
+# weather entity, and again whenever its state changes
+FORECAST_TTL = 3600.0
+
+# Metric sensors publish at most this often
+METRICS_PUBLISH_INTERVAL = timedelta(seconds=60)
+
+# Move history: buffered records are written every HISTORY_FLUSH_INTERVAL or
+# once HISTORY_BATCH are waiting; older rows are pruned once a day
+HISTORY_BATCH = 500
+HISTORY_FLUSH_INTERVAL = timedelta(minutes=1)
+HISTORY_MAINTENANCE_INTERVAL = timedelta(days=1)
+HISTORY_RETENTION = timedelta(days=90)
+
+# Services
+SERVICE_GET_PLAN = "get_plan"
+SERVICE_GET_HISTORY = "get_history"
+
 # Dispatcher signals
 SIGNAL_AUTOMATION_STATE_CHANGED = "scs_automation_state_changed"
+SIGNAL_COVERS_CHANGED = "scs_covers_changed"
@@ -1,155 +1,828 @@
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Callable, Iterable
+from dataclasses import asdict, replace
+from datetime import datetime, timedelta
 import logging
 import time
-from datetime import timedelta
+from typing import TYPE_CHECKING, Any, Protocol
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import Context, HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, Context, Event, HomeAssistant, State, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_track_point_in_utc_time, async_track_state_change_event
+from homeassistant.helpers.start import async_at_started
+from homeassistant.helpers.storage import STORAGE_DIR, Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.util import dt as dt_util
 
-from .const import DIRECT_SUN_STATES, DOMAIN
-from .models import CoverConfig, EntryData
-from .util.sun_math import angular_diff_deg
+from .const import (
+    CONTEXT_TTL,
+    DOMAIN,
+    EXPOSURE_CACHE_DIR,
+    MOTION_TOLERANCE,
+    RECOMPUTE_COOLDOWN,
+    SIGNAL_AUTOMATION_STATE_CHANGED,
+    STAGGER_STEP,
+    STORAGE_SAVE_DELAY,
+    STORAGE_VERSION,
+    TRAVEL_GRACE,
+)
+from .history import HistoryRecorder
+from .models import CoverConfig, EntryData, EnvSnapshot, IssuedContexts, RuntimeCoverState
+from .movement import MovementScheduler, PendingMove
+from .util.facades import FacadeIndex, Geometry
+from .util.filters import TemperatureInput
+from .util.kernel import (
+    SKIP_AUTOMATION_OFF,
+    SKIP_DELTA_TIME,
+    SKIP_IN_MOTION,
+    SKIP_NO_POSITION,
+    CoverTable,
+    build_snapshot,
+    hot_ahead,
+    parse_position,
+    parse_temperature,
+    send_position,
+    skip_reason,
+)
+from .util.metrics import SCSMetrics
+from .util.planner import (
+    ELSEWHERE,
+    FRONT,
+    NIGHT,
+    DayPlan,
+    Regime,
+    cover_timeline,
+    geometry_of,
+    load_day_plan,
+    regime_of,
+    regime_targets,
+    shift_daylight,
+)
+from .util.trace import DecisionTrace, TraceRecord
+from .util.travel import TravelModel
+
+if TYPE_CHECKING:
+    from .scheduler import SCSScheduler
 
 _LOGGER = logging.getLogger(__name__)
 
+_MOVING_STATES = ("opening", "closing")
+
+
+class StateSource(Protocol):
+    def get(self, entity_id: str) -> State | None: ...
+
+
+def runtime_store(hass: HomeAssistant, entry_id: str) -> Store[dict]:
+    """Storage of the persisted runtime state of one entry."""
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}")
+
 
 class SCSCoordinator(DataUpdateCoordinator[None]):
-    """Drives the SCS logic periodically and on-demand."""
+    """Drives the SCS logic of one entry on dependency changes.
 
-    def __init__(self, hass: HomeAssistant, entry: ConfigEntry, entry_data: EntryData) -> None:
+    The safety poll and the shared sun/season/weather inputs are handled by
+    the domain-wide SCSScheduler, which calls async_evaluate().
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        entry_data: EntryData,
+        *,
+        clock: Callable[[], float] = time.time,
+        states: StateSource | None = None,
+        mover: MovementScheduler | None = None,
+    ) -> None:
         super().__init__(
             hass,
             _LOGGER,
             name=f"{DOMAIN}-{entry.entry_id}",
-            update_interval=timedelta(minutes=1),
+            update_interval=None,
         )
         self.entry = entry
         self.entry_data = entry_data
-        self.state_listener_remove = None  # set in __init__.py
+        self.scheduler: SCSScheduler | None = None  # set by SCSScheduler.async_register
+        # injectable for replays and benchmarks
+        self._clock = clock
+        self._states: StateSource = states if states is not None else hass.states
+        self._table = CoverTable(())
+        self._runtimes: list[RuntimeCoverState] = []
+        self._temps: list[TemperatureInput] = []
+        self._temp_rows: dict[str, list[int]] = {}
+        self._geometries: list[Geometry] = []
+        self._facades = FacadeIndex(())
+        # decision traces, only for covers with debug enabled
+        self._traces: list[DecisionTrace | None] = []
+        # per row: resolved targets for each regime seen (a handful per cover)
+        self._regimes: list[dict[Regime, tuple[tuple[int, str], ...]]] = []
+        # learned travel speed and last commanded move, per row
+        self._travel: list[TravelModel] = []
+        self._build_rows()
+
+        gc = entry_data.global_cfg
+        # shared by all entries (SCSScheduler.movement) so gateway limits hold domain-wide
+        self._mover = mover if mover is not None else MovementScheduler(hass)
+        self._mover.async_configure(
+            entry.entry_id,
+            concurrency=gc.gateway_concurrency,
+            rate=gc.gateway_rate,
+            max_parallel=gc.max_parallel_calls,
+        )
+
+        self._store = runtime_store(hass, entry.entry_id)
+        self.metrics = SCSMetrics()
+        self.history = HistoryRecorder(hass, entry)
+        # cover -> rule of its queued move, for the history
+        self._move_rules: dict[str, str] = {}
+
+        # every context we issued recently, for manual override detection
+        self._issued = IssuedContexts(CONTEXT_TTL)
+        self._cover_track_remove: CALLBACK_TYPE | None = None
+
+        self._pending: set[str] = set()
+        self._track_remove: CALLBACK_TYPE | None = None
+        self._recompute = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=RECOMPUTE_COOLDOWN,
+            immediate=False,
+            function=self._async_evaluate_pending,
+        )
+        # False until the startup refresh has run; evaluations asked for before
+        # that only mark covers pending
+        self._started = False
+        # covers held back by min_delta_time -> timestamp they may move again
+        self._deferred: dict[str, float] = {}
+        self._recheck_at: float | None = None
+        self._recheck_remove: CALLBACK_TYPE | None = None
+        # today's sun geometry, and its FOV entry/exit instants, earliest first
+        self._plan: DayPlan | None = None
+        self._edges: list[tuple[float, list[str] | None]] = []
+        self._edge_remove: CALLBACK_TYPE | None = None
+        self._day_end: datetime | None = None
+        self._plan_task: asyncio.Task | None = None
+
+    def _build_rows(self) -> None:
+        """(Re)build the per-row views of entry_data.covers, keeping filters of unchanged covers."""
+        kept = {cfg: temp for cfg, temp in zip(self._table.configs, self._temps)}
+        traces = {cfg.cover_entity: trace for cfg, trace in zip(self._table.configs, self._traces)}
+        travel = {cfg.cover_entity: model for cfg, model in zip(self._table.configs, self._travel)}
+        self._table = CoverTable(self.entry_data.covers.values())
+        # runtime handles and filtered indoor temperatures in table row order
+        self._runtimes = [self.entry_data.get_runtime(cfg.cover_entity) for cfg in self._table.configs]
+        self._temps = [kept.get(cfg) or TemperatureInput(cfg) for cfg in self._table.configs]
+        self._geometries = [geometry_of(cfg) for cfg in self._table.configs]
+        self._facades = FacadeIndex(self._table.configs)
+        self._traces = [
+            (traces.get(cfg.cover_entity) or DecisionTrace()) if cfg.debug else None for cfg in self._table.configs
+        ]
+        self._regimes = [{} for _ in self._table.configs]
+        self._travel = [travel.get(cfg.cover_entity) or TravelModel() for cfg in self._table.configs]
+        # temperature sensor -> table rows it feeds
+        self._temp_rows = {}
+        fresh: set[str] = set()
+        for row, cfg in enumerate(self._table.configs):
+            for sensor in cfg.temp_sensors:
+                self._temp_rows.setdefault(sensor, []).append(row)
+                if cfg not in kept:
+                    fresh.add(sensor)
+        for sensor in fresh:
+            self._feed_temperature(sensor, self._states.get(sensor))
+
+    @callback
+    def _feed_temperature(self, sensor: str, state: State | None) -> set[str]:
+        """Push a sensor reading into its covers' filters; return covers whose hot/cold state changed."""
+        reading = parse_temperature(state)
+        changed: set[str] = set()
+        for row in self._temp_rows.get(sensor, ()):
+            if self._temps[row].update(sensor, reading):
+                changed.add(self._table.configs[row].cover_entity)
+        return changed
+
+    async def async_restore(self) -> None:
+        """Load the runtime state persisted before the last restart."""
+        data = await self._store.async_load()
+        if not data:
+            return
+        for cover_entity, stored in data.get("covers", {}).items():
+            if cover_entity in self.entry_data.covers:
+                self.entry_data.get_runtime(cover_entity).restore(stored)
+        for cover_entity, stored in data.get("travel", {}).items():
+            if (row := self._table.row.get(cover_entity)) is not None:
+                self._travel[row].restore(stored)
+
+    @callback
+    def async_schedule_save(self) -> None:
+        """Persist runtime state; writes within STORAGE_SAVE_DELAY are batched."""
+        self._store.async_delay_save(self._data_to_save, STORAGE_SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict:
+        return {
+            "covers": {c: rt.as_dict() for c, rt in self.entry_data.runtime.items()},
+            "travel": {
+                cfg.cover_entity: model.as_dict()
+                for cfg, model in zip(self._table.configs, self._travel)
+                if model.samples
+            },
+        }
+
+    @property
+    def clock(self) -> Callable[[], float]:
+        """This entry's time source (UNIX seconds), injected by replays and benchmarks."""
+        return self._clock
+
+    @property
+    def transitions_armed(self) -> bool:
+        """Sunrise/sunset (with offsets) are scheduled from today's plan."""
+        return self._plan is not None
+
+    @callback
+    def async_start_refresh(self) -> None:
+        """Run the first evaluation once Home Assistant has started."""
+        self.entry.async_on_unload(async_at_started(self.hass, self._async_begin_refresh))
+
+    @callback
+    def _async_begin_refresh(self, _hass: HomeAssistant) -> None:
+        self.entry.async_create_background_task(self.hass, self._async_startup_refresh(), f"{DOMAIN} startup refresh")
+
+    async def _async_startup_refresh(self) -> None:
+        """Evaluate every cover over the startup window, then what changed meanwhile.
+
+        During boot, sensors, season and weather turn available one by one;
+        until this has run those changes only mark covers pending, so they
+        never evaluate every cover at once.
+        """
+        self._pending.clear()
+        await self._async_staggered_refresh()
+        self._started = True
+        if self._pending:
+            self._recompute.async_schedule_call()
+
+    async def _async_staggered_refresh(self, window: int | None = None) -> None:
+        """Evaluate every cover once, in batches spread over `window` seconds (default: the startup window)."""
+        covers = list(self.entry_data.covers)
+        if not covers:
+            return
+        if window is None:
+            window = self.entry_data.global_cfg.startup_window
+        batches = max(1, min(len(covers), window // STAGGER_STEP))
+        size = -(-len(covers) // batches)
+        for start in range(0, len(covers), size):
+            if start:
+                await asyncio.sleep(STAGGER_STEP)
+            await self._async_evaluate(covers[start : start + size])
+
+    @callback
+    def async_start_tracking(self) -> None:
+        """Subscribe to the configured covers and the entities they depend on."""
+        self.async_stop_tracking()
+        self._async_subscribe()
+
+    @callback
+    def _async_subscribe(self) -> None:
+        # temperature sensors; sun, season and weather are tracked once for
+        # all entries by the scheduler
+        if self._temp_rows:
+            self._track_remove = async_track_state_change_event(
+                self.hass, list(self._temp_rows), self._handle_dependency_changed
+            )
+        if self.entry_data.covers:
+            self._cover_track_remove = async_track_state_change_event(
+                self.hass, list(self.entry_data.covers), self._handle_state_changed
+            )
+            self._async_start_planning()
+
+    @callback
+    def async_update_covers(self, covers: dict[str, CoverConfig]) -> tuple[list[str], list[str]]:
+        """Apply a new cover list in place; return the (added, removed) covers.
+
+        Unchanged covers keep their runtime state, filters and pending
+        rechecks; only added and edited covers are evaluated.
+        """
+        old = self.entry_data.covers
+        added = [c for c in covers if c not in old]
+        removed = [c for c in old if c not in covers]
+        changed = [c for c in covers if c in old and covers[c] != old[c]]
+
+        for cover_entity in removed:
+            self.entry_data.release_runtime(cover_entity)
+            self._deferred.pop(cover_entity, None)
+            self._pending.discard(cover_entity)
+        self.entry_data.covers = covers
+        self._build_rows()
+
+        for unsub in (self._track_remove, self._cover_track_remove, self._edge_remove):
+            if unsub:
+                unsub()
+        self._track_remove = self._cover_track_remove = self._edge_remove = None
+        if self._plan_task:
+            self._plan_task.cancel()
+            self._plan_task = None
+        self._plan = None
+        self._edges = []
+        self._async_subscribe()
+
+        if added or changed:
+            self._pending.update(added)
+            self._pending.update(changed)
+            self._recompute.async_schedule_call()
+        if removed:
+            self.async_schedule_save()
+        return added, removed
+
+    async def async_shutdown(self) -> None:
+        """Drop queued commands when the entry goes away."""
+        self._mover.async_remove_entry(self.entry.entry_id)
+        await super().async_shutdown()
+
+    @callback
+    def async_stop_tracking(self) -> None:
+        if self._cover_track_remove:
+            self._cover_track_remove()
+            self._cover_track_remove = None
+        if self._track_remove:
+            self._track_remove()
+            self._track_remove = None
+        if self._recheck_remove:
+            self._recheck_remove()
+            self._recheck_remove = None
+        if self._plan_task:
+            self._plan_task.cancel()
+            self._plan_task = None
+        if self._edge_remove:
+            self._edge_remove()
+            self._edge_remove = None
+        self._edges = []
+        self._recheck_at = None
+        self._deferred.clear()
+        self._pending.clear()
+        self._recompute.async_cancel()
+
+    @callback
+    def _handle_state_changed(self, event: Event) -> None:
+        """Track move completion; turn automation off when a cover moves without an SCS context."""
+        self.metrics.listener_events += 1
+        entity_id: str = event.data["entity_id"]
+        runtime = self.entry_data.get_runtime(entity_id)
+        if not runtime.automation_enabled:
+            return
+
+        new_state = event.data.get("new_state")
+        old_state = event.data.get("old_state")
+        if new_state is None or old_state is None:
+            return
+
+        new_pos = new_state.attributes.get("current_position")
+        if runtime.motion_deadline and new_state.state not in _MOVING_STATES:
+            if new_pos is None:
+                # open/closed only: coming to rest ends the move
+                arrived = old_state.state in _MOVING_STATES
+            else:
+                pos = parse_position(new_state, self.entry_data.covers[entity_id].invert_position)
+                target = runtime.last_target
+                arrived = pos is not None and target is not None and abs(pos - target) <= MOTION_TOLERANCE
+            if arrived:
+                runtime.motion_deadline = 0.0
+                if (row := self._table.row.get(entity_id)) is not None and self._travel[row].moving:
+                    self._travel[row].arrive(self._clock())
+                    self.async_schedule_save()
+
+        old_pos = old_state.attributes.get("current_position")
+        if new_pos is None or old_pos is None or new_pos == old_pos:
+            return
+        self.metrics.listener_relevant += 1
+
+        now = self._clock()
+        ctx = event.context
+        if ctx and (self._issued.contains(ctx.id, now) or self._issued.contains(ctx.parent_id, now)):
+            return
+
+        runtime.automation_enabled = False
+        self.metrics.overrides += 1
+        if (row := self._table.row.get(entity_id)) is not None:
+            self._travel[row].cancel()
+        self.history.async_record_override(
+            now, entity_id, parse_position(new_state, self.entry_data.covers[entity_id].invert_position)
+        )
+        self.async_schedule_save()
+        async_dispatcher_send(
+            self.hass, SIGNAL_AUTOMATION_STATE_CHANGED, self.entry.entry_id, entity_id, False
+        )
+        _LOGGER.info("SCS: Manual override detected on %s -> automation OFF", entity_id)
+
+    @callback
+    def _handle_dependency_changed(self, event: Event) -> None:
+        self.metrics.listener_events += 1
+        # a new reading only matters once it flips a cover's hot/cold state
+        covers = self._feed_temperature(event.data["entity_id"], event.data.get("new_state"))
+        if not covers:
+            return
+        self.metrics.listener_relevant += 1
+        self._pending.update(covers)
+        self._recompute.async_schedule_call()
+
+    @callback
+    def _async_start_planning(self) -> None:
+        self._plan_task = self.entry.async_create_background_task(
+            self.hass, self._async_plan_wakeups(), f"{DOMAIN} plan wakeups"
+        )
+
+    async def _async_plan_wakeups(self) -> None:
+        """Plan today's sun geometry; wake up at every FOV entry/exit and at sunrise/sunset.
+
+        The intervals come from the on-disk exposure cache; only the first day
+        of a year, or of a new geometry or location, computes them. Sunrise and
+        sunset are moved by the configured offsets and decide night for this
+        entry from then on.
+        """
+        start = dt_util.start_of_local_day()
+        end = start + timedelta(days=1)
+
+        geometries = {
+            geometry: [self._table.configs[row].cover_entity for row in rows]
+            for geometry, rows in self._facades.groups.items()
+        }
+
+        plan = await self.hass.async_add_executor_job(
+            load_day_plan,
+            self.hass.config.path(STORAGE_DIR, EXPOSURE_CACHE_DIR),
+            list(geometries),
+            start.timestamp(),
+            end.timestamp(),
+            self.hass.config.latitude,
+            self.hass.config.longitude,
+        )
+        gc = self.entry_data.global_cfg
+        plan.daylight = shift_daylight(plan, gc.sunrise_offset * 60, gc.sunset_offset * 60)
+        self._plan = plan
+        # a transition (None) re-evaluates every cover, as one batch
+        edges: list[tuple[float, list[str] | None]] = [(ts, None) for ts in plan.transitions()]
+        edges.extend((ts, [c for geometry in changed for c in geometries[geometry]]) for ts, changed in plan.edges())
+        self._edges = sorted(edges, key=lambda edge: edge[0])
+        self._day_end = end
+        self._arm_next_edge()
+
+    @callback
+    def _arm_next_edge(self) -> None:
+        if self._edge_remove:
+            self._edge_remove()
+        now = self._clock()
+        while self._edges and self._edges[0][0] <= now:
+            self._edges.pop(0)
+        if self._edges:
+            when = dt_util.utc_from_timestamp(self._edges[0][0])
+        else:
+            when = self._day_end
+        self._edge_remove = async_track_point_in_utc_time(self.hass, self._handle_edge, when)
+
+    @callback
+    def _handle_edge(self, _now: datetime) -> None:
+        self._edge_remove = None
+        if not self._edges:
+            # day is over, plan the next one
+            self._async_start_planning()
+            return
+        _ts, covers = self._edges.pop(0)
+        if covers is None:
+            self.entry.async_create_background_task(
+                self.hass,
+                self._async_staggered_refresh(self.entry_data.global_cfg.transition_window),
+                f"{DOMAIN} sunrise/sunset",
+            )
+        else:
+            self._pending.update(covers)
+            self._recompute.async_schedule_call()
+        self._arm_next_edge()
+
+    @callback
+    def async_schedule_evaluate(self, cover_entities: Iterable[str]) -> None:
+        """Evaluate the given covers on the next debounced pass."""
+        self._pending.update(cover_entities)
+        self._recompute.async_schedule_call()
+
+    async def _async_evaluate_pending(self) -> None:
+        if not self._started:
+            return  # kept for the end of the startup refresh
+        covers, self._pending = self._pending, set()
+        await self._async_evaluate(covers)
+
+    @callback
+    def _defer(self, cover_entity: str, due: float) -> None:
+        """Re-evaluate a cover once its min_delta_time has elapsed."""
+        self._deferred[cover_entity] = due
+        if self._recheck_at is not None and self._recheck_at <= due:
+            return
+        if self._recheck_remove:
+            self._recheck_remove()
+        self._recheck_at = due
+        self._recheck_remove = async_track_point_in_utc_time(
+            self.hass, self._handle_recheck, dt_util.utc_from_timestamp(due)
+        )
+
+    @callback
+    def _handle_recheck(self, _now: datetime) -> None:
+        self._recheck_remove = None
+        self._recheck_at = None
+        now = self._clock()
+        due = [c for c, ts in self._deferred.items() if ts <= now]
+        for cover_entity in due:
+            del self._deferred[cover_entity]
+        if due:
+            self._pending.update(due)
+            self._recompute.async_schedule_call()
+        if self._deferred:
+            cover_entity = min(self._deferred, key=self._deferred.__getitem__)
+            self._defer(cover_entity, self._deferred[cover_entity])
 
     async def _async_update_data(self) -> None:
-        """Periodic tick every minute: compute targets and move covers."""
-        for cover_entity, cfg in self.entry_data.covers.items():
-            runtime = self.entry_data.get_runtime(cover_entity)
+        """Evaluate every cover at once."""
+        await self._async_evaluate(self.entry_data.covers)
+
+    async def async_evaluate(self, cover_entities: Iterable[str] | None = None, env: EnvSnapshot | None = None) -> None:
+        """Evaluate the given covers (default: all), optionally with a shared snapshot."""
+        covers = self.entry_data.covers if cover_entities is None else cover_entities
+        if not self._started:
+            self._pending.update(covers)
+            return
+        await self._async_evaluate(covers, env)
+
+    async def _async_evaluate(self, cover_entities: Iterable[str], env: EnvSnapshot | None = None) -> None:
+        """Compute targets for the given covers and move them."""
+        started = time.perf_counter()
+        if env is None:
+            env = self._snapshot()
+        now = self._clock()
+        # night follows the offset sunrise/sunset of the plan, not sun.sun
+        if self._plan is not None and self._plan.covers(now) and self._plan.is_night(now) != env.is_night:
+            env = replace(env, is_night=not env.is_night)
+
+        peak = env.forecast_peak  # see hot_ahead()
+        requested = 0
+        rows: list[int] = []
+        too_hot: list[bool] = []
+        too_cold: list[bool] = []
+        for cover_entity in cover_entities:
+            row = self._table.row.get(cover_entity)
+            if row is None:
+                continue
+            requested += 1
+            runtime = self._runtimes[row]
             if not runtime.automation_enabled:
+                if self._traces[row] is not None:
+                    self._trace(row, now, env, skip=SKIP_AUTOMATION_OFF)
+                continue
+            # never stack commands on a cover that is queued or still moving
+            if runtime.motion_deadline > now or self._reported_moving(row, now):
+                if self._traces[row] is not None:
+                    self._trace(row, now, env, skip=SKIP_IN_MOTION)
                 continue
+            rows.append(row)
+            temp = self._temps[row]
+            too_hot.append(temp.hot or (peak is not None and peak >= self._table.configs[row].t_max))
+            too_cold.append(temp.cold)
+        if not rows:
+            self.metrics.record_tick(time.perf_counter() - started, 0, requested)
+            return
 
-            is_night = self._is_quiet_hours()
+        # sun-in-front is decided once per facade and fanned out to its covers
+        facing = self._facades.facing(env.azimuth) if env.direct_sun and env.elevation > 0 else frozenset()
+        decisions = [
+            self._lookup_target(row, env, hot, cold, facing) for row, hot, cold in zip(rows, too_hot, too_cold)
+        ]
 
-            if is_night:
-                target = self._clamp(cfg, cfg.default_night)
-            else:
-                target = await self._compute_day_target(cfg)
+        timeout = self.entry_data.global_cfg.move_timeout
+        moves: list[PendingMove] = []
+        for row, (target, rule) in zip(rows, decisions):
+            cfg = self._table.configs[row]
+            cover_entity = cfg.cover_entity
+            runtime = self._runtimes[row]
 
-            cur = self._get_current_position(cover_entity, cfg)
-            if cur is None:
+            cur = self._current_position(row, now)
+            reason = SKIP_NO_POSITION if cur is None else skip_reason(cfg, runtime.last_move_ts, target, cur, now)
+            if self._traces[row] is not None:
+                self._trace(row, now, env, facing, rule, target, cur, reason)
+            if reason == SKIP_DELTA_TIME:
+                self._defer(cover_entity, runtime.last_move_ts + cfg.min_delta_time)
+            if reason:
                 continue
 
-            if runtime.last_move_ts:
-                if (time.time() - runtime.last_move_ts) < cfg.min_delta_time:
-                    continue
-            if abs(int(target) - int(cur)) < cfg.min_delta_position:
-                continue
+            target = int(target)
+            runtime.last_target = target
+            runtime.motion_deadline = now + timeout
+            send_pos = send_position(target, cfg.invert_position)
+            self._move_rules[cover_entity] = rule
+            moves.append(PendingMove(cover_entity, target, send_pos, priority=-abs(target - cur)))  # biggest first
 
-            await self._set_cover_position(cover_entity, cfg, int(target))
+        if moves:
+            self._mover.async_submit(self.entry.entry_id, self._set_cover_position, moves)
+        self.metrics.record_tick(time.perf_counter() - started, len(rows), requested - len(moves))
 
-    def _is_quiet_hours(self) -> bool:
-        sun = self.hass.states.get("sun.sun")
-        if not sun:
-            return False
-        return sun.state == "below_horizon"
-
-    async def _compute_day_target(self, cfg: CoverConfig) -> int:
-        sun = self.hass.states.get("sun.sun")
-        if not sun:
-            return cfg.default_day
-
-        elev = sun.attributes.get("elevation", 0.0)
-        az = sun.attributes.get("azimuth", 0.0)
-
-        direct_sun = False
-        if self.entry_data.global_cfg.weather_entity:
-            w = self.hass.states.get(self.entry_data.global_cfg.weather_entity)
-            if w:
-                ws = (w.state or "").lower()
-                direct_sun = ws in DIRECT_SUN_STATES
-        else:
-            direct_sun = True
+    def _lookup_target(
+        self, row: int, env: EnvSnapshot, too_hot: bool, too_cold: bool, facing: frozenset[Geometry]
+    ) -> tuple[int, str]:
+        """(target, rule) by lookup; the rules only run for a regime the cover has not seen yet."""
+        regime = regime_of(env, too_hot, too_cold)
+        targets = self._regimes[row].get(regime)
+        if targets is None:
+            targets = self._regimes[row][regime] = regime_targets(self._table.configs[row], regime)
+        if env.is_night:
+            return targets[NIGHT]
+        return targets[FRONT if self._geometries[row] in facing else ELSEWHERE]
 
-        sun_in_front = elev > 0 and (angular_diff_deg(float(az), float(cfg.window_azimuth)) <= float(cfg.fov_half))
-        if not direct_sun:
-            sun_in_front = False
+    def _trace(
+        self,
+        row: int,
+        now: float,
+        env: EnvSnapshot,
+        facing: frozenset[Geometry] | None = None,
+        rule: str | None = None,
+        target: int | None = None,
+        current: int | None = None,
+        skip: str | None = None,
+    ) -> None:
+        temp = self._temps[row]
+        self._traces[row].record(
+            TraceRecord(
+                ts=now,
+                season=env.season,
+                direct_sun=env.direct_sun,
+                is_night=env.is_night,
+                elevation=round(env.elevation, 2),
+                azimuth=round(env.azimuth, 2),
+                temperature=temp.value,
+                too_hot=temp.hot or hot_ahead(self._table.configs[row], env),
+                too_cold=temp.cold,
+                forecast_peak=env.forecast_peak,
+                in_front=None if facing is None else self._geometries[row] in facing,
+                rule=rule,
+                target=target,
+                current=current,
+                skip=skip,
+            )
+        )
+
+    def diagnostics(self) -> dict[str, Any]:
+        """Per-cover config, runtime state, temperature filter and decision trace."""
+        covers: dict[str, Any] = {}
+        for row, cfg in enumerate(self._table.configs):
+            temp = self._temps[row]
+            trace = self._traces[row]
+            covers[cfg.cover_entity] = {
+                "config": asdict(cfg),
+                "runtime": {**self._runtimes[row].as_dict(), "motion_deadline": self._runtimes[row].motion_deadline},
+                "temperature": {"value": temp.value, "too_hot": temp.hot, "too_cold": temp.cold},
+                "travel": {**self._travel[row].as_dict(), "estimate": self._travel[row].position(self._clock())},
+                "trace": trace.as_list() if trace is not None else None,
+            }
+        return covers
 
-        season = (
-            self.hass.states.get("season.season").state
-            if self.hass.states.get("season.season")
-            else "intermediate"
+    def plan(self, cover_entities: Iterable[str] | None = None) -> dict[str, list[dict]]:
+        """Upcoming targets per cover for the rest of today, if the current regime holds."""
+        if self._plan is None:
+            return {}
+        env = self._snapshot()
+        now = self._clock()
+        result: dict[str, list[dict]] = {}
+        for cover_entity in self.entry_data.covers if cover_entities is None else cover_entities:
+            row = self._table.row.get(cover_entity)
+            if row is None:
+                continue
+            cfg = self._table.configs[row]
+            temp = self._temps[row]
+            regime = regime_of(env, temp.hot or hot_ahead(cfg, env), temp.cold)
+            result[cover_entity] = [
+                {
+                    "at": dt_util.utc_from_timestamp(ts).isoformat(),
+                    "target": target,
+                    "position": send_position(target, cfg.invert_position),
+                    "rule": rule,
+                }
+                for ts, target, rule in cover_timeline(cfg, self._plan, regime, now)
+            ]
+        return result
+
+    def _snapshot(self) -> EnvSnapshot:
+        """Read sun, weather and season once for the whole pass."""
+        if self.scheduler is not None:
+            cfg = self.entry_data.global_cfg
+            return self.scheduler.snapshot(
+                cfg.weather_entity, cfg.forecast_lookahead, self._clock(), self._states.get
+            )
+        return build_snapshot(
+            self._states.get,
+            self.entry_data.global_cfg.weather_entity,
+            self._clock(),
+            self.hass.config.latitude,
+            self.hass.config.longitude,
         )
 
-        t = self.hass.states.get(cfg.temp_sensor)
-        try:
-            t_in = float(t.state) if t and t.state not in (None, "", "unknown", "unavailable") else None
-        except Exception:
-            t_in = None
+    def _reported_moving(self, row: int, now: float) -> bool:
+        """The cover still reports opening/closing; if its move is overdue, wait a little longer."""
+        cover_entity = self._table.configs[row].cover_entity
+        state = self._states.get(cover_entity)
+        if state is None or state.state not in _MOVING_STATES:
+            return False
+        runtime = self._runtimes[row]
+        if runtime.motion_deadline:
+            # slower than its learned speed (or than move_timeout): look again shortly
+            runtime.motion_deadline = now + TRAVEL_GRACE
+            self._defer(cover_entity, runtime.motion_deadline)
+        return True
 
-        target = cfg.default_day
+    def _current_position(self, row: int, now: float) -> int | None:
+        """Position to decide from (before inversion).
 
-        if season == "winter":
-            if sun_in_front and (t_in is not None and t_in < cfg.t_min):
-                target = cfg.max_day
-            else:
-                if not direct_sun:
-                    target = cfg.max_day
-                else:
-                    target = max(cfg.default_day, 70)
-        else:
-            if sun_in_front and (t_in is not None and t_in > cfg.t_max):
-                target = cfg.min_day
-            else:
-                if not direct_sun:
-                    target = max(cfg.default_day, 80)
-                else:
-                    target = cfg.default_day
-
-        return self._clamp(cfg, target)
-
-    def _clamp(self, cfg: CoverConfig, value: int) -> int:
-        value = int(value)
-        value = max(cfg.min_day, value)
-        value = min(cfg.max_day, value)
-        return value
-
-    def _get_current_position(self, cover_entity: str, cfg: CoverConfig) -> int | None:
-        st = self.hass.states.get(cover_entity)
-        if not st:
-            return None
-        pos = st.attributes.get("current_position")
-        if pos is None:
-            if st.state in ("open", "opening"):
-                pos = 100
-            elif st.state in ("closed", "closing"):
-                pos = 0
-            else:
-                return None
-        if cfg.invert_position:
-            pos = 100 - int(pos)
-        return int(pos)
+        The reported position. Covers that only report open/closed get the
+        travel model's estimate instead: the target of their last move once it
+        has arrived or is due, so a command to where they already are is
+        skipped. Covers in motion are never decided for (see _async_evaluate),
+        so no mid-travel estimate is needed here.
+        """
+        cfg = self._table.configs[row]
+        state = self._states.get(cfg.cover_entity)
+        if state is not None and state.attributes.get("current_position") is not None:
+            return parse_position(state, cfg.invert_position)
+        estimate = self._travel[row].position(now)
+        return parse_position(state, cfg.invert_position) if estimate is None else estimate
 
-    async def _set_cover_position(self, cover_entity: str, cfg: CoverConfig, target: int) -> None:
-        send_pos = 100 - target if cfg.invert_position else target
+    async def _set_cover_position(self, send_pos: int, members: list[tuple[str, int]]) -> None:
+        """Move every cover in members to the same outgoing position.
 
+        The call blocks until the cover integration has handled it (at most
+        move_timeout), so the gateway slot it runs in stays taken meanwhile.
+        A call that fails or times out is dropped: its covers are no longer
+        considered in motion and are evaluated again on the next pass.
+        """
         ctx = Context()
-        await self.hass.services.async_call(
-            "cover",
-            "set_cover_position",
-            {"entity_id": cover_entity, "position": send_pos},
-            blocking=False,
-            context=ctx,
-        )
-        runtime = self.entry_data.get_runtime(cover_entity)
-        runtime.last_move_ts = time.time()
-        runtime.last_target = target
-        runtime.last_context_id = ctx.id
-        _LOGGER.debug("SCS: set %s -> %s (ctx=%s)", cover_entity, target, ctx.id)
+        now = self._clock()
+        timeout = self.entry_data.global_cfg.move_timeout
+        # book the move before calling: the cover may report its new state
+        # (or arrive) before async_call returns. covers still configured -> rule of their move
+        moved: dict[str, str | None] = {}
+        for cover_entity, target in members:
+            rule = self._move_rules.pop(cover_entity, None)
+            if (runtime := self.entry_data.runtime.get(cover_entity)) is None:
+                continue  # removed while queued
+            row = self._table.row.get(cover_entity)
+            start = None if row is None else self._current_position(row, now)
+            runtime.last_move_ts = now
+            runtime.last_target = target
+            runtime.motion_deadline = now + timeout
+            runtime.last_context_id = ctx.id
+            moved[cover_entity] = rule
+            if row is None:
+                continue
+            # with a learned speed, expect the cover at its target on time and look again then
+            arrival = self._travel[row].begin(now, start, target)
+            if arrival is not None and arrival + TRAVEL_GRACE < now + timeout:
+                runtime.motion_deadline = arrival + TRAVEL_GRACE
+                self._defer(cover_entity, runtime.motion_deadline)
+        if not moved:
+            return  # every cover was removed while queued
+        entity_ids = list(moved)
+        self._issued.add(ctx.id, now)
+
+        started = time.perf_counter()
+        try:
+            async with asyncio.timeout(timeout):
+                await self.hass.services.async_call(
+                    "cover",
+                    "set_cover_position",
+                    {"entity_id": entity_ids, "position": send_pos},
+                    blocking=True,
+                    context=ctx,
+                )
+        except (HomeAssistantError, TimeoutError) as err:
+            # a failed or timed-out call still tells how long the gateway took
+            self.metrics.record_call(time.perf_counter() - started, 0, now)
+            _LOGGER.warning(
+                "SCS: set_cover_position to %s failed for %s: %s",
+                send_pos,
+                ", ".join(entity_ids),
+                str(err) or "timed out",
+            )
+            for cover_entity in moved:
+                self._drop_move(cover_entity)
+            return
+        self.metrics.record_call(time.perf_counter() - started, len(moved), now)
+        for cover_entity, target in members:
+            if cover_entity in moved:
+                self.history.async_record_move(now, cover_entity, target, moved[cover_entity])
+        self.async_schedule_save()
+        _LOGGER.debug("SCS: set %s -> %s (ctx=%s)", ", ".join(entity_ids), send_pos, ctx.id)
+
+    @callback
+    def _drop_move(self, cover_entity: str) -> None:
+        """Forget a move that was never carried out."""
+        if (runtime := self.entry_data.runtime.get(cover_entity)) is not None:
+            runtime.motion_deadline = 0.0
+        if (row := self._table.row.get(cover_entity)) is not None:
+            self._travel[row].cancel()
@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from dataclasses import asdict
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .coordinator import SCSCoordinator
+
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigEntry) -> dict[str, Any]:
+    """Entry options plus, per cover, runtime state and (for debug covers) the decision trace."""
+    coord: SCSCoordinator = hass.data[DOMAIN][entry.entry_id]
+    return {
+        "options": dict(entry.options),
+        "global": asdict(coord.entry_data.global_cfg),
+        "covers": coord.diagnostics(),
+    }
@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.entity import Entity
+
+from .const import DOMAIN
+from .coordinator import SCSCoordinator
+
+
+class SCSEntity(Entity):
+    """Base for the entities of the "SCS Controller" device of one entry."""
+
+    _attr_has_entity_name = True
+
+    def __init__(self, coordinator: SCSCoordinator) -> None:
+        self.coordinator = coordinator
+
+    @property
+    def device_info(self) -> DeviceInfo:
+        return DeviceInfo(
+            identifiers={(DOMAIN, self.coordinator.entry.entry_id)},
+            name="Simple Cover Service (SCS)",
+            manufacturer="SCS",
+            model="SCS Controller",
+        )
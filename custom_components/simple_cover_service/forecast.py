@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+
+from .const import DOMAIN, FORECAST_TTL
+from .util.kernel import ForecastHour, parse_forecast
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class ForecastCache:
+    """Hourly forecasts per weather entity, shared by every SCS entry.
+
+    A forecast is fetched at most once per FORECAST_TTL (or again after
+    `invalidate`), however many entries and covers use it; concurrent refreshes
+    of one entity share a single `weather.get_forecasts` call. Entities without
+    hourly forecasts are remembered as empty for the same TTL. Times come from
+    the caller (a coordinator's clock), as for SCSScheduler.snapshot.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self.hass = hass
+        # weather entity -> (fetched at, hours)
+        self._forecasts: dict[str, tuple[float, tuple[ForecastHour, ...]]] = {}
+        self._inflight: dict[str, asyncio.Task] = {}
+
+    def get(self, weather_entity: str) -> tuple[ForecastHour, ...]:
+        """Cached hours of the entity, without fetching."""
+        cached = self._forecasts.get(weather_entity)
+        return cached[1] if cached else ()
+
+    def invalidate(self, weather_entity: str) -> None:
+        """Refetch on the next refresh; the old hours are served until then."""
+        if (cached := self._forecasts.get(weather_entity)) is not None:
+            self._forecasts[weather_entity] = (0.0, cached[1])
+
+    async def async_refresh(self, weather_entity: str, now: float) -> bool:
+        """Fetch the entity's forecast unless the cached one is still fresh; True if fetched."""
+        cached = self._forecasts.get(weather_entity)
+        if cached and 0 <= now - cached[0] < FORECAST_TTL:
+            return False
+        if (task := self._inflight.get(weather_entity)) is None:
+            task = self._inflight[weather_entity] = self.hass.async_create_task(
+                self._async_fetch(weather_entity, now), f"{DOMAIN} forecast {weather_entity}"
+            )
+            task.add_done_callback(lambda _: self._inflight.pop(weather_entity, None))
+        await asyncio.shield(task)
+        return True
+
+    async def _async_fetch(self, weather_entity: str, now: float) -> None:
+        hours: tuple[ForecastHour, ...] = ()
+        try:
+            response = await self.hass.services.async_call(
+                "weather",
+                "get_forecasts",
+                {"entity_id": weather_entity, "type": "hourly"},
+                blocking=True,
+                return_response=True,
+            )
+        except HomeAssistantError as err:
+            _LOGGER.debug("SCS: no hourly forecast for %s: %s", weather_entity, err)
+        else:
+            hours = parse_forecast(((response or {}).get(weather_entity) or {}).get("forecast") or [])
+        self._forecasts[weather_entity] = (now, hours)
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta
+import logging
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.storage import STORAGE_DIR
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    DOMAIN,
+    HISTORY_BATCH,
+    HISTORY_FLUSH_INTERVAL,
+    HISTORY_MAINTENANCE_INTERVAL,
+    HISTORY_RETENTION,
+)
+from .util.history import KIND_MOVE, KIND_OVERRIDE, HistoryRecord, MoveHistory
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def history_path(hass: HomeAssistant, entry_id: str) -> str:
+    return hass.config.path(STORAGE_DIR, f"{DOMAIN}.{entry_id}.history.db")
+
+
+class HistoryRecorder:
+    """Buffers an entry's move and override records and writes them in batches.
+
+    `async_record_*` only append to an in-memory list, so the coordinator tick
+    and the state listener never wait for the disk. The buffer is written by an
+    executor job every HISTORY_FLUSH_INTERVAL, or as soon as it holds
+    HISTORY_BATCH records; rows older than HISTORY_RETENTION are pruned and
+    the file compacted once per HISTORY_MAINTENANCE_INTERVAL. On shutdown the
+    buffer is written at final write, since entries are not unloaded then.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
+        self.hass = hass
+        self.entry = entry
+        self.db = MoveHistory(history_path(hass, entry.entry_id))
+        self._buffer: list[HistoryRecord] = []
+        # executor jobs on the database run one at a time
+        self._lock = asyncio.Lock()
+        self._unsubs: list[CALLBACK_TYPE] = []
+        self._final_write_remove: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_start(self) -> None:
+        # also now: Home Assistant may restart more often than once a day
+        self.entry.async_create_background_task(
+            self.hass, self._async_maintain(dt_util.utcnow()), f"{DOMAIN} history maintenance"
+        )
+        self._unsubs = [
+            async_track_time_interval(self.hass, self._async_flush_interval, HISTORY_FLUSH_INTERVAL),
+            async_track_time_interval(self.hass, self._async_maintain, HISTORY_MAINTENANCE_INTERVAL),
+        ]
+        self._final_write_remove = self.hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_FINAL_WRITE, self._async_final_write
+        )
+
+    async def _async_final_write(self, _event: Event) -> None:
+        self._final_write_remove = None  # a fired once-listener is already gone
+        await self.async_stop()
+
+    async def async_stop(self) -> None:
+        """Write what is buffered and close the database."""
+        for unsub in self._unsubs:
+            unsub()
+        self._unsubs = []
+        if self._final_write_remove:
+            self._final_write_remove()
+            self._final_write_remove = None
+        await self.async_flush()
+        async with self._lock:
+            await self.hass.async_add_executor_job(self.db.close)
+
+    @callback
+    def async_record_move(self, ts: float, cover_entity: str, target: int, rule: str | None) -> None:
+        self._add(HistoryRecord(ts, cover_entity, KIND_MOVE, target, rule))
+
+    @callback
+    def async_record_override(self, ts: float, cover_entity: str, position: int | None) -> None:
+        self._add(HistoryRecord(ts, cover_entity, KIND_OVERRIDE, position, None))
+
+    def _add(self, record: HistoryRecord) -> None:
+        self._buffer.append(record)
+        if len(self._buffer) == HISTORY_BATCH:
+            self.entry.async_create_background_task(self.hass, self.async_flush(), f"{DOMAIN} history flush")
+
+    async def async_flush(self) -> None:
+        if not self._buffer:
+            return
+        batch, self._buffer = self._buffer, []
+        async with self._lock:
+            try:
+                await self.hass.async_add_executor_job(self.db.append, batch)
+            except Exception:  # the history must never break cover control
+                _LOGGER.exception("SCS: could not write %d history records", len(batch))
+
+    async def _async_flush_interval(self, _now: datetime) -> None:
+        await self.async_flush()
+
+    async def _async_maintain(self, _now: datetime) -> None:
+        before = (dt_util.utcnow() - HISTORY_RETENTION).timestamp()
+        async with self._lock:
+            try:
+                if await self.hass.async_add_executor_job(self.db.prune, before):
+                    await self.hass.async_add_executor_job(self.db.compact)
+            except Exception:
+                _LOGGER.exception("SCS: history maintenance failed")
+
+    async def async_summary(self, cover_entities: list[str] | None, days: int) -> dict[str, dict]:
+        """Per-cover summary of the last `days` days, including what is still buffered."""
+        await self.async_flush()
+        until = dt_util.utcnow()
+        async with self._lock:
+            return await self.hass.async_add_executor_job(
+                self.db.summary,
+                cover_entities,
+                (until - timedelta(days=days)).timestamp(),
+                until.timestamp(),
+                dt_util.DEFAULT_TIME_ZONE,
+            )
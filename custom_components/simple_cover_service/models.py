@@ -1,16 +1,40 @@
 from __future__ import annotations
 
+from array import array
+from collections import OrderedDict
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class GlobalConfig:
     weather_entity: str | None = None
-    sunrise_offset: int = 0
+    sunrise_offset: int = 0  # minutes, positive = later
     sunset_offset: int = 0
+    max_parallel_calls: int = 4
+    gateway_concurrency: int = 2
+    gateway_rate: float = 2.0  # commands per second per gateway, 0 = unlimited
+    move_timeout: int = 120
+    startup_window: int = 60  # seconds to spread the first evaluation over
+    forecast_lookahead: int = 0  # minutes of hourly forecast to shade ahead of, 0 = off
+    transition_window: int = 0  # seconds to spread sunrise/sunset moves over
 
+    @classmethod
+    def from_options(cls, raw: dict) -> GlobalConfig:
+        return cls(
+            weather_entity=raw.get("weather_entity"),
+            sunrise_offset=int(raw.get("sunrise_offset", 0)),
+            sunset_offset=int(raw.get("sunset_offset", 0)),
+            max_parallel_calls=int(raw.get("max_parallel_calls", 4)),
+            gateway_concurrency=int(raw.get("gateway_concurrency", 2)),
+            gateway_rate=float(raw.get("gateway_rate", 2.0)),
+            move_timeout=int(raw.get("move_timeout", 120)),
+            startup_window=int(raw.get("startup_window", 60)),
+            forecast_lookahead=int(raw.get("forecast_lookahead", 0)),
+            transition_window=int(raw.get("transition_window", 0)),
+        )
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class CoverConfig:
     cover_entity: str
     temp_sensor: str
@@ -26,14 +50,190 @@ class CoverConfig:
     min_delta_time: int = 300
     invert_position: bool = False
     debug: bool = False
+    extra_temp_sensors: tuple[str, ...] = ()
+    temp_smoothing: str = "none"  # none, ewma or median
+    temp_window: int = 5  # samples
+    temp_hysteresis: float = 0.0
+
+    @property
+    def temp_sensors(self) -> tuple[str, ...]:
+        """Every sensor averaged into the cover's indoor temperature."""
+        return (self.temp_sensor, *(s for s in self.extra_temp_sensors if s != self.temp_sensor))
+
+    @classmethod
+    def from_options(cls, c: dict) -> CoverConfig:
+        return cls(
+            cover_entity=c["cover_entity"],
+            temp_sensor=c["temp_sensor"],
+            window_azimuth=float(c["window_azimuth"]),
+            fov_half=float(c.get("fov_half", 70)),
+            default_day=int(c.get("default_position_day", 60)),
+            min_day=int(c.get("min_position_day", 20)),
+            max_day=int(c.get("max_position_day", 100)),
+            default_night=int(c.get("default_position_night", 0)),
+            t_min=float(c.get("t_min", 20)),
+            t_max=float(c.get("t_max", 24)),
+            min_delta_position=int(c.get("min_delta_position", 10)),
+            min_delta_time=int(c.get("min_delta_time", 300)),
+            invert_position=bool(c.get("invert_position", False)),
+            debug=bool(c.get("debug", False)),
+            extra_temp_sensors=tuple(c.get("extra_temp_sensors") or ()),
+            temp_smoothing=c.get("temp_smoothing", "none"),
+            temp_window=int(c.get("temp_window", 5)),
+            temp_hysteresis=float(c.get("temp_hysteresis", 0.0)),
+        )
+
+    @classmethod
+    def all_from_options(cls, covers: dict | list) -> dict[str, CoverConfig]:
+        """Covers keyed by entity, from the stored mapping (or the list of options version 1)."""
+        if isinstance(covers, dict):
+            return {entity: cls.from_options({**c, "cover_entity": entity}) for entity, c in covers.items()}
+        return {c["cover_entity"]: cls.from_options(c) for c in covers}
+
+
+class RuntimeStore:
+    """Columnar runtime state for all covers of an entry, one slot per cover."""
+
+    NO_TARGET = -1
+
+    def __init__(self) -> None:
+        self.automation_enabled = array("b")
+        self.last_move_ts = array("d")
+        self.last_target = array("b")  # 0-100, NO_TARGET when never moved
+        self.motion_deadline = array("d")  # in motion (or queued) until then
+        self.last_context_id: list[str | None] = []
+        self._free: list[int] = []
+
+    def allocate(self) -> int:
+        if self._free:
+            slot = self._free.pop()
+            self.automation_enabled[slot] = 1
+            self.last_move_ts[slot] = 0.0
+            self.last_target[slot] = self.NO_TARGET
+            self.motion_deadline[slot] = 0.0
+            self.last_context_id[slot] = None
+            return slot
+        self.automation_enabled.append(1)
+        self.last_move_ts.append(0.0)
+        self.last_target.append(self.NO_TARGET)
+        self.motion_deadline.append(0.0)
+        self.last_context_id.append(None)
+        return len(self.last_context_id) - 1
+
+    def release(self, slot: int) -> None:
+        self._free.append(slot)
 
 
-@dataclass
 class RuntimeCoverState:
-    automation_enabled: bool = True
-    last_move_ts: float = 0.0
-    last_target: int | None = None
-    last_context_id: str | None = None  # for manual override detection
+    """O(1) handle on one cover's slot in a RuntimeStore."""
+
+    __slots__ = ("_store", "slot")
+
+    def __init__(self, store: RuntimeStore, slot: int) -> None:
+        self._store = store
+        self.slot = slot
+
+    @property
+    def automation_enabled(self) -> bool:
+        return bool(self._store.automation_enabled[self.slot])
+
+    @automation_enabled.setter
+    def automation_enabled(self, value: bool) -> None:
+        self._store.automation_enabled[self.slot] = 1 if value else 0
+
+    @property
+    def last_move_ts(self) -> float:
+        return self._store.last_move_ts[self.slot]
+
+    @last_move_ts.setter
+    def last_move_ts(self, value: float) -> None:
+        self._store.last_move_ts[self.slot] = value
+
+    @property
+    def last_target(self) -> int | None:
+        target = self._store.last_target[self.slot]
+        return None if target == RuntimeStore.NO_TARGET else target
+
+    @last_target.setter
+    def last_target(self, value: int | None) -> None:
+        self._store.last_target[self.slot] = RuntimeStore.NO_TARGET if value is None else value
+
+    @property
+    def motion_deadline(self) -> float:
+        """While in the future, the cover is queued or moving towards last_target."""
+        return self._store.motion_deadline[self.slot]
+
+    @motion_deadline.setter
+    def motion_deadline(self, value: float) -> None:
+        self._store.motion_deadline[self.slot] = value
+
+    @property
+    def last_context_id(self) -> str | None:
+        """Context of the last SCS command, for manual override detection."""
+        return self._store.last_context_id[self.slot]
+
+    @last_context_id.setter
+    def last_context_id(self, value: str | None) -> None:
+        self._store.last_context_id[self.slot] = value
+
+    def as_dict(self) -> dict:
+        """Persisted subset; motion_deadline does not survive a restart."""
+        return {
+            "automation_enabled": self.automation_enabled,
+            "last_move_ts": self.last_move_ts,
+            "last_target": self.last_target,
+            "last_context_id": self.last_context_id,
+        }
+
+    def restore(self, data: dict) -> None:
+        self.automation_enabled = bool(data.get("automation_enabled", True))
+        self.last_move_ts = float(data.get("last_move_ts") or 0.0)
+        self.last_target = data.get("last_target")
+        self.last_context_id = data.get("last_context_id")
+
+
+@dataclass(frozen=True, slots=True)
+class EnvSnapshot:
+    """Shared inputs, resolved once per evaluation pass."""
+
+    sun_available: bool
+    elevation: float
+    azimuth: float
+    direct_sun: bool
+    season: str
+    is_night: bool
+    # hottest forecast temperature of the sunny hours within the lookahead, if any
+    forecast_peak: float | None = None
+
+
+class IssuedContexts:
+    """TTL-bounded set of context ids SCS used for its own service calls."""
+
+    def __init__(self, ttl: float) -> None:
+        self._ttl = ttl
+        # insertion order == expiry order, since the TTL is constant
+        self._expiry: OrderedDict[str, float] = OrderedDict()
+
+    def add(self, context_id: str, now: float) -> None:
+        self._expiry[context_id] = now + self._ttl
+        self._expiry.move_to_end(context_id)
+        self.prune(now)
+
+    def prune(self, now: float) -> None:
+        while self._expiry:
+            ctx_id, expires = next(iter(self._expiry.items()))
+            if expires > now:
+                break
+            del self._expiry[ctx_id]
+
+    def contains(self, context_id: str | None, now: float) -> bool:
+        if not context_id:
+            return False
+        expires = self._expiry.get(context_id)
+        return expires is not None and expires > now
+
+    def __len__(self) -> int:
+        return len(self._expiry)
 
 
 @dataclass
@@ -41,8 +241,20 @@ class EntryData:
     global_cfg: GlobalConfig
     covers: dict[str, CoverConfig] = field(default_factory=dict)
     runtime: dict[str, RuntimeCoverState] = field(default_factory=dict)
+    store: RuntimeStore = field(default_factory=RuntimeStore)
+
+    def __post_init__(self) -> None:
+        for cover_entity in self.covers:
+            self.get_runtime(cover_entity)
 
     def get_runtime(self, cover_entity: str) -> RuntimeCoverState:
-        if cover_entity not in self.runtime:
-            self.runtime[cover_entity] = RuntimeCoverState()
-        return self.runtime[cover_entity]
+        try:
+            return self.runtime[cover_entity]
+        except KeyError:
+            rt = self.runtime[cover_entity] = RuntimeCoverState(self.store, self.store.allocate())
+            return rt
+
+    def release_runtime(self, cover_entity: str) -> None:
+        """Free the runtime slot of a cover that is no longer configured."""
+        if (rt := self.runtime.pop(cover_entity, None)) is not None:
+            self.store.release(rt.slot)
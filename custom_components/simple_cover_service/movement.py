@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Iterable
+import heapq
+import itertools
+from typing import NamedTuple
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+
+from .const import DOMAIN
+
+DEFAULT_GATEWAY = "default"
+
+SendCallback = Callable[[int, list[tuple[str, int]]], Awaitable[None]]
+
+
+class PendingMove(NamedTuple):
+    cover_entity: str
+    target: int  # before inversion
+    send_pos: int  # as sent to the cover
+    priority: float  # lower runs first
+
+
+class GatewayLimits(NamedTuple):
+    concurrency: int  # commands in flight per gateway
+    rate: float  # commands per second per gateway, 0 = unlimited
+    max_parallel: int  # commands in flight over all gateways
+
+
+class _Command(NamedTuple):
+    priority: float
+    seq: int
+    entry_id: str
+    send: SendCallback
+    send_pos: int
+    members: list[tuple[str, int]]
+
+
+class MovementScheduler:
+    """Queues cover commands per gateway, with concurrency, rate and priority.
+
+    One instance serves every SCS config entry (see SCSScheduler), because
+    entries for different parts of a building may share the same RF/KNX
+    gateways. Covers are grouped by the config entry (or platform) that
+    provides them, so that covers sharing a gateway never get more than
+    `concurrency` commands in flight, nor more than `rate` commands per
+    second, whichever SCS entry sent them. A gateway uses the strictest limits
+    of the entries that sent commands to it, and `max_parallel` caps the
+    commands in flight over all gateways. Within one entry and gateway, covers
+    going to the same position share one command.
+
+    A command is in flight until its `send` callback returns, which the
+    coordinator makes wait until the cover integration has handled it.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self.hass = hass
+        self._seq = itertools.count()
+        self._gateways: dict[str, str] = {}
+        # entry_id -> its configured limits
+        self._limits: dict[str, GatewayLimits] = {}
+        # gateway -> entries that sent commands to it
+        self._senders: dict[str, set[str]] = {}
+        # gateway -> heap of queued commands
+        self._queues: dict[str, list[_Command]] = {}
+        self._workers: dict[str, asyncio.Task] = {}
+        # gateway -> future its worker sleeps on until a slot frees or a command arrives
+        self._wakeups: dict[str, asyncio.Future] = {}
+        self._running: dict[str, int] = {}
+        self._running_total = 0
+        # gateway -> loop time before which it takes no new command
+        self._next_send: dict[str, float] = {}
+
+    @callback
+    def async_configure(self, entry_id: str, *, concurrency: int, rate: float, max_parallel: int) -> None:
+        self._limits[entry_id] = GatewayLimits(max(1, concurrency), rate, max(1, max_parallel))
+
+    @callback
+    def async_remove_entry(self, entry_id: str) -> None:
+        """Drop an entry's queued commands and limits; its calls in flight finish on their own."""
+        self._limits.pop(entry_id, None)
+        for gateway, senders in self._senders.items():
+            senders.discard(entry_id)
+            queue = self._queues.get(gateway)
+            if queue:
+                queue[:] = [cmd for cmd in queue if cmd.entry_id != entry_id]
+                heapq.heapify(queue)
+            self._wake(gateway)
+
+    def gateway_of(self, cover_entity: str) -> str:
+        gateway = self._gateways.get(cover_entity)
+        if gateway is None:
+            reg_entry = er.async_get(self.hass).async_get(cover_entity)
+            if reg_entry is not None:
+                gateway = reg_entry.config_entry_id or reg_entry.platform
+            gateway = self._gateways[cover_entity] = gateway or DEFAULT_GATEWAY
+        return gateway
+
+    def _gateway_limits(self, gateway: str) -> tuple[int, float]:
+        """(concurrency, seconds between commands) of a gateway: the strictest of its senders."""
+        limits = [self._limits[e] for e in self._senders.get(gateway, ()) if e in self._limits]
+        if not limits:
+            return 1, 0.0
+        rates = [lim.rate for lim in limits if lim.rate > 0]
+        return min(lim.concurrency for lim in limits), 1.0 / min(rates) if rates else 0.0
+
+    def _max_parallel(self) -> int:
+        return min((lim.max_parallel for lim in self._limits.values()), default=1)
+
+    @callback
+    def async_submit(self, entry_id: str, send: SendCallback, moves: Iterable[PendingMove]) -> None:
+        """Queue an entry's moves; its covers sharing gateway and position are sent together."""
+        groups: dict[tuple[str, int], tuple[float, list[tuple[str, int]]]] = {}
+        for move in moves:
+            key = (self.gateway_of(move.cover_entity), move.send_pos)
+            priority, members = groups.get(key, (move.priority, []))
+            members.append((move.cover_entity, move.target))
+            groups[key] = (min(priority, move.priority), members)
+
+        for (gateway, send_pos), (priority, members) in groups.items():
+            self._senders.setdefault(gateway, set()).add(entry_id)
+            heapq.heappush(
+                self._queues.setdefault(gateway, []),
+                _Command(priority, next(self._seq), entry_id, send, send_pos, members),
+            )
+            if gateway in self._workers:
+                self._wake(gateway)
+            else:
+                self._workers[gateway] = self.hass.async_create_background_task(
+                    self._async_run_gateway(gateway), f"{DOMAIN} gateway {gateway}"
+                )
+
+    def _wake(self, gateway: str) -> None:
+        if (wakeup := self._wakeups.pop(gateway, None)) is not None and not wakeup.done():
+            wakeup.set_result(None)
+
+    async def _async_run_gateway(self, gateway: str) -> None:
+        loop = asyncio.get_running_loop()
+        queue = self._queues[gateway]
+
+        while queue or self._running.get(gateway, 0):
+            concurrency, interval = self._gateway_limits(gateway)
+            if queue and self._running.get(gateway, 0) < concurrency and self._running_total < self._max_parallel():
+                delay = self._next_send.get(gateway, 0.0) - loop.time()
+                if delay > 0:
+                    # sleep, then look again: a more urgent command may have arrived
+                    await asyncio.sleep(delay)
+                    continue
+                self._next_send[gateway] = loop.time() + interval
+                cmd = heapq.heappop(queue)
+                self._running[gateway] = self._running.get(gateway, 0) + 1
+                self._running_total += 1
+                task = loop.create_task(cmd.send(cmd.send_pos, cmd.members))
+                task.add_done_callback(lambda _task: self._finished(gateway))
+                continue
+            # no free slot, or nothing queued: wait for a call to finish or a new command
+            wakeup = self._wakeups[gateway] = loop.create_future()
+            await wakeup
+        del self._workers[gateway]
+        self._queues.pop(gateway, None)
+
+    def _finished(self, gateway: str) -> None:
+        self._running[gateway] -= 1
+        self._running_total -= 1
+        # a freed slot may unblock this gateway, and any gateway held back by max_parallel
+        for waiting in list(self._wakeups):
+            self._wake(waiting)
+
+    async def async_drain(self) -> None:
+        """Wait until every queued command has been sent and handled."""
+        while self._workers:
+            await asyncio.wait(list(self._workers.values()))
+
+    @callback
+    def async_cancel(self) -> None:
+        for task in self._workers.values():
+            task.cancel()
+        self._workers.clear()
+        self._queues.clear()
+        self._wakeups.clear()
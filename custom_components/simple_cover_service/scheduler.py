@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from datetime import datetime
+import logging
+from typing import TYPE_CHECKING
+
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, State, callback
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.event import async_track_state_change_event, async_track_time_interval
+
+from .const import (
+    DATA_SCHEDULER,
+    DOMAIN,
+    RECOMPUTE_COOLDOWN,
+    SAFETY_POLL_INTERVAL,
+    SEASON_ENTITY,
+    SNAPSHOT_TTL,
+    SUN_ENTITY,
+)
+from .forecast import ForecastCache
+from .models import EnvSnapshot
+from .movement import MovementScheduler
+from .util.kernel import build_snapshot
+
+if TYPE_CHECKING:
+    from .coordinator import SCSCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@callback
+def async_get_scheduler(hass: HomeAssistant) -> SCSScheduler:
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if (scheduler := domain_data.get(DATA_SCHEDULER)) is None:
+        scheduler = domain_data[DATA_SCHEDULER] = SCSScheduler(hass)
+    return scheduler
+
+
+class SCSScheduler:
+    """Domain-wide driver shared by every SCS config entry.
+
+    Owns the safety poll and the subscriptions to sun.sun, season.season and
+    the weather entities, resolves the shared environment once per pass (per
+    weather entity) and evaluates all affected entries in that same pass.
+    Night/day switches are armed by each entry from its day plan; sun.sun only
+    triggers a pass for entries without one. Hourly forecasts are refreshed
+    here too, at the start of a pass and only when stale, so no cover or tick
+    ever fetches one. Cover commands of all entries go through one
+    MovementScheduler, so the per-gateway limits hold across entries.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self.hass = hass
+        self._coordinators: dict[str, SCSCoordinator] = {}
+        # (weather entity, lookahead, state source) -> (resolved at, snapshot)
+        self._snapshots: dict[tuple[str | None, int, Callable], tuple[float, EnvSnapshot]] = {}
+        self.forecasts = ForecastCache(hass)
+        self.movement = MovementScheduler(hass)
+        self._dirty: set[str] = set()
+        self._poll_remove: CALLBACK_TYPE | None = None
+        self._track_remove: CALLBACK_TYPE | None = None
+        self._tick = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=RECOMPUTE_COOLDOWN,
+            immediate=False,
+            function=self._async_run_dirty,
+        )
+
+    @callback
+    def async_register(self, coord: SCSCoordinator) -> None:
+        self._coordinators[coord.entry.entry_id] = coord
+        coord.scheduler = self
+        self._async_retrack()
+        cfg = coord.entry_data.global_cfg
+        if cfg.weather_entity and cfg.forecast_lookahead > 0:
+            coord.entry.async_create_background_task(
+                self.hass, self.forecasts.async_refresh(cfg.weather_entity, coord.clock()), f"{DOMAIN} forecast"
+            )
+        if self._poll_remove is None:
+            self._poll_remove = async_track_time_interval(self.hass, self._async_poll, SAFETY_POLL_INTERVAL)
+
+    @callback
+    def async_unregister(self, coord: SCSCoordinator) -> None:
+        """Forget an entry; the last one to leave tears the scheduler down."""
+        self._coordinators.pop(coord.entry.entry_id, None)
+        self._dirty.discard(coord.entry.entry_id)
+        self.movement.async_remove_entry(coord.entry.entry_id)
+        coord.scheduler = None
+        if self._coordinators:
+            self._async_retrack()
+            return
+        if self._poll_remove:
+            self._poll_remove()
+            self._poll_remove = None
+        if self._track_remove:
+            self._track_remove()
+            self._track_remove = None
+        self._tick.async_cancel()
+        self.movement.async_cancel()
+        self.hass.data.get(DOMAIN, {}).pop(DATA_SCHEDULER, None)
+
+    @callback
+    def _async_retrack(self) -> None:
+        if self._track_remove:
+            self._track_remove()
+        shared = {SUN_ENTITY, SEASON_ENTITY}
+        shared.update(w for w in self._weather_entities() if w)
+        self._track_remove = async_track_state_change_event(self.hass, list(shared), self._handle_shared_changed)
+
+    def _weather_entities(self) -> set[str | None]:
+        return {c.entry_data.global_cfg.weather_entity for c in self._coordinators.values()}
+
+    def snapshot(
+        self, weather_entity: str | None, lookahead: int, now: float, get_state: Callable[[str], State | None]
+    ) -> EnvSnapshot:
+        """Shared environment, resolved at most once per SNAPSHOT_TTL per weather entity and lookahead (minutes).
+
+        `now` and `get_state` come from the calling coordinator's clock and
+        state source, so replays and benchmarks see snapshots of their own
+        time and states. Entries reading hass.states share one snapshot.
+        """
+        key = (weather_entity, lookahead, get_state)
+        cached = self._snapshots.get(key)
+        if cached and 0 <= now - cached[0] < SNAPSHOT_TTL:
+            return cached[1]
+        env = build_snapshot(
+            get_state,
+            weather_entity,
+            now,
+            self.hass.config.latitude,
+            self.hass.config.longitude,
+            self.forecasts.get(weather_entity) if weather_entity and lookahead > 0 else (),
+            lookahead * 60,
+        )
+        self._snapshots[key] = (now, env)
+        return env
+
+    @callback
+    def _handle_shared_changed(self, event: Event) -> None:
+        entity_id: str = event.data["entity_id"]
+        old_state = event.data.get("old_state")
+        new_state = event.data.get("new_state")
+        if entity_id == SUN_ENTITY:
+            # elevation/azimuth come from the local ephemeris; only the
+            # horizon state of sun.sun matters here
+            if old_state and new_state and old_state.state == new_state.state:
+                return
+        elif entity_id != SEASON_ENTITY and not (old_state and new_state and old_state.state == new_state.state):
+            # the weather turned: the forecast is refetched by the coming pass
+            self.forecasts.invalidate(entity_id)
+        self._snapshots.clear()
+
+        if entity_id == SUN_ENTITY:
+            # entries with a day plan switch night/day at their own offset
+            # sunrise/sunset; the others fall back to sun.sun
+            self._dirty.update(e for e, coord in self._coordinators.items() if not coord.transitions_armed)
+        elif entity_id == SEASON_ENTITY:
+            self._dirty.update(self._coordinators)
+        else:
+            self._dirty.update(
+                entry_id
+                for entry_id, coord in self._coordinators.items()
+                if coord.entry_data.global_cfg.weather_entity == entity_id
+            )
+        self._tick.async_schedule_call()
+
+    async def _async_run_dirty(self) -> None:
+        entry_ids, self._dirty = self._dirty, set()
+        await self._async_evaluate(entry_ids)
+
+    async def _async_poll(self, _now: datetime) -> None:
+        await self._async_evaluate(list(self._coordinators))
+
+    async def _async_evaluate(self, entry_ids: Iterable[str]) -> None:
+        """One pass over the given entries, sharing the resolved environment."""
+        coords = [coord for entry_id in entry_ids if (coord := self._coordinators.get(entry_id)) is not None]
+        # weather entity -> time of the first entry using it
+        forecasts = {
+            c.entry_data.global_cfg.weather_entity: c.clock()
+            for c in reversed(coords)
+            if c.entry_data.global_cfg.weather_entity and c.entry_data.global_cfg.forecast_lookahead > 0
+        }
+        for weather_entity, now in forecasts.items():
+            try:
+                refreshed = await self.forecasts.async_refresh(weather_entity, now)
+            except Exception:  # a broken weather integration must not stall the pass
+                _LOGGER.exception("SCS: forecast refresh failed for %s", weather_entity)
+                continue
+            if refreshed:
+                self._snapshots = {k: v for k, v in self._snapshots.items() if k[0] != weather_entity}
+
+        # each coordinator resolves its environment through snapshot(), so the
+        # entries of one pass share it
+        for coord in coords:
+            try:
+                await coord.async_evaluate()
+            except Exception:  # one entry must not stall the others
+                _LOGGER.exception("SCS: evaluation failed for entry %s", coord.entry.entry_id)
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+from datetime import datetime
+import time
+
+from homeassistant.components.sensor import (
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EntityCategory, UnitOfTime
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_track_time_interval
+
+from .const import DOMAIN, METRICS_PUBLISH_INTERVAL
+from .coordinator import SCSCoordinator
+from .entity import SCSEntity
+
+_MEASUREMENT = SensorStateClass.MEASUREMENT
+_TOTAL = SensorStateClass.TOTAL_INCREASING
+
+# keys match SCSMetrics.snapshot()
+METRIC_SENSORS: tuple[SensorEntityDescription, ...] = (
+    SensorEntityDescription(
+        key="tick_p50", native_unit_of_measurement=UnitOfTime.MILLISECONDS, state_class=_MEASUREMENT
+    ),
+    SensorEntityDescription(
+        key="tick_p95", native_unit_of_measurement=UnitOfTime.MILLISECONDS, state_class=_MEASUREMENT
+    ),
+    SensorEntityDescription(key="covers_evaluated", state_class=_MEASUREMENT),
+    SensorEntityDescription(key="covers_skipped", state_class=_MEASUREMENT),
+    SensorEntityDescription(
+        key="call_latency_p50", native_unit_of_measurement=UnitOfTime.MILLISECONDS, state_class=_MEASUREMENT
+    ),
+    SensorEntityDescription(
+        key="call_latency_p95", native_unit_of_measurement=UnitOfTime.MILLISECONDS, state_class=_MEASUREMENT
+    ),
+    SensorEntityDescription(key="moves_per_cover_hour", state_class=_MEASUREMENT),
+    SensorEntityDescription(key="overrides", state_class=_TOTAL),
+    SensorEntityDescription(key="listener_events", state_class=_TOTAL),
+    SensorEntityDescription(key="listener_relevant", state_class=_TOTAL),
+)
+
+
+async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback) -> None:
+    coord: SCSCoordinator = hass.data[DOMAIN][entry.entry_id]
+    sensors = [SCSMetricSensor(coord, description) for description in METRIC_SENSORS]
+    async_add_entities(sensors)
+
+    @callback
+    def _async_publish(_now: datetime) -> None:
+        """One snapshot per interval for all metric sensors, instead of a write per event."""
+        values = coord.metrics.snapshot(time.time(), len(coord.entry_data.covers))
+        for sensor in sensors:
+            sensor.async_publish(values.get(sensor.entity_description.key))
+
+    entry.async_on_unload(async_track_time_interval(hass, _async_publish, METRICS_PUBLISH_INTERVAL))
+
+
+class SCSMetricSensor(SCSEntity, SensorEntity):
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_should_poll = False
+
+    def __init__(self, coordinator: SCSCoordinator, description: SensorEntityDescription) -> None:
+        super().__init__(coordinator)
+        self.entity_description = description
+        self._attr_translation_key = description.key
+        self._attr_unique_id = f"{coordinator.entry.entry_id}-metric-{description.key}"
+
+    @callback
+    def async_publish(self, value: float | int | None) -> None:
+        if self.hass is None or value == self._attr_native_value:
+            return
+        self._attr_native_value = value
+        self.async_write_ha_state()
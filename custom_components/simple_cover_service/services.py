@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from homeassistant.const import ATTR_ENTITY_ID
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse, callback
+from homeassistant.helpers import config_validation as cv
+import voluptuous as vol
+
+from .const import DOMAIN, SERVICE_GET_HISTORY, SERVICE_GET_PLAN
+from .coordinator import SCSCoordinator
+
+GET_PLAN_SCHEMA = vol.Schema({vol.Optional(ATTR_ENTITY_ID): cv.entity_ids})
+GET_HISTORY_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_ENTITY_ID): cv.entity_ids,
+        vol.Optional("days", default=7): vol.All(vol.Coerce(int), vol.Range(min=1, max=365)),
+    }
+)
+
+
+def _coordinators(hass: HomeAssistant) -> list[SCSCoordinator]:
+    return [c for c in hass.data.get(DOMAIN, {}).values() if isinstance(c, SCSCoordinator)]
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    async def _async_get_plan(call: ServiceCall) -> ServiceResponse:
+        """Today's remaining target timeline per cover, under the current weather and temperatures."""
+        covers: dict[str, list[dict]] = {}
+        for coord in _coordinators(hass):
+            covers.update(coord.plan(call.data.get(ATTR_ENTITY_ID)))
+        return {"covers": covers}
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_PLAN,
+        _async_get_plan,
+        schema=GET_PLAN_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+    async def _async_get_history(call: ServiceCall) -> ServiceResponse:
+        """Moves, overrides and time in position per cover over the last `days` days."""
+        entity_ids = call.data.get(ATTR_ENTITY_ID)
+        covers: dict[str, dict] = {}
+        for coord in _coordinators(hass):
+            wanted = [c for c in entity_ids if c in coord.entry_data.covers] if entity_ids else None
+            if wanted == []:
+                continue
+            covers.update(await coord.history.async_summary(wanted, call.data["days"]))
+        return {"covers": covers}
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_HISTORY,
+        _async_get_history,
+        schema=GET_HISTORY_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
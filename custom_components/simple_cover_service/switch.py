@@ -5,12 +5,14 @@ import logging
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.restore_state import RestoreEntity
 
-from .const import DOMAIN, SIGNAL_AUTOMATION_STATE_CHANGED
+from .const import DOMAIN, SIGNAL_AUTOMATION_STATE_CHANGED, SIGNAL_COVERS_CHANGED
 from .coordinator import SCSCoordinator
+from .entity import SCSEntity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -22,45 +24,54 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
         entities.append(SCSAutomationSwitch(coord, cover_entity))
     async_add_entities(entities)
 
+    @callback
+    def _async_covers_changed(entry_id: str, added: list[str], removed: list[str]) -> None:
+        if entry_id != entry.entry_id:
+            return
+        registry = er.async_get(hass)
+        for cover_entity in removed:
+            unique_id = SCSAutomationSwitch.unique_id_for(entry, cover_entity)
+            if entity_id := registry.async_get_entity_id("switch", DOMAIN, unique_id):
+                registry.async_remove(entity_id)
+        if added:
+            async_add_entities([SCSAutomationSwitch(coord, cover_entity) for cover_entity in added])
 
-class SCSAutomationSwitch(SwitchEntity, RestoreEntity):
-    _attr_has_entity_name = True
+    entry.async_on_unload(async_dispatcher_connect(hass, SIGNAL_COVERS_CHANGED, _async_covers_changed))
 
+
+class SCSAutomationSwitch(SCSEntity, SwitchEntity, RestoreEntity):
     def __init__(self, coordinator: SCSCoordinator, cover_entity: str) -> None:
-        self.coordinator = coordinator
+        super().__init__(coordinator)
         self._cover = cover_entity
-        self._attr_unique_id = f"{coordinator.entry.entry_id}-{cover_entity}-automation"
+        self._runtime = coordinator.entry_data.get_runtime(cover_entity)
+        self._attr_unique_id = self.unique_id_for(coordinator.entry, cover_entity)
         self._attr_name = f"Automation {cover_entity}"
         self._unsub = None
 
-    @property
-    def device_info(self):
-        return {
-            "identifiers": {(DOMAIN, self.coordinator.entry.entry_id)},
-            "name": "Simple Cover Service (SCS)",
-            "manufacturer": "SCS",
-            "model": "SCS Controller",
-        }
+    @staticmethod
+    def unique_id_for(entry: ConfigEntry, cover_entity: str) -> str:
+        return f"{entry.entry_id}-{cover_entity}-automation"
 
     @property
     def is_on(self) -> bool:
-        rt = self.coordinator.entry_data.get_runtime(self._cover)
-        return rt.automation_enabled
+        return self._runtime.automation_enabled
 
     async def async_turn_on(self, **kwargs):
-        rt = self.coordinator.entry_data.get_runtime(self._cover)
-        rt.automation_enabled = True
+        self._runtime.automation_enabled = True
+        self.coordinator.async_schedule_save()
         self.async_write_ha_state()
+        # bring the cover to where SCS wants it now, not at the next safety poll
+        self.coordinator.async_schedule_evaluate([self._cover])
 
     async def async_turn_off(self, **kwargs):
-        rt = self.coordinator.entry_data.get_runtime(self._cover)
-        rt.automation_enabled = False
+        self._runtime.automation_enabled = False
+        self.coordinator.async_schedule_save()
         self.async_write_ha_state()
 
     async def async_added_to_hass(self) -> None:
         await super().async_added_to_hass()
         if (state := await self.async_get_last_state()) is not None:
-            self.coordinator.entry_data.get_runtime(self._cover).automation_enabled = state.state == "on"
+            self._runtime.automation_enabled = state.state == "on"
 
         self._unsub = async_dispatcher_connect(
             self.hass,
@@ -72,7 +83,7 @@ class SCSAutomationSwitch(SwitchEntity, RestoreEntity):
     def _handle_automation_signal(self, entry_id: str, cover_entity: str, enabled: bool) -> None:
         if entry_id != self.coordinator.entry.entry_id or cover_entity != self._cover:
             return
-        self.coordinator.entry_data.get_runtime(self._cover).automation_enabled = enabled
+        self._runtime.automation_enabled = enabled
         self.async_write_ha_state()
 
     async def async_will_remove_from_hass(self) -> None:
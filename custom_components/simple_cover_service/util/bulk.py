@@ -0,0 +1,80 @@
+"""Text formats for importing and exporting many cover definitions at once.
+
+`parse_covers` accepts JSON or YAML (a list of cover mappings, or a mapping
+keyed by cover entity as stored in the options and written by `dump_covers`)
+and CSV with a header row of option keys. In CSV, `extra_temp_sensors` lists
+entities separated by `;` and empty cells fall back to the defaults. Values are
+validated by the caller, against the same schema as the single-cover form.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+from typing import Any
+
+import yaml
+
+from ..const import CONF_COVER_ENTITY, CONF_DEBUG, CONF_EXTRA_TEMP_SENSORS, CONF_INVERT
+
+_CSV_LISTS = (CONF_EXTRA_TEMP_SENSORS,)
+_CSV_BOOLS = (CONF_DEBUG, CONF_INVERT)
+_TRUE = ("1", "true", "yes", "on")
+_FALSE = ("0", "false", "no", "off")
+
+
+def parse_covers(text: str) -> list[dict[str, Any]]:
+    """Raw cover mappings from JSON, YAML or CSV text; ValueError if the text is none of them."""
+    text = text.strip()
+    if not text:
+        return []
+    first = text.splitlines()[0]
+    if not text.startswith(("[", "{")) and "," in first and CONF_COVER_ENTITY in first:
+        return _parse_csv(text)
+    try:
+        data = json.loads(text) if text.startswith(("[", "{")) else yaml.safe_load(text)
+    except (ValueError, yaml.YAMLError) as err:
+        raise ValueError(f"not valid JSON, YAML or CSV: {err}") from err
+
+    if isinstance(data, dict):
+        items = []
+        for cover_entity, cover in data.items():
+            if not isinstance(cover, dict):
+                raise ValueError(f"{cover_entity}: expected a mapping of options")
+            items.append({**cover, CONF_COVER_ENTITY: cover_entity})
+        return items
+    if isinstance(data, list) and all(isinstance(cover, dict) for cover in data):
+        return data
+    raise ValueError("expected a list of covers or a mapping keyed by cover entity")
+
+
+def _parse_csv(text: str) -> list[dict[str, Any]]:
+    items = []
+    for line, row in enumerate(csv.DictReader(io.StringIO(text)), start=2):
+        if None in row:
+            raise ValueError(f"line {line}: more cells than columns")
+        cover: dict[str, Any] = {}
+        for key, value in row.items():
+            value = (value or "").strip()
+            if not value:
+                continue
+            if key in _CSV_LISTS:
+                cover[key] = [v.strip() for v in value.split(";") if v.strip()]
+            elif key in _CSV_BOOLS:
+                if value.lower() not in _TRUE + _FALSE:
+                    raise ValueError(f"line {line}: {key} must be true or false")
+                cover[key] = value.lower() in _TRUE
+            else:
+                cover[key] = value
+        items.append(cover)
+    return items
+
+
+def dump_covers(covers: dict[str, dict[str, Any]]) -> str:
+    """YAML mapping keyed by cover entity, readable by `parse_covers`."""
+    data = {
+        cover_entity: {k: v for k, v in cover.items() if k != CONF_COVER_ENTITY}
+        for cover_entity, cover in sorted(covers.items())
+    }
+    return yaml.safe_dump(data, sort_keys=False, allow_unicode=True) if data else ""
@@ -0,0 +1,167 @@
+"""On-disk cache of whole-year sun exposure tables.
+
+Sun exposure of a window only depends on the location, the window geometry and
+the date, so it is computed once per year and geometry and stored as a binary
+file: a fixed header followed by the sorted instants (float64 UNIX seconds) at
+which the window enters or leaves the sun, starting outside. Daylight
+(sunrise/sunset) is stored the same way. Files are named after a hash of
+everything they depend on, so a geometry or location change simply selects a
+new file; files of past years are pruned.
+
+Files are memory-mapped for reading: `EdgeTable` bisects the mapped array
+directly, without copying it. Building and loading do file I/O and heavy CPU
+work; run them in an executor.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from collections.abc import Iterable, Sequence
+from datetime import UTC, datetime
+import hashlib
+import logging
+import mmap
+import os
+import struct
+import tempfile
+
+from .sun_math import SUN_HORIZON, daylight_intervals, exposure_intervals
+
+_LOGGER = logging.getLogger(__name__)
+
+MAGIC = b"SCSX"
+FORMAT_VERSION = 1
+KIND_EXPOSURE = 0
+KIND_DAYLIGHT = 1
+# magic, version, kind, latitude, longitude, azimuth|horizon, fov_half, year, edge count
+_HEADER = struct.Struct("<4sHHddddII")
+# tables reach one day past either end of the UTC year, for local days that straddle it
+YEAR_MARGIN = 86400.0
+
+Geometry = tuple[float, float]
+
+
+class EdgeTable:
+    """Sorted toggle instants of a condition that is false before the first one."""
+
+    __slots__ = ("_edges", "_mm")
+
+    def __init__(self, edges: Sequence[float], mm: mmap.mmap | None = None) -> None:
+        self._edges = edges
+        self._mm = mm  # keeps the mapping alive
+
+    def inside(self, ts: float) -> bool:
+        return bisect_right(self._edges, ts) % 2 == 1
+
+    def intervals(self, start: float, end: float) -> list[tuple[float, float]]:
+        """[opened, closed) intervals clipped to [start, end)."""
+        edges = self._edges
+        i = bisect_right(edges, start)
+        opened = start if i % 2 == 1 else None
+        result: list[tuple[float, float]] = []
+        while i < len(edges) and edges[i] < end:
+            if opened is None:
+                opened = edges[i]
+            else:
+                result.append((opened, edges[i]))
+                opened = None
+            i += 1
+        if opened is not None:
+            result.append((opened, end))
+        return result
+
+    def __len__(self) -> int:
+        return len(self._edges)
+
+
+def year_bounds(year: int) -> tuple[float, float]:
+    start = datetime(year, 1, 1, tzinfo=UTC).timestamp() - YEAR_MARGIN
+    end = datetime(year + 1, 1, 1, tzinfo=UTC).timestamp() + YEAR_MARGIN
+    return start, end
+
+
+def _filename(kind: int, latitude: float, longitude: float, a: float, b: float, year: int) -> str:
+    key = f"{FORMAT_VERSION}|{kind}|{latitude:.5f}|{longitude:.5f}|{a:.4f}|{b:.4f}|{year}"
+    return f"{year}-{hashlib.sha1(key.encode()).hexdigest()[:20]}.bin"
+
+
+def _compute(kind: int, latitude: float, longitude: float, a: float, b: float, year: int) -> list[float]:
+    start, end = year_bounds(year)
+    if kind == KIND_DAYLIGHT:
+        intervals = daylight_intervals(start, end, latitude, longitude, horizon=a)
+    else:
+        intervals = exposure_intervals(start, end, latitude, longitude, a, b)
+    edges: list[float] = []
+    for opened, closed in intervals:
+        edges.extend((opened, closed))
+    return edges
+
+
+def _write(path: str, header: bytes, edges: list[float]) -> None:
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(header)
+            fh.write(struct.pack(f"<{len(edges)}d", *edges))
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def _map(path: str, kind: int, year: int) -> EdgeTable | None:
+    """Map a cache file, or None when it is missing, truncated or of another format."""
+    try:
+        with open(path, "rb") as fh:
+            mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+    if len(mm) >= _HEADER.size:
+        magic, version, file_kind, *_, file_year, count = _HEADER.unpack_from(mm)
+        if (
+            (magic, version, file_kind, file_year) == (MAGIC, FORMAT_VERSION, kind, year)
+            and len(mm) == _HEADER.size + 8 * count
+        ):
+            return EdgeTable(memoryview(mm)[_HEADER.size :].cast("d"), mm)
+    mm.close()
+    return None
+
+
+def load_table(
+    directory: str, kind: int, latitude: float, longitude: float, a: float, b: float, year: int
+) -> EdgeTable:
+    """Map the cached table, computing and writing it first if needed."""
+    path = os.path.join(directory, _filename(kind, latitude, longitude, a, b, year))
+    if (table := _map(path, kind, year)) is not None:
+        return table
+
+    _LOGGER.debug("SCS: building exposure table %s", path)
+    edges = _compute(kind, latitude, longitude, a, b, year)
+    header = _HEADER.pack(MAGIC, FORMAT_VERSION, kind, latitude, longitude, a, b, year, len(edges))
+    _write(path, header, edges)
+    return _map(path, kind, year) or EdgeTable(edges)
+
+
+def load_year(
+    directory: str, geometries: Iterable[Geometry], latitude: float, longitude: float, year: int
+) -> tuple[EdgeTable, dict[Geometry, EdgeTable]]:
+    """Daylight and per-geometry exposure tables of a year, from (or into) the cache."""
+    os.makedirs(directory, exist_ok=True)
+    _prune(directory, year)
+    daylight = load_table(directory, KIND_DAYLIGHT, latitude, longitude, SUN_HORIZON, 0.0, year)
+    tables = {
+        (az, fov): load_table(directory, KIND_EXPOSURE, latitude, longitude, az, fov, year)
+        for az, fov in set(geometries)
+    }
+    return daylight, tables
+
+
+def _prune(directory: str, year: int) -> None:
+    """Drop tables of years before `year - 1`."""
+    for name in os.listdir(directory):
+        head = name.split("-", 1)[0]
+        if name.endswith(".bin") and head.isdigit() and int(head) < year - 1:
+            try:
+                os.unlink(os.path.join(directory, name))
+            except OSError:
+                pass
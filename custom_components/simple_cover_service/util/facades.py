@@ -0,0 +1,57 @@
+"""Covers grouped by facade, with an azimuth stabbing query.
+
+Covers sharing (`window_azimuth`, `fov_half`) form one facade. Each facade
+sees the sun over the azimuth interval [azimuth - fov, azimuth + fov], taken
+modulo 360. The interval endpoints of all facades cut the circle into
+elementary arcs and points, and the set of facades containing each of them is
+precomputed. A query for a sun azimuth is then one bisection plus the k facades
+returned: O(log n + k). Membership is decided with `angular_diff_deg`, exactly
+as in the decision rules, so wraparound at 0/360° and the inclusive interval
+ends match them.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections.abc import Sequence
+
+from ..models import CoverConfig
+from .sun_math import angular_diff_deg
+
+Geometry = tuple[float, float]  # (window_azimuth, fov_half)
+
+
+class FacadeIndex:
+    def __init__(self, configs: Sequence[CoverConfig]) -> None:
+        # facade -> table rows of its covers
+        self.groups: dict[Geometry, list[int]] = {}
+        for row, cfg in enumerate(configs):
+            self.groups.setdefault((float(cfg.window_azimuth), float(cfg.fov_half)), []).append(row)
+
+        cuts = {0.0}
+        for azimuth, fov in self.groups:
+            if fov < 180.0:
+                cuts.add((azimuth - fov) % 360.0)
+                cuts.add((azimuth + fov) % 360.0)
+        self._cuts = sorted(cuts)
+        # _at[i]: facades containing the point _cuts[i]
+        # _between[i]: facades containing the open arc (_cuts[i - 1], _cuts[i]),
+        # with _between[0] the arc that wraps through 360°
+        self._at = [self._containing(c) for c in self._cuts]
+        ends = [*self._cuts, self._cuts[0] + 360.0]
+        self._between = [self._containing((ends[i - 1] + ends[i]) / 2) for i in range(1, len(ends))]
+        self._between.insert(0, self._between.pop())
+
+    def _containing(self, azimuth: float) -> frozenset[Geometry]:
+        return frozenset(g for g in self.groups if angular_diff_deg(azimuth, g[0]) <= g[1])
+
+    def facing(self, azimuth: float) -> frozenset[Geometry]:
+        """Facades whose field of view contains the given sun azimuth."""
+        azimuth %= 360.0
+        i = bisect_left(self._cuts, azimuth)
+        if i < len(self._cuts) and self._cuts[i] == azimuth:
+            return self._at[i]
+        return self._between[i] if i < len(self._cuts) else self._between[0]
+
+    def __len__(self) -> int:
+        return len(self.groups)
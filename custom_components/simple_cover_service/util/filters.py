@@ -0,0 +1,86 @@
+"""Streaming indoor temperature filtering for one cover.
+
+Readings arrive from state-change events. The latest reading of every sensor
+of the cover is averaged, pushed into a fixed-size ring buffer and smoothed
+(EWMA or median). The smoothed value then drives two latched flags with a
+hysteresis band, so a room hovering around `t_max` does not make the cover
+flip between positions.
+"""
+
+from __future__ import annotations
+
+from array import array
+
+from ..models import CoverConfig
+
+SMOOTHING_NONE = "none"
+SMOOTHING_EWMA = "ewma"
+SMOOTHING_MEDIAN = "median"
+
+
+class RingBuffer:
+    """Fixed-size float ring buffer, preallocated."""
+
+    __slots__ = ("_data", "_next", "_count")
+
+    def __init__(self, size: int) -> None:
+        self._data = array("d", bytes(8 * max(1, size)))
+        self._next = 0
+        self._count = 0
+
+    def push(self, value: float) -> None:
+        self._data[self._next] = value
+        self._next = (self._next + 1) % len(self._data)
+        self._count = min(self._count + 1, len(self._data))
+
+    def median(self) -> float:
+        values = sorted(self._data[: self._count] if self._count < len(self._data) else self._data)
+        mid = len(values) // 2
+        return values[mid] if len(values) % 2 else (values[mid - 1] + values[mid]) / 2
+
+    def __len__(self) -> int:
+        return self._count
+
+
+class TemperatureInput:
+    """Filtered indoor temperature of one cover and its too-hot/too-cold state."""
+
+    __slots__ = ("_latest", "_buf", "_mode", "_alpha", "_t_min", "_t_max", "_band", "value", "hot", "cold")
+
+    def __init__(self, cfg: CoverConfig) -> None:
+        self._latest: dict[str, float | None] = dict.fromkeys(cfg.temp_sensors)
+        self._mode = cfg.temp_smoothing
+        self._buf = RingBuffer(cfg.temp_window if self._mode == SMOOTHING_MEDIAN else 1)
+        self._alpha = 2.0 / (cfg.temp_window + 1)
+        self._t_min = cfg.t_min
+        self._t_max = cfg.t_max
+        self._band = cfg.temp_hysteresis
+        self.value: float | None = None
+        self.hot = False
+        self.cold = False
+
+    def update(self, sensor: str, reading: float | None) -> bool:
+        """Feed one sensor reading; True when the hot/cold state changed."""
+        self._latest[sensor] = reading
+        readings = [v for v in self._latest.values() if v is not None]
+        hot, cold = self.hot, self.cold
+
+        if not readings:
+            # unknown temperature never triggers the comfort rules
+            self.value = None
+            self.hot = self.cold = False
+            return (hot, cold) != (False, False)
+
+        raw = sum(readings) / len(readings)
+        if self._mode == SMOOTHING_MEDIAN:
+            self._buf.push(raw)
+            self.value = self._buf.median()
+        elif self._mode == SMOOTHING_EWMA and self.value is not None:
+            self.value += self._alpha * (raw - self.value)
+        else:
+            self.value = raw
+
+        t = self.value
+        self.hot = t > self._t_max if not hot else t >= self._t_max - self._band
+        self.cold = t < self._t_min if not cold else t <= self._t_min + self._band
+        return (hot, cold) != (self.hot, self.cold)
@@ -0,0 +1,170 @@
+"""Append-only history of commanded moves and manual overrides, in SQLite.
+
+One row per event: when, which cover, whether SCS moved it or someone
+overrode it, the position (0-100 before inversion; for overrides as observed)
+and the rule that chose a commanded move. Rows are only ever inserted in
+batches and deleted by `prune`; the query helpers aggregate them per cover.
+
+Every method does blocking I/O: call them from an executor, one at a time.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from datetime import datetime, tzinfo
+import os
+import sqlite3
+from typing import Any, NamedTuple
+
+KIND_MOVE = 0
+KIND_OVERRIDE = 1
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS moves ("
+    "ts REAL NOT NULL, cover TEXT NOT NULL, kind INTEGER NOT NULL, position INTEGER, rule TEXT)",
+    "CREATE INDEX IF NOT EXISTS moves_cover_ts ON moves (cover, ts)",
+)
+
+
+class HistoryRecord(NamedTuple):
+    ts: float
+    cover: str
+    kind: int
+    position: int | None
+    rule: str | None
+
+
+class MoveHistory:
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._conn: sqlite3.Connection | None = None
+
+    def _db(self) -> sqlite3.Connection:
+        if self._conn is None:
+            # used from executor threads, never concurrently
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            for statement in _SCHEMA:
+                conn.execute(statement)
+            self._conn = conn
+        return self._conn
+
+    def append(self, records: Iterable[HistoryRecord]) -> None:
+        with self._db() as conn:
+            conn.executemany("INSERT INTO moves VALUES (?, ?, ?, ?, ?)", records)
+
+    def prune(self, before: float) -> int:
+        """Delete rows older than `before`; returns how many."""
+        with self._db() as conn:
+            return conn.execute("DELETE FROM moves WHERE ts < ?", (before,)).rowcount
+
+    def compact(self) -> None:
+        """Give the space of pruned rows back to the file system."""
+        conn = self._db()
+        conn.execute("VACUUM")
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def remove(self) -> None:
+        self.close()
+        for suffix in ("", "-wal", "-shm"):
+            try:
+                os.unlink(self.path + suffix)
+            except FileNotFoundError:
+                pass
+
+    def _rows(self, covers: Sequence[str] | None, since: float, until: float) -> list[HistoryRecord]:
+        query = "SELECT ts, cover, kind, position, rule FROM moves WHERE ts >= ? AND ts < ?"
+        params: list[Any] = [since, until]
+        if covers is not None:
+            query += f" AND cover IN ({', '.join('?' * len(covers))})"
+            params.extend(covers)
+        return [HistoryRecord(*row) for row in self._db().execute(query + " ORDER BY cover, ts", params)]
+
+    def _positions_before(self, covers: Sequence[str] | None, ts: float) -> dict[str, int]:
+        """Each cover's last known position at ts."""
+        query = (
+            "SELECT cover, position, MAX(ts) FROM moves WHERE ts < ? AND position IS NOT NULL"
+            + (f" AND cover IN ({', '.join('?' * len(covers))})" if covers is not None else "")
+            + " GROUP BY cover"
+        )
+        return {cover: position for cover, position, _ in self._db().execute(query, [ts, *(covers or ())])}
+
+    def moves_per_day(
+        self, covers: Sequence[str] | None, since: float, until: float, tz: tzinfo
+    ) -> dict[str, dict[str, int]]:
+        """Commanded moves per cover and local day (ISO date)."""
+        result: dict[str, dict[str, int]] = {}
+        for rec in self._rows(covers, since, until):
+            if rec.kind == KIND_MOVE:
+                _count_day(result.setdefault(rec.cover, {}), rec.ts, tz)
+        return result
+
+    def time_in_position(self, covers: Sequence[str] | None, since: float, until: float) -> dict[str, dict[int, float]]:
+        """Seconds each cover spent at each position in [since, until), as far as the history knows it."""
+        dwell = _Dwell(self._positions_before(covers, since), since)
+        for rec in self._rows(covers, since, until):
+            dwell.add(rec)
+        return dwell.finish(until)
+
+    def summary(self, covers: Sequence[str] | None, since: float, until: float, tz: tzinfo) -> dict[str, dict]:
+        """Moves, moves per day and per rule, overrides and time in position, per cover, in one scan."""
+        result: dict[str, dict] = {}
+
+        def entry(cover: str) -> dict:
+            return result.setdefault(
+                cover, {"moves": 0, "overrides": 0, "moves_per_day": {}, "moves_per_rule": {}, "time_in_position": {}}
+            )
+
+        dwell = _Dwell(self._positions_before(covers, since), since)
+        for rec in self._rows(covers, since, until):
+            dwell.add(rec)
+            item = entry(rec.cover)
+            if rec.kind == KIND_OVERRIDE:
+                item["overrides"] += 1
+                continue
+            item["moves"] += 1
+            _count_day(item["moves_per_day"], rec.ts, tz)
+            rule = rec.rule or "unknown"
+            item["moves_per_rule"][rule] = item["moves_per_rule"].get(rule, 0) + 1
+        for cover, spent in dwell.finish(until).items():
+            entry(cover)["time_in_position"] = {pos: round(seconds) for pos, seconds in sorted(spent.items())}
+        return result
+
+
+def _count_day(days: dict[str, int], ts: float, tz: tzinfo) -> None:
+    day = datetime.fromtimestamp(ts, tz).date().isoformat()
+    days[day] = days.get(day, 0) + 1
+
+
+class _Dwell:
+    """Seconds per cover and position, fed the rows of [since, until) in time order per cover."""
+
+    def __init__(self, current: dict[str, int], since: float) -> None:
+        # cover -> position it is at, and since when
+        self._current = current
+        self._entered = dict.fromkeys(current, since)
+        self._spent: dict[str, dict[int, float]] = {}
+
+    def _leave(self, cover: str, ts: float) -> None:
+        if cover in self._current:
+            spent = self._spent.setdefault(cover, {})
+            position = self._current[cover]
+            spent[position] = spent.get(position, 0.0) + ts - self._entered[cover]
+
+    def add(self, rec: HistoryRecord) -> None:
+        if rec.position is None:
+            return
+        self._leave(rec.cover, rec.ts)
+        self._current[rec.cover] = rec.position
+        self._entered[rec.cover] = rec.ts
+
+    def finish(self, until: float) -> dict[str, dict[int, float]]:
+        for cover in self._current:
+            self._leave(cover, until)
+        return self._spent
@@ -0,0 +1,208 @@
+"""Side-effect-free SCS decision rules.
+
+`cover_decision` evaluates one cover and names the rule branch it took. The
+coordinator does not run it per evaluation: util.planner resolves it once per
+cover and regime, and the covers of a facade share whether the sun is in
+front (util.facades).
+
+Inputs come in through `build_snapshot` and `parse_temperature`, which only
+need a `get_state(entity_id)` callable returning objects with `.state` and
+`.attributes`, so the same rules run live and in offline replays. Indoor
+temperature reaches the rules as the too-hot/too-cold flags of a filtered
+`TemperatureInput` (see util.filters). A forecast of sunny hours at or above a
+cover's `t_max` raises its too-hot flag ahead of time (`hot_ahead`).
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from datetime import datetime
+from typing import Any
+
+from ..const import DIRECT_SUN_STATES, SEASON_ENTITY, SUN_ENTITY
+from ..models import CoverConfig, EnvSnapshot
+from .sun_math import angular_diff_deg, solar_position
+
+WINTER = "winter"
+WINTER_DIRECT_SUN_FLOOR = 70
+SUMMER_DIFFUSE_FLOOR = 80
+
+# Rule branches, as reported by cover_decision()
+RULE_NIGHT = "night"
+RULE_NO_SUN = "no_sun"
+RULE_WINTER_GAIN = "winter_gain"
+RULE_WINTER_DIFFUSE = "winter_diffuse"
+RULE_WINTER_DEFAULT = "winter_default"
+RULE_SHADE = "shade"
+RULE_DIFFUSE = "diffuse"
+RULE_DEFAULT = "default"
+
+# Reasons a computed target is not sent, as reported by skip_reason()
+SKIP_DELTA_POSITION = "delta_position"
+SKIP_DELTA_TIME = "delta_time"
+# ... and before the rules run, as recorded in decision traces
+SKIP_AUTOMATION_OFF = "automation_off"
+SKIP_IN_MOTION = "in_motion"
+SKIP_NO_POSITION = "no_position"
+
+_UNKNOWN_STATES = (None, "", "unknown", "unavailable")
+
+# (hour start as UNIX seconds, direct sun, temperature) of one forecast entry
+ForecastHour = tuple[float, bool, float | None]
+FORECAST_HOUR = 3600.0
+
+
+def parse_forecast(items: Iterable[Mapping[str, Any]]) -> tuple[ForecastHour, ...]:
+    """Hourly entries of a `weather.get_forecasts` response, skipping malformed ones."""
+    hours: list[ForecastHour] = []
+    for item in items:
+        try:
+            ts = datetime.fromisoformat(str(item["datetime"])).timestamp()
+        except (KeyError, ValueError):
+            continue
+        temperature = item.get("temperature")
+        hours.append(
+            (
+                ts,
+                str(item.get("condition") or "").lower() in DIRECT_SUN_STATES,
+                float(temperature) if isinstance(temperature, int | float) else None,
+            )
+        )
+    hours.sort()
+    return tuple(hours)
+
+
+def forecast_peak(forecast: Sequence[ForecastHour], now: float, lookahead: float) -> float | None:
+    """Hottest temperature among the sunny hours overlapping [now, now + lookahead)."""
+    peak: float | None = None
+    for ts, sunny, temperature in forecast:
+        if ts >= now + lookahead:
+            break
+        if ts + FORECAST_HOUR > now and sunny and temperature is not None:
+            peak = temperature if peak is None else max(peak, temperature)
+    return peak
+
+
+def hot_ahead(cfg: CoverConfig, env: EnvSnapshot) -> bool:
+    """The forecast says it will be sunny and at least `t_max` soon."""
+    return env.forecast_peak is not None and env.forecast_peak >= cfg.t_max
+
+
+def build_snapshot(
+    get_state: Callable[[str], Any],
+    weather_entity: str | None,
+    now: float,
+    latitude: float,
+    longitude: float,
+    forecast: Sequence[ForecastHour] = (),
+    lookahead: float = 0.0,
+) -> EnvSnapshot:
+    """Resolve the inputs shared by every cover; `lookahead` (seconds) of `forecast` is used."""
+    sun = get_state(SUN_ENTITY)
+    elevation, azimuth = solar_position(now, latitude, longitude)
+
+    direct_sun = True
+    if weather_entity:
+        direct_sun = False
+        w = get_state(weather_entity)
+        if w:
+            direct_sun = (w.state or "").lower() in DIRECT_SUN_STATES
+
+    season_state = get_state(SEASON_ENTITY)
+
+    return EnvSnapshot(
+        sun_available=sun is not None,
+        elevation=elevation,
+        azimuth=azimuth,
+        direct_sun=direct_sun,
+        season=season_state.state if season_state else "intermediate",
+        is_night=sun is not None and sun.state == "below_horizon",
+        forecast_peak=forecast_peak(forecast, now, lookahead) if lookahead > 0 else None,
+    )
+
+
+def parse_temperature(state: Any) -> float | None:
+    try:
+        return float(state.state) if state and state.state not in _UNKNOWN_STATES else None
+    except Exception:
+        return None
+
+
+def parse_position(state: Any, invert: bool) -> int | None:
+    """Current position (before inversion) of a cover state, guessing from open/closed."""
+    if not state:
+        return None
+    pos = state.attributes.get("current_position")
+    if pos is None:
+        if state.state in ("open", "opening"):
+            pos = 100
+        elif state.state in ("closed", "closing"):
+            pos = 0
+        else:
+            return None
+    if invert:
+        pos = 100 - int(pos)
+    return int(pos)
+
+
+def clamp(value: int, low: int, high: int) -> int:
+    return min(high, max(low, int(value)))
+
+
+def sun_in_front(env: EnvSnapshot, window_azimuth: float, fov_half: float) -> bool:
+    return (
+        env.direct_sun
+        and env.elevation > 0
+        and angular_diff_deg(env.azimuth, float(window_azimuth)) <= float(fov_half)
+    )
+
+
+def cover_decision(cfg: CoverConfig, env: EnvSnapshot, too_hot: bool, too_cold: bool) -> tuple[int, str]:
+    """Target position (0-100, before inversion) for one cover, and the rule that chose it."""
+    if env.is_night:
+        return clamp(cfg.default_night, cfg.min_day, cfg.max_day), RULE_NIGHT
+    if not env.sun_available:
+        return cfg.default_day, RULE_NO_SUN
+
+    in_front = sun_in_front(env, cfg.window_azimuth, cfg.fov_half)
+    if env.season == WINTER:
+        if in_front and too_cold:
+            target, rule = cfg.max_day, RULE_WINTER_GAIN
+        elif not env.direct_sun:
+            target, rule = cfg.max_day, RULE_WINTER_DIFFUSE
+        else:
+            target, rule = max(cfg.default_day, WINTER_DIRECT_SUN_FLOOR), RULE_WINTER_DEFAULT
+    else:
+        if in_front and too_hot:
+            target, rule = cfg.min_day, RULE_SHADE
+        elif not env.direct_sun:
+            target, rule = max(cfg.default_day, SUMMER_DIFFUSE_FLOOR), RULE_DIFFUSE
+        else:
+            target, rule = cfg.default_day, RULE_DEFAULT
+
+    return clamp(target, cfg.min_day, cfg.max_day), rule
+
+
+def skip_reason(cfg: CoverConfig, last_move_ts: float, target: int, current: int, now: float) -> str | None:
+    """Why a move to `target` should not be sent now, or None to send it."""
+    if abs(int(target) - int(current)) < cfg.min_delta_position:
+        return SKIP_DELTA_POSITION
+    if last_move_ts and (now - last_move_ts) < cfg.min_delta_time:
+        return SKIP_DELTA_TIME
+    return None
+
+
+def send_position(target: int, invert: bool) -> int:
+    """Position as sent to the cover entity."""
+    return 100 - target if invert else target
+
+
+class CoverTable:
+    """The configured covers in row order, and each cover's row."""
+
+    def __init__(self, configs: Iterable[CoverConfig]) -> None:
+        self.configs: list[CoverConfig] = list(configs)
+        self.row: dict[str, int] = {cfg.cover_entity: i for i, cfg in enumerate(self.configs)}
+
+    def __len__(self) -> int:
+        return len(self.configs)
@@ -0,0 +1,113 @@
+"""In-process performance counters of one SCS entry.
+
+The coordinator updates these in place on its hot paths (plain integer adds
+and one array store per sample). `snapshot()` turns them into published values
+and starts a new window; it runs on the sensor publish interval, never per
+event.
+"""
+
+from __future__ import annotations
+
+from array import array
+
+SAMPLE_SIZE = 256  # latest samples kept for percentiles
+MOVE_BUCKETS = 60  # one-minute buckets of the moves-per-hour window
+
+
+def _percentile(sorted_values: list[float], pct: float) -> float:
+    idx = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[idx]
+
+
+class Samples:
+    """Fixed-size ring of float samples."""
+
+    __slots__ = ("_data", "_next", "_count")
+
+    def __init__(self, size: int = SAMPLE_SIZE) -> None:
+        self._data = array("d", bytes(8 * size))
+        self._next = 0
+        self._count = 0
+
+    def add(self, value: float) -> None:
+        self._data[self._next] = value
+        self._next = (self._next + 1) % len(self._data)
+        if self._count < len(self._data):
+            self._count += 1
+
+    def percentiles(self, *pcts: float) -> tuple[float | None, ...]:
+        if not self._count:
+            return (None,) * len(pcts)
+        values = sorted(self._data[: self._count])
+        return tuple(_percentile(values, p) for p in pcts)
+
+
+class SCSMetrics:
+    __slots__ = (
+        "tick_seconds",
+        "call_seconds",
+        "ticks",
+        "covers_evaluated",
+        "covers_skipped",
+        "overrides",
+        "listener_events",
+        "listener_relevant",
+        "_move_buckets",
+        "_move_minute",
+    )
+
+    def __init__(self) -> None:
+        self.tick_seconds = Samples()
+        self.call_seconds = Samples()
+        # window counters, reset by snapshot()
+        self.ticks = 0
+        self.covers_evaluated = 0
+        self.covers_skipped = 0
+        # running totals
+        self.overrides = 0
+        self.listener_events = 0
+        self.listener_relevant = 0
+        self._move_buckets = array("l", bytes(array("l").itemsize * MOVE_BUCKETS))
+        self._move_minute = 0
+
+    def record_tick(self, seconds: float, evaluated: int, skipped: int) -> None:
+        self.tick_seconds.add(seconds)
+        self.ticks += 1
+        self.covers_evaluated += evaluated
+        self.covers_skipped += skipped
+
+    def record_call(self, seconds: float, moves: int, now: float) -> None:
+        """One set_cover_position call: how long it blocked until handled, and how many covers it moved."""
+        self.call_seconds.add(seconds)
+        self._roll(now)
+        self._move_buckets[self._move_minute % MOVE_BUCKETS] += moves
+
+    def _roll(self, now: float) -> None:
+        """Clear the buckets of minutes that passed without moves."""
+        minute = int(now // 60)
+        if minute == self._move_minute:
+            return
+        for m in range(max(self._move_minute + 1, minute - MOVE_BUCKETS + 1), minute + 1):
+            self._move_buckets[m % MOVE_BUCKETS] = 0
+        self._move_minute = minute
+
+    def snapshot(self, now: float, covers: int) -> dict[str, float | int | None]:
+        """Values to publish; per-tick averages cover the window since the previous snapshot."""
+        self._roll(now)
+        tick_p50, tick_p95 = self.tick_seconds.percentiles(50, 95)
+        call_p50, call_p95 = self.call_seconds.percentiles(50, 95)
+        ticks = self.ticks
+        values = {
+            "tick_p50": None if tick_p50 is None else round(tick_p50 * 1000, 3),
+            "tick_p95": None if tick_p95 is None else round(tick_p95 * 1000, 3),
+            "covers_evaluated": round(self.covers_evaluated / ticks, 1) if ticks else 0,
+            "covers_skipped": round(self.covers_skipped / ticks, 1) if ticks else 0,
+            "call_latency_p50": None if call_p50 is None else round(call_p50 * 1000, 3),
+            "call_latency_p95": None if call_p95 is None else round(call_p95 * 1000, 3),
+            "moves_per_cover_hour": round(sum(self._move_buckets) / covers, 2) if covers else 0,
+            "overrides": self.overrides,
+            "listener_events": self.listener_events,
+            "listener_relevant": self.listener_relevant,
+        }
+        self.ticks = self.covers_evaluated = self.covers_skipped = 0
+        return values
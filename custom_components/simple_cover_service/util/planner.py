@@ -0,0 +1,169 @@
+"""Daily target plan: predicted sun geometry of one day, and lookups into it.
+
+Over a day the only inputs of the decision rules that change on their own are
+the sun's position and the day/night boundary; both follow from the
+ephemeris. `build_day_plan` computes, once per day, the daylight intervals and
+for every window geometry the intervals during which the sun is inside its
+field of view (edges exact to about a second). `load_day_plan` slices the same
+intervals out of the whole-year tables of the on-disk exposure cache instead.
+`shift_daylight` moves sunrise and sunset by the configured offsets; the
+resulting day/night changes are the plan's `transitions`.
+
+Everything else (season, direct sun, too hot/too cold) forms the *regime*. For
+one regime a cover has only three possible targets, for night, sun in front
+and sun elsewhere; `regime_targets` resolves them through the normal rules.
+A tick then only has to look up which of the three applies now, and
+`cover_timeline` lists the targets a cover will go through for the rest of
+the day if the regime holds.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+
+from ..models import CoverConfig, EnvSnapshot
+from .exposure_cache import load_year
+from .facades import Geometry
+from .kernel import cover_decision
+from .sun_math import daylight_intervals, exposure_intervals
+
+Intervals = list[tuple[float, float]]
+
+# (season, direct_sun, sun_available, too_hot, too_cold)
+Regime = tuple[str, bool, bool, bool, bool]
+
+NIGHT, FRONT, ELSEWHERE = 0, 1, 2
+
+
+def geometry_of(cfg: CoverConfig) -> Geometry:
+    return float(cfg.window_azimuth), float(cfg.fov_half)
+
+
+def in_intervals(intervals: Intervals, ts: float) -> bool:
+    """True when ts lies in one of the sorted, disjoint [opened, closed) intervals."""
+    i = bisect_right(intervals, (ts, float("inf"))) - 1
+    return i >= 0 and ts < intervals[i][1]
+
+
+@dataclass(slots=True)
+class DayPlan:
+    start: float
+    end: float
+    daylight: Intervals
+    exposure: dict[Geometry, Intervals] = field(default_factory=dict)
+
+    def covers(self, ts: float) -> bool:
+        return self.start <= ts < self.end
+
+    def exposed(self, geometry: Geometry, ts: float) -> bool:
+        return in_intervals(self.exposure.get(geometry, []), ts)
+
+    def is_night(self, ts: float) -> bool:
+        return not in_intervals(self.daylight, ts)
+
+    def transitions(self) -> list[float]:
+        """Instants of the day at which night ends or begins."""
+        return sorted(ts for interval in self.daylight for ts in interval if self.start < ts < self.end)
+
+    def edges(self) -> list[tuple[float, list[Geometry]]]:
+        """Sorted instants at which some geometry's sun exposure starts or stops."""
+        edges: dict[float, list[Geometry]] = {}
+        for geometry, intervals in self.exposure.items():
+            for opened, closed in intervals:
+                for ts in (opened, closed):
+                    if self.start < ts < self.end:
+                        edges.setdefault(ts, []).append(geometry)
+        return sorted(edges.items())
+
+
+def build_day_plan(
+    geometries: Iterable[Geometry], start: float, end: float, latitude: float, longitude: float
+) -> DayPlan:
+    """Daylight and per-geometry exposure intervals for [start, end). CPU bound, run in an executor."""
+    plan = DayPlan(start, end, daylight_intervals(start, end, latitude, longitude))
+    for window_azimuth, fov_half in set(geometries):
+        plan.exposure[(window_azimuth, fov_half)] = exposure_intervals(
+            start, end, latitude, longitude, window_azimuth, fov_half
+        )
+    return plan
+
+
+def load_day_plan(
+    directory: str,
+    geometries: Iterable[Geometry],
+    start: float,
+    end: float,
+    latitude: float,
+    longitude: float,
+) -> DayPlan:
+    """Like `build_day_plan`, from the exposure cache in `directory`. Does I/O, run in an executor."""
+    year = datetime.fromtimestamp((start + end) / 2, UTC).year
+    daylight, tables = load_year(directory, geometries, latitude, longitude, year)
+    plan = DayPlan(start, end, daylight.intervals(start, end))
+    for geometry, table in tables.items():
+        plan.exposure[geometry] = table.intervals(start, end)
+    return plan
+
+
+def shift_daylight(plan: DayPlan, sunrise_offset: float, sunset_offset: float) -> Intervals:
+    """Daylight with sunrise and sunset moved by the offsets (seconds, positive = later).
+
+    Interval ends at the plan's bounds are midnight, not sunrise or sunset, and stay put.
+    """
+    shifted: Intervals = []
+    for opened, closed in plan.daylight:
+        if opened > plan.start:
+            opened = max(plan.start, opened + sunrise_offset)
+        if closed < plan.end:
+            closed = min(plan.end, closed + sunset_offset)
+        if opened < closed:
+            shifted.append((opened, closed))
+    return shifted
+
+
+def regime_of(env: EnvSnapshot, too_hot: bool, too_cold: bool) -> Regime:
+    return env.season, env.direct_sun, env.sun_available, too_hot, too_cold
+
+
+def regime_targets(cfg: CoverConfig, regime: Regime) -> tuple[tuple[int, str], ...]:
+    """(target, rule) for night, sun in front and sun elsewhere, under one regime."""
+    season, direct_sun, sun_available, too_hot, too_cold = regime
+    az = float(cfg.window_azimuth)
+    # synthetic snapshots that put the sun in front of / behind the window
+    front = EnvSnapshot(sun_available, 45.0, az, direct_sun, season, False)
+    behind = EnvSnapshot(sun_available, 45.0, (az + 180.0) % 360.0, direct_sun, season, False)
+    night = EnvSnapshot(sun_available, -10.0, az, direct_sun, season, True)
+    return (
+        cover_decision(cfg, night, too_hot, too_cold),
+        cover_decision(cfg, front, too_hot, too_cold),
+        cover_decision(cfg, behind, too_hot, too_cold),
+    )
+
+
+def sun_case(plan: DayPlan, geometry: Geometry, ts: float, is_night: bool) -> int:
+    """Which of the regime targets applies at ts (NIGHT, FRONT or ELSEWHERE)."""
+    if is_night:
+        return NIGHT
+    return FRONT if plan.exposed(geometry, ts) else ELSEWHERE
+
+
+def cover_timeline(
+    cfg: CoverConfig, plan: DayPlan, regime: Regime, since: float
+) -> list[tuple[float, int, str]]:
+    """(from, target, rule) for the rest of the plan's day, assuming the regime holds."""
+    targets = regime_targets(cfg, regime)
+    geometry = geometry_of(cfg)
+
+    bounds = {since}
+    for opened, closed in (*plan.daylight, *plan.exposure.get(geometry, [])):
+        bounds.update((opened, closed))
+
+    timeline: list[tuple[float, int, str]] = []
+    for ts in sorted(b for b in bounds if since <= b < plan.end):
+        target, rule = targets[sun_case(plan, geometry, ts, plan.is_night(ts))]
+        if not timeline or timeline[-1][1:] != (target, rule):
+            timeline.append((ts, target, rule))
+    return timeline
@@ -0,0 +1,209 @@
+"""Offline replay of recorded history through the SCS decision rules.
+
+    python -m custom_components.simple_cover_service.util.replay history.jsonl \\
+        --options options.json --latitude 41.39 --longitude 2.17
+
+The history is a recorder export, either JSONL with one
+`{"entity_id", "state", "attributes", "last_changed"}` object per line or the
+CSV download of the history panel (`entity_id,state,last_changed`).
+`last_changed` may be an ISO timestamp or UNIX seconds. The options file holds
+the config entry options (`{"global": {...}, "covers": {entity: {...}}}`; the
+list form of older versions is accepted too).
+
+Covers are evaluated at every recorded change, at every (offset) sunrise and
+sunset and at least every `--step` seconds, using the same snapshot,
+temperature filters, rules and min-delta checks as the live coordinator. Like
+the coordinator, night runs from sunset to sunrise moved by the configured
+offsets rather than following sun.sun. Commanded moves are assumed to complete
+instantly; recorded cover positions still overwrite the simulated ones when
+they appear. Manual override detection is not simulated.
+"""
+
+from __future__ import annotations
+
+import argparse
+from collections.abc import Iterable
+import csv
+from dataclasses import dataclass, field, replace
+from datetime import datetime
+import json
+import sys
+from typing import Any
+
+from ..const import CONF_COVERS, CONF_GLOBAL
+from ..models import CoverConfig, GlobalConfig
+from .filters import TemperatureInput
+from .kernel import build_snapshot, cover_decision, parse_position, parse_temperature, send_position, skip_reason
+from .planner import DayPlan, build_day_plan, shift_daylight
+
+
+@dataclass
+class ReplayState:
+    state: str
+    attributes: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class ReplayResult:
+    # (timestamp, cover_entity, target before inversion)
+    moves: list[tuple[float, str, int]] = field(default_factory=list)
+    moves_per_cover: dict[str, int] = field(default_factory=dict)
+    # cover_entity -> rule branch -> seconds spent in it
+    regime_seconds: dict[str, dict[str, float]] = field(default_factory=dict)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "moves": len(self.moves),
+            "moves_per_cover": self.moves_per_cover,
+            "regime_seconds": self.regime_seconds,
+        }
+
+
+HistoryRow = tuple[float, str, str, dict[str, Any]]
+
+
+def _parse_ts(value: Any) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return datetime.fromisoformat(str(value).replace("Z", "+00:00")).timestamp()
+
+
+def load_history(path: str) -> list[HistoryRow]:
+    """Read a JSONL or CSV export into (timestamp, entity_id, state, attributes) rows."""
+    rows: list[HistoryRow] = []
+    with open(path, encoding="utf-8", newline="") as fh:
+        if path.endswith(".csv"):
+            for rec in csv.DictReader(fh):
+                rows.append((_parse_ts(rec["last_changed"]), rec["entity_id"], rec["state"], {}))
+        else:
+            for line in fh:
+                if not line.strip():
+                    continue
+                rec = json.loads(line)
+                rows.append(
+                    (_parse_ts(rec["last_changed"]), rec["entity_id"], rec["state"], rec.get("attributes") or {})
+                )
+    rows.sort(key=lambda r: r[0])
+    return rows
+
+
+def _day_plan(ts: float, global_cfg: GlobalConfig, latitude: float, longitude: float) -> DayPlan:
+    """Offset daylight of the solar day around `ts` (midnight to midnight, local mean solar time)."""
+    solar_midnight = -longitude / 360 * 86400
+    start = solar_midnight + (ts - solar_midnight) // 86400 * 86400
+    plan = build_day_plan((), start, start + 86400, latitude, longitude)
+    plan.daylight = shift_daylight(plan, global_cfg.sunrise_offset * 60, global_cfg.sunset_offset * 60)
+    return plan
+
+
+def replay(
+    history: Iterable[HistoryRow],
+    global_cfg: GlobalConfig,
+    covers: dict[str, CoverConfig],
+    latitude: float,
+    longitude: float,
+    step: float = 300.0,
+) -> ReplayResult:
+    """Run the recorded timeline through the decision rules, faster than real time."""
+    rows = list(history)
+    result = ReplayResult(
+        moves_per_cover={c: 0 for c in covers},
+        regime_seconds={c: {} for c in covers},
+    )
+    if not rows:
+        return result
+
+    states: dict[str, ReplayState] = {}
+    last_move: dict[str, float] = dict.fromkeys(covers, 0.0)
+    regime: dict[str, tuple[str, float]] = {}
+    temps = {c: TemperatureInput(cfg) for c, cfg in covers.items()}
+    temp_covers: dict[str, list[str]] = {}
+    for cover_entity, cfg in covers.items():
+        for sensor in cfg.temp_sensors:
+            temp_covers.setdefault(sensor, []).append(cover_entity)
+
+    plan = _day_plan(rows[0][0], global_cfg, latitude, longitude)
+
+    def plan_for(now: float) -> DayPlan:
+        nonlocal plan
+        if not plan.covers(now):
+            plan = _day_plan(now, global_cfg, latitude, longitude)
+        return plan
+
+    def evaluate(now: float) -> None:
+        env = build_snapshot(states.get, global_cfg.weather_entity, now, latitude, longitude)
+        if plan_for(now).is_night(now) != env.is_night:
+            env = replace(env, is_night=not env.is_night)
+        for cover_entity, cfg in covers.items():
+            temp = temps[cover_entity]
+            target, rule = cover_decision(cfg, env, temp.hot, temp.cold)
+
+            prev = regime.get(cover_entity)
+            if prev is None or prev[0] != rule:
+                if prev is not None:
+                    spent = result.regime_seconds[cover_entity]
+                    spent[prev[0]] = spent.get(prev[0], 0.0) + now - prev[1]
+                regime[cover_entity] = (rule, now)
+
+            cur = parse_position(states.get(cover_entity), cfg.invert_position)
+            if cur is None or skip_reason(cfg, last_move[cover_entity], target, cur, now):
+                continue
+
+            last_move[cover_entity] = now
+            states[cover_entity] = ReplayState("open", {"current_position": send_position(target, cfg.invert_position)})
+            result.moves.append((now, cover_entity, target))
+            result.moves_per_cover[cover_entity] += 1
+
+    i, n = 0, len(rows)
+    now, end = rows[0][0], rows[-1][0]
+    while True:
+        while i < n and rows[i][0] <= now:
+            _ts, entity_id, state, attributes = rows[i]
+            states[entity_id] = ReplayState(state, attributes)
+            for cover_entity in temp_covers.get(entity_id, ()):
+                temps[cover_entity].update(entity_id, parse_temperature(states[entity_id]))
+            i += 1
+        evaluate(now)
+        if now >= end:
+            break
+        day = plan_for(now)
+        # the next offset sunrise/sunset, or the end of the day
+        transition = next((ts for ts in day.transitions() if ts > now), day.end)
+        now = min(now + step, rows[i][0] if i < n else end, transition)
+
+    for cover_entity, (rule, since) in regime.items():
+        spent = result.regime_seconds[cover_entity]
+        spent[rule] = spent.get(rule, 0.0) + end - since
+    return result
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("history", help="recorder export (.jsonl or .csv)")
+    parser.add_argument("--options", required=True, help="config entry options as JSON")
+    parser.add_argument("--latitude", type=float, required=True)
+    parser.add_argument("--longitude", type=float, required=True)
+    parser.add_argument("--step", type=float, default=300.0, help="max seconds between evaluations")
+    parser.add_argument("--moves-csv", help="also write every move to this CSV file")
+    args = parser.parse_args(argv)
+
+    with open(args.options, encoding="utf-8") as fh:
+        options = json.load(fh)
+    global_cfg = GlobalConfig.from_options(options.get(CONF_GLOBAL, {}))
+    covers = CoverConfig.all_from_options(options.get(CONF_COVERS, {}))
+
+    result = replay(load_history(args.history), global_cfg, covers, args.latitude, args.longitude, args.step)
+
+    if args.moves_csv:
+        with open(args.moves_csv, "w", encoding="utf-8", newline="") as fh:
+            writer = csv.writer(fh)
+            writer.writerow(["timestamp", "cover_entity", "target"])
+            writer.writerows(result.moves)
+    json.dump(result.as_dict(), sys.stdout, indent=2)
+    sys.stdout.write("\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
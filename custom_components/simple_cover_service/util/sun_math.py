@@ -1,7 +1,137 @@
 from __future__ import annotations
 
+from collections.abc import Callable
+from math import acos, asin, atan2, cos, degrees, radians, sin, tan
+
+# Apparent sunrise/sunset elevation (refraction and solar radius), as used by sun.sun
+SUN_HORIZON = -0.833
+
 
 def angular_diff_deg(a: float, b: float) -> float:
     """Minimal absolute difference between two azimuth angles in degrees."""
     d = abs(a - b) % 360.0
     return d if d <= 180.0 else 360.0 - d
+
+
+def solar_position(ts: float, latitude: float, longitude: float) -> tuple[float, float]:
+    """Sun (elevation, azimuth) in degrees at a UNIX timestamp.
+
+    NOAA solar calculator equations, without atmospheric refraction. Azimuth is
+    measured clockwise from north, like the `sun.sun` attribute.
+    """
+    jc = (ts / 86400.0 + 2440587.5 - 2451545.0) / 36525.0
+
+    mean_long = (280.46646 + jc * (36000.76983 + jc * 0.0003032)) % 360.0
+    mean_anom = radians(357.52911 + jc * (35999.05029 - 0.0001537 * jc))
+    ecc = 0.016708634 - jc * (0.000042037 + 0.0000001267 * jc)
+    center = (
+        sin(mean_anom) * (1.914602 - jc * (0.004817 + 0.000014 * jc))
+        + sin(2 * mean_anom) * (0.019993 - 0.000101 * jc)
+        + sin(3 * mean_anom) * 0.000289
+    )
+    omega = radians(125.04 - 1934.136 * jc)
+    app_long = radians(mean_long + center - 0.00569 - 0.00478 * sin(omega))
+    obliq = radians(
+        23.0 + (26.0 + (21.448 - jc * (46.815 + jc * (0.00059 - jc * 0.001813))) / 60.0) / 60.0
+        + 0.00256 * cos(omega)
+    )
+    decl = asin(sin(obliq) * sin(app_long))
+
+    y = tan(obliq / 2) ** 2
+    l0 = radians(mean_long)
+    eq_time = 4 * degrees(
+        y * sin(2 * l0)
+        - 2 * ecc * sin(mean_anom)
+        + 4 * ecc * y * sin(mean_anom) * cos(2 * l0)
+        - 0.5 * y * y * sin(4 * l0)
+        - 1.25 * ecc * ecc * sin(2 * mean_anom)
+    )
+
+    true_solar_min = ((ts % 86400.0) / 60.0 + eq_time + 4 * longitude) % 1440.0
+    hour_angle = radians(true_solar_min / 4.0 - 180.0)
+    lat = radians(latitude)
+
+    cos_zenith = sin(lat) * sin(decl) + cos(lat) * cos(decl) * cos(hour_angle)
+    elevation = 90.0 - degrees(acos(max(-1.0, min(1.0, cos_zenith))))
+    azimuth = (
+        degrees(atan2(sin(hour_angle), cos(hour_angle) * sin(lat) - tan(decl) * cos(lat))) + 180.0
+    ) % 360.0
+    return elevation, azimuth
+
+
+def sun_in_fov(
+    ts: float, latitude: float, longitude: float, window_azimuth: float, fov_half: float
+) -> bool:
+    """True when the sun is above the horizon and inside the window's field of view."""
+    elev, az = solar_position(ts, latitude, longitude)
+    return elev > 0 and angular_diff_deg(az, window_azimuth) <= fov_half
+
+
+def _intervals(
+    inside: Callable[[float], bool], start: float, end: float, step: float, tol: float
+) -> list[tuple[float, float]]:
+    """Intervals within [start, end) where `inside` holds, edges refined by bisection."""
+
+    def edge(lo: float, hi: float, lo_state: bool) -> float:
+        while hi - lo > tol:
+            mid = (lo + hi) / 2
+            if inside(mid) == lo_state:
+                lo = mid
+            else:
+                hi = mid
+        return hi
+
+    intervals: list[tuple[float, float]] = []
+    t = start
+    state = inside(t)
+    opened = start if state else None
+    while t < end:
+        nxt = min(t + step, end)
+        nxt_state = inside(nxt) if nxt < end else state
+        if nxt_state != state:
+            ts = edge(t, nxt, state)
+            if nxt_state:
+                opened = ts
+            else:
+                intervals.append((opened, ts))
+                opened = None
+            state = nxt_state
+        t = nxt
+    if opened is not None:
+        intervals.append((opened, end))
+    return intervals
+
+
+def exposure_intervals(
+    start: float,
+    end: float,
+    latitude: float,
+    longitude: float,
+    window_azimuth: float,
+    fov_half: float,
+    step: float = 300.0,
+    tol: float = 1.0,
+) -> list[tuple[float, float]]:
+    """Intervals within [start, end) during which the sun shines into the window.
+
+    Interval edges are the instants the sun enters or leaves the field of view
+    or crosses the horizon while inside it. The day is sampled every `step`
+    seconds and each change is refined by bisection to within `tol` seconds;
+    edges are reported as the first instant of the new state.
+    """
+    return _intervals(
+        lambda t: sun_in_fov(t, latitude, longitude, window_azimuth, fov_half), start, end, step, tol
+    )
+
+
+def daylight_intervals(
+    start: float,
+    end: float,
+    latitude: float,
+    longitude: float,
+    horizon: float = SUN_HORIZON,
+    step: float = 300.0,
+    tol: float = 1.0,
+) -> list[tuple[float, float]]:
+    """Intervals within [start, end) during which the sun is above `horizon` (sunrise to sunset)."""
+    return _intervals(lambda t: solar_position(t, latitude, longitude)[0] > horizon, start, end, step, tol)
@@ -0,0 +1,50 @@
+"""Per-cover decision trace, kept for covers with `debug` enabled."""
+
+from __future__ import annotations
+
+from typing import Any, NamedTuple
+
+TRACE_SIZE = 200
+
+
+class TraceRecord(NamedTuple):
+    ts: float
+    season: str | None
+    direct_sun: bool | None
+    is_night: bool | None
+    elevation: float | None
+    azimuth: float | None
+    temperature: float | None
+    too_hot: bool
+    too_cold: bool
+    forecast_peak: float | None
+    in_front: bool | None
+    rule: str | None
+    target: int | None
+    current: int | None
+    skip: str | None  # None: the move was queued
+
+
+class DecisionTrace:
+    """Fixed-size ring buffer of the last TRACE_SIZE evaluations of one cover."""
+
+    __slots__ = ("_records", "_next", "_count")
+
+    def __init__(self, size: int = TRACE_SIZE) -> None:
+        self._records: list[TraceRecord | None] = [None] * size
+        self._next = 0
+        self._count = 0
+
+    def record(self, rec: TraceRecord) -> None:
+        self._records[self._next] = rec
+        self._next = (self._next + 1) % len(self._records)
+        self._count = min(self._count + 1, len(self._records))
+
+    def as_list(self) -> list[dict[str, Any]]:
+        """Recorded evaluations, oldest first."""
+        size = len(self._records)
+        start = (self._next - self._count) % size
+        return [self._records[(start + i) % size]._asdict() for i in range(self._count)]
+
+    def __len__(self) -> int:
+        return self._count
@@ -0,0 +1,97 @@
+"""Learned travel speed of one cover, and its estimated position while moving.
+
+Each commanded move is remembered (`begin`) with where the cover started, so
+that when it reports arrival (`arrive`) the seconds per percent of that move
+update a running average for its direction. With a speed known for the
+direction, the cover's arrival time is predicted, so the coordinator looks
+again when the move should be done instead of after the move timeout, and its
+position in flight is interpolated (shown in diagnostics). Covers that only
+report open/closed are decided from the estimate. Positions are 0-100 before
+inversion, like targets.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+TRAVEL_ALPHA = 0.3  # weight of the newest observed move
+TRAVEL_MIN_SPAN = 5  # % moved for the timing to count
+TRAVEL_MIN_RATE = 0.01  # s/% below which a reading is not a real move
+TRAVEL_MAX_RATE = 10.0  # s/% above which a reading is not a real move
+
+
+class TravelModel:
+    __slots__ = ("up", "down", "samples", "_flight", "_arrived")
+
+    def __init__(self) -> None:
+        # seconds per percent when opening (up) and closing (down), once learned
+        self.up: float | None = None
+        self.down: float | None = None
+        self.samples = 0
+        # (started, from, to) of the last commanded move, and whether it arrived
+        self._flight: tuple[float, int | None, int] | None = None
+        self._arrived = False
+
+    def rate(self, start: int, end: int) -> float | None:
+        return self.up if end > start else self.down
+
+    def begin(self, now: float, start: int | None, target: int) -> float | None:
+        """Remember a command; return its predicted arrival when the speed is known."""
+        self._flight = (now, start, target)
+        self._arrived = False
+        return self.arrival()
+
+    def arrival(self) -> float | None:
+        if self._flight is None:
+            return None
+        started, start, target = self._flight
+        if start is None or (rate := self.rate(start, target)) is None:
+            return None
+        return started + abs(target - start) * rate
+
+    @property
+    def moving(self) -> bool:
+        return self._flight is not None and not self._arrived
+
+    def arrive(self, now: float) -> None:
+        """The last commanded move reached its target: learn from its timing."""
+        if not self.moving:
+            return
+        self._arrived = True
+        started, start, target = self._flight
+        if start is None or abs(target - start) < TRAVEL_MIN_SPAN:
+            return
+        rate = (now - started) / abs(target - start)
+        if not TRAVEL_MIN_RATE <= rate <= TRAVEL_MAX_RATE:
+            return
+        if target > start:
+            self.up = rate if self.up is None else self.up + TRAVEL_ALPHA * (rate - self.up)
+        else:
+            self.down = rate if self.down is None else self.down + TRAVEL_ALPHA * (rate - self.down)
+        self.samples += 1
+
+    def cancel(self) -> None:
+        """Something else moved the cover: forget the last command."""
+        self._flight = None
+        self._arrived = False
+
+    def position(self, now: float) -> int | None:
+        """Estimated position after the last command (its target once arrived or due), or None if unknown."""
+        if self._flight is None:
+            return None
+        started, start, target = self._flight
+        if self._arrived:
+            return target
+        if (arrival := self.arrival()) is None:
+            return None
+        if now >= arrival:
+            return target
+        return round(start + (target - start) * (now - started) / (arrival - started))
+
+    def as_dict(self) -> dict[str, Any]:
+        return {"up": self.up, "down": self.down, "samples": self.samples}
+
+    def restore(self, data: dict[str, Any]) -> None:
+        self.up = data.get("up")
+        self.down = data.get("down")
+        self.samples = int(data.get("samples", 0))
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from custom_components.simple_cover_service.config_flow import _validate_covers
+from custom_components.simple_cover_service.util.bulk import dump_covers, parse_covers
+
+COVER = {"cover_entity": "cover.a", "temp_sensor": "sensor.a", "window_azimuth": 180}
+
+
+def test_json_list_and_mapping():
+    assert parse_covers(json.dumps([COVER])) == [COVER]
+    mapping = {"cover.a": {k: v for k, v in COVER.items() if k != "cover_entity"}}
+    assert parse_covers(json.dumps(mapping)) == [COVER]
+
+
+def test_csv():
+    text = "cover_entity,temp_sensor,window_azimuth,extra_temp_sensors,invert_position,fov_half\n"
+    text += "cover.a,sensor.a,180,sensor.b; sensor.c,yes,\n"
+    (cover,) = parse_covers(text)
+    assert cover == {
+        "cover_entity": "cover.a",
+        "temp_sensor": "sensor.a",
+        "window_azimuth": "180",
+        "extra_temp_sensors": ["sensor.b", "sensor.c"],
+        "invert_position": True,
+    }
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "cover_entity,temp_sensor,invert_position\ncover.a,sensor.a,maybe\n",
+        "cover_entity,temp_sensor\ncover.a,sensor.a,extra\n",
+        "[1, 2]",
+        "{not json",
+        "cover.a: 5",
+    ],
+)
+def test_malformed_text(text):
+    with pytest.raises(ValueError):
+        parse_covers(text)
+
+
+def test_dump_round_trip():
+    covers = _validate_covers(None, json.dumps([COVER, {**COVER, "cover_entity": "cover.b"}]))
+    assert _validate_covers(None, dump_covers(covers)) == covers
+
+
+def test_validate_fills_defaults():
+    covers = _validate_covers(None, json.dumps([COVER]))
+    assert covers["cover.a"]["fov_half"] == 70
+    assert covers["cover.a"]["extra_temp_sensors"] == []
+
+
+@pytest.mark.parametrize(
+    ("covers", "message"),
+    [
+        ([{**COVER, "window_azimuth": 400}], "cover.a"),
+        ([{**COVER, "cover_entity": "light.a"}], "light.a"),
+        ([{k: v for k, v in COVER.items() if k != "temp_sensor"}], "cover.a"),
+        ([COVER, COVER], "more than once"),
+        ([], "no covers"),
+    ],
+)
+def test_validate_rejects(covers, message):
+    with pytest.raises(ValueError, match=message):
+        _validate_covers(None, json.dumps(covers))
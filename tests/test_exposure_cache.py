@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import os
+
+from custom_components.simple_cover_service.util.exposure_cache import (
+    KIND_DAYLIGHT,
+    KIND_EXPOSURE,
+    _compute,
+    load_table,
+    load_year,
+    year_bounds,
+)
+from custom_components.simple_cover_service.util.sun_math import SUN_HORIZON
+
+LAT, LON = 41.39, 2.17
+YEAR = 2024
+
+
+def test_round_trip(tmp_path):
+    directory = str(tmp_path)
+    built = load_table(directory, KIND_EXPOSURE, LAT, LON, 180.0, 70.0, YEAR)
+    (name,) = os.listdir(directory)
+    mapped = load_table(directory, KIND_EXPOSURE, LAT, LON, 180.0, 70.0, YEAR)
+    assert os.listdir(directory) == [name]  # read back, not rebuilt
+
+    expected = _compute(KIND_EXPOSURE, LAT, LON, 180.0, 70.0, YEAR)
+    assert list(built._edges) == expected
+    assert list(mapped._edges) == expected
+    assert len(expected) % 2 == 0
+
+    start, end = year_bounds(YEAR)
+    intervals = mapped.intervals(start, end)
+    assert [ts for interval in intervals for ts in interval] == expected
+    for opened, closed in intervals[:50]:
+        assert mapped.inside(opened) and mapped.inside((opened + closed) / 2)
+        assert not mapped.inside(closed)
+
+
+def test_intervals_are_clipped(tmp_path):
+    table = load_table(str(tmp_path), KIND_DAYLIGHT, LAT, LON, SUN_HORIZON, 0.0, YEAR)
+    start, _end = year_bounds(YEAR)
+    noon = start + 86400 * 170 + 12 * 3600  # in daylight
+    (interval,) = table.intervals(noon, noon + 60)
+    assert interval == (noon, noon + 60)
+
+
+def test_corrupt_file_is_rebuilt(tmp_path):
+    directory = str(tmp_path)
+    load_table(directory, KIND_DAYLIGHT, LAT, LON, SUN_HORIZON, 0.0, YEAR)
+    (name,) = os.listdir(directory)
+    path = os.path.join(directory, name)
+    with open(path, "r+b") as fh:
+        fh.truncate(os.path.getsize(path) - 8)
+    table = load_table(directory, KIND_DAYLIGHT, LAT, LON, SUN_HORIZON, 0.0, YEAR)
+    assert list(table._edges) == _compute(KIND_DAYLIGHT, LAT, LON, SUN_HORIZON, 0.0, YEAR)
+
+
+def test_location_selects_another_file_and_old_years_are_pruned(tmp_path):
+    directory = str(tmp_path)
+    load_year(directory, [(180.0, 70.0)], LAT, LON, YEAR - 2)
+    load_year(directory, [(180.0, 70.0)], LAT + 1, LON, YEAR - 2)
+    assert len(os.listdir(directory)) == 4
+    load_year(directory, [], LAT, LON, YEAR)
+    assert all(name.startswith(f"{YEAR}-") for name in os.listdir(directory))
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import random
+
+from custom_components.simple_cover_service.models import CoverConfig
+from custom_components.simple_cover_service.util.facades import FacadeIndex
+from custom_components.simple_cover_service.util.sun_math import angular_diff_deg
+
+
+def _cover(i: int, azimuth: float, fov: float) -> CoverConfig:
+    return CoverConfig(f"cover.c{i}", f"sensor.t{i}", azimuth, fov_half=fov)
+
+
+def _brute_force(index: FacadeIndex, azimuth: float) -> frozenset:
+    return frozenset(g for g in index.groups if angular_diff_deg(azimuth, g[0]) <= g[1])
+
+
+def test_facing_matches_brute_force():
+    rng = random.Random(42)
+    configs = [
+        _cover(i, float(rng.randint(0, 359)) if i % 3 else rng.uniform(0, 360), rng.choice((10, 45, 70, 90, 180)))
+        for i in range(300)
+    ]
+    index = FacadeIndex(configs)
+    # interval endpoints are where an index goes wrong: query them exactly
+    probes = [(az + sign * fov) % 360 for az, fov in index.groups for sign in (-1, 1)]
+    probes += [rng.uniform(0, 360) for _ in range(2000)]
+    probes += [0.0, 360.0, 359.999, -10.0, 720.5]
+    for azimuth in probes:
+        assert index.facing(azimuth) == _brute_force(index, azimuth % 360.0), azimuth
+
+
+def test_groups_share_a_facade():
+    index = FacadeIndex([_cover(0, 180, 70), _cover(1, 180, 70), _cover(2, 90, 45)])
+    assert len(index) == 2
+    assert index.groups[(180.0, 70.0)] == [0, 1]
+    assert index.facing(180) == {(180.0, 70.0)}
+    assert index.facing(0) == frozenset()
+
+
+def test_empty_index():
+    assert FacadeIndex([]).facing(123.0) == frozenset()
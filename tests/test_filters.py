@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from custom_components.simple_cover_service.models import CoverConfig
+from custom_components.simple_cover_service.util.filters import TemperatureInput
+
+
+def _input(**kwargs) -> TemperatureInput:
+    return TemperatureInput(CoverConfig("cover.a", "sensor.a", 180.0, t_min=20.0, t_max=24.0, **kwargs))
+
+
+def test_hysteresis_latches_until_the_band_is_left():
+    temp = _input(temp_hysteresis=1.0)
+    assert temp.update("sensor.a", 24.5) and temp.hot
+    # inside the band below t_max: still hot
+    assert not temp.update("sensor.a", 23.5) and temp.hot
+    assert not temp.update("sensor.a", 23.0) and temp.hot
+    assert temp.update("sensor.a", 22.9) and not temp.hot
+    # and not hot again until above t_max
+    assert not temp.update("sensor.a", 24.0) and not temp.hot
+
+    assert temp.update("sensor.a", 19.5) and temp.cold
+    assert not temp.update("sensor.a", 21.0) and temp.cold
+    assert temp.update("sensor.a", 21.1) and not temp.cold
+
+
+def test_without_hysteresis_flags_follow_the_thresholds():
+    temp = _input()
+    assert temp.update("sensor.a", 24.1) and temp.hot
+    assert temp.update("sensor.a", 23.9) and not temp.hot
+
+
+def test_unknown_reading_clears_flags():
+    temp = _input()
+    temp.update("sensor.a", 30.0)
+    assert temp.update("sensor.a", None)
+    assert (temp.value, temp.hot, temp.cold) == (None, False, False)
+
+
+def test_extra_sensors_are_averaged():
+    temp = _input(extra_temp_sensors=("sensor.b",))
+    temp.update("sensor.a", 22.0)
+    temp.update("sensor.b", 27.0)
+    assert temp.value == 24.5 and temp.hot
+
+
+def test_median_ignores_a_spike():
+    temp = _input(temp_smoothing="median", temp_window=3)
+    for reading in (22.0, 22.0, 40.0):
+        temp.update("sensor.a", reading)
+    assert temp.value == 22.0 and not temp.hot
+
+
+def test_ewma_smooths():
+    temp = _input(temp_smoothing="ewma", temp_window=3)  # alpha 0.5
+    temp.update("sensor.a", 20.0)
+    temp.update("sensor.a", 30.0)
+    assert temp.value == 25.0
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+
+from custom_components.simple_cover_service.const import FORECAST_TTL
+from custom_components.simple_cover_service.forecast import ForecastCache
+from custom_components.simple_cover_service.util.kernel import forecast_peak, parse_forecast
+
+HOUR = 3600.0
+T0 = 1718964000.0  # 2024-06-21 10:00 UTC
+
+
+def _item(hour: int, condition: str, temperature) -> dict:
+    return {"datetime": f"2024-06-21T{10 + hour:02d}:00:00+00:00", "condition": condition, "temperature": temperature}
+
+
+def test_parse_forecast_sorts_and_skips_malformed_items():
+    hours = parse_forecast(
+        [
+            _item(1, "cloudy", 20),
+            _item(0, "Sunny", 25.5),
+            {"condition": "sunny", "temperature": 30},  # no datetime
+            {"datetime": "soon", "condition": "sunny"},
+            _item(2, "partlycloudy", "warm"),
+        ]
+    )
+    assert hours == ((T0, True, 25.5), (T0 + HOUR, False, 20.0), (T0 + 2 * HOUR, True, None))
+
+
+def test_forecast_peak_is_the_hottest_sunny_hour_in_the_window():
+    hours = parse_forecast(
+        [_item(0, "sunny", 24), _item(1, "sunny", 29), _item(2, "rainy", 31), _item(3, "sunny", 33)]
+    )
+    # the hour under way counts, the one starting at the end of the window does not
+    assert forecast_peak(hours, T0 + 1800, 2 * HOUR) == 29
+    assert forecast_peak(hours, T0 + 1800, 3 * HOUR) == 33
+    assert forecast_peak(hours, T0 + 2 * HOUR, HOUR) is None
+    assert forecast_peak((), T0, HOUR) is None
+
+
+class _Weather:
+    """weather.get_forecasts returning `temperature` for one sunny hour."""
+
+    def __init__(self) -> None:
+        self.temperature = 25
+        self.calls = 0
+        self.release = asyncio.Event()
+
+    async def async_call(self, domain, service, data, blocking=False, return_response=False):
+        self.calls += 1
+        await self.release.wait()
+        return {data["entity_id"]: {"forecast": [_item(0, "sunny", self.temperature)]}}
+
+
+def _cache(weather: _Weather) -> ForecastCache:
+    loop = asyncio.get_running_loop()
+    hass = SimpleNamespace(services=weather, async_create_task=lambda target, name: loop.create_task(target, name=name))
+    return ForecastCache(hass)
+
+
+def test_refresh_is_fetched_once_per_ttl_of_the_callers_clock():
+    async def run():
+        weather = _Weather()
+        weather.release.set()
+        cache = _cache(weather)
+        fetched = [
+            await cache.async_refresh("weather.home", T0),
+            await cache.async_refresh("weather.home", T0 + FORECAST_TTL - 1),
+            await cache.async_refresh("weather.home", T0 + FORECAST_TTL),
+        ]
+        return fetched, weather.calls
+
+    assert asyncio.run(run()) == ([True, False, True], 2)
+
+
+def test_invalidated_forecast_is_served_until_the_new_one_arrives():
+    async def run():
+        weather = _Weather()
+        weather.release.set()
+        cache = _cache(weather)
+        await cache.async_refresh("weather.home", T0)
+
+        cache.invalidate("weather.home")
+        assert cache.get("weather.home")[0][2] == 25
+        weather.release.clear()
+        weather.temperature = 30
+        refresh = asyncio.ensure_future(cache.async_refresh("weather.home", T0 + 60))
+        await asyncio.sleep(0)
+        during = cache.get("weather.home")[0][2]
+        weather.release.set()
+        assert await refresh
+        return during, cache.get("weather.home")[0][2], weather.calls
+
+    assert asyncio.run(run()) == (25, 30, 2)
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from datetime import UTC
+
+from custom_components.simple_cover_service.util.history import (
+    KIND_MOVE,
+    KIND_OVERRIDE,
+    HistoryRecord,
+    MoveHistory,
+)
+
+DAY = 86400.0
+T0 = 1718928000.0  # 2024-06-21 00:00 UTC
+
+
+def _history(tmp_path) -> MoveHistory:
+    db = MoveHistory(str(tmp_path / "history.db"))
+    db.append(
+        [
+            HistoryRecord(T0 - 3600, "cover.a", KIND_MOVE, 100, "night"),  # before the window
+            HistoryRecord(T0 + 3600, "cover.a", KIND_MOVE, 20, "sun_in_front"),
+            HistoryRecord(T0 + 7200, "cover.a", KIND_OVERRIDE, 50, None),
+            HistoryRecord(T0 + 7300, "cover.a", KIND_OVERRIDE, None, None),  # open/closed only
+            HistoryRecord(T0 + DAY + 3600, "cover.a", KIND_MOVE, 100, "night"),
+            HistoryRecord(T0 + 600, "cover.b", KIND_MOVE, 0, None),
+        ]
+    )
+    return db
+
+
+def test_time_in_position(tmp_path):
+    db = _history(tmp_path)
+    spent = db.time_in_position(None, T0, T0 + 2 * DAY)
+    assert spent == {
+        "cover.a": {100: 3600 + (DAY - 3600), 20: 3600, 50: DAY - 3600},
+        "cover.b": {0: 2 * DAY - 600},
+    }
+    # a window that only sees the position carried over from before it
+    assert db.time_in_position(["cover.a"], T0, T0 + 1800) == {"cover.a": {100: 1800}}
+    db.close()
+
+
+def test_summary_matches_the_single_queries(tmp_path):
+    db = _history(tmp_path)
+    summary = db.summary(None, T0, T0 + 2 * DAY, UTC)
+    assert summary["cover.a"]["moves"] == 2
+    assert summary["cover.a"]["overrides"] == 2
+    assert summary["cover.a"]["moves_per_rule"] == {"sun_in_front": 1, "night": 1}
+    assert summary["cover.b"]["moves_per_rule"] == {"unknown": 1}
+    per_day = db.moves_per_day(None, T0, T0 + 2 * DAY, UTC)
+    spent = db.time_in_position(None, T0, T0 + 2 * DAY)
+    for cover, item in summary.items():
+        assert item["moves_per_day"] == per_day[cover]
+        assert item["time_in_position"] == {pos: round(s) for pos, s in sorted(spent[cover].items())}
+    db.close()
@@ -0,0 +1,69 @@
+"""The live evaluation path (per-regime lookup + facade index) against the reference rules."""
+
+from __future__ import annotations
+
+import random
+
+from custom_components.simple_cover_service.models import CoverConfig, EnvSnapshot
+from custom_components.simple_cover_service.util.facades import FacadeIndex
+from custom_components.simple_cover_service.util.kernel import cover_decision, skip_reason
+from custom_components.simple_cover_service.util.planner import (
+    ELSEWHERE,
+    FRONT,
+    NIGHT,
+    geometry_of,
+    regime_of,
+    regime_targets,
+)
+
+SEASONS = ("winter", "spring", "summer", "autumn", "intermediate")
+
+
+def _random_cover(rng: random.Random, i: int) -> CoverConfig:
+    min_day = rng.randint(0, 60)
+    return CoverConfig(
+        cover_entity=f"cover.c{i}",
+        temp_sensor=f"sensor.t{i}",
+        # a few shared facades, plus odd ones, including the 0/360 wrap
+        window_azimuth=rng.choice((0.0, 90.0, 180.0, 270.0, 355.0, float(rng.randint(0, 359)))),
+        fov_half=rng.choice((10.0, 45.0, 70.0, 90.0)),
+        default_day=rng.randint(0, 100),
+        min_day=min_day,
+        max_day=rng.randint(min_day + 1, 100),
+        default_night=rng.randint(0, 100),
+    )
+
+
+def _random_env(rng: random.Random) -> EnvSnapshot:
+    return EnvSnapshot(
+        sun_available=rng.random() > 0.1,
+        elevation=rng.uniform(-20, 70),
+        azimuth=rng.choice((rng.uniform(0, 360), float(rng.randint(0, 359)))),
+        direct_sun=rng.random() > 0.3,
+        season=rng.choice(SEASONS),
+        is_night=rng.random() < 0.2,
+    )
+
+
+def test_lookup_matches_cover_decision():
+    rng = random.Random(1234)
+    configs = [_random_cover(rng, i) for i in range(200)]
+    index = FacadeIndex(configs)
+    for _ in range(500):
+        env = _random_env(rng)
+        facing = index.facing(env.azimuth) if env.direct_sun and env.elevation > 0 else frozenset()
+        for cfg in configs:
+            hot, cold = rng.random() < 0.5, rng.random() < 0.5
+            targets = regime_targets(cfg, regime_of(env, hot, cold))
+            if env.is_night:
+                got = targets[NIGHT]
+            else:
+                got = targets[FRONT if geometry_of(cfg) in facing else ELSEWHERE]
+            assert got == cover_decision(cfg, env, hot, cold), (cfg, env, hot, cold)
+
+
+def test_skip_reason():
+    cfg = CoverConfig("cover.a", "sensor.a", 180.0, min_delta_position=10, min_delta_time=300)
+    assert skip_reason(cfg, 0.0, 50, 45, 1000.0) == "delta_position"
+    assert skip_reason(cfg, 900.0, 80, 40, 1000.0) == "delta_time"
+    assert skip_reason(cfg, 600.0, 80, 40, 1000.0) is None
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from custom_components.simple_cover_service.models import IssuedContexts
+
+
+def test_issued_contexts_expire_after_ttl():
+    issued = IssuedContexts(ttl=10.0)
+    issued.add("a", 100.0)
+    issued.add("b", 105.0)
+    assert issued.contains("a", 109.9)
+    assert not issued.contains("a", 110.0)
+    assert issued.contains("b", 110.0)
+    assert not issued.contains(None, 100.0)
+    assert not issued.contains("unknown", 100.0)
+
+
+def test_issued_contexts_prune_on_add():
+    issued = IssuedContexts(ttl=10.0)
+    for i in range(5):
+        issued.add(str(i), float(i))
+    assert len(issued) == 5
+    issued.add("late", 12.0)  # 0, 1 and 2 have expired
+    assert len(issued) == 3
+    issued.prune(100.0)
+    assert len(issued) == 0
+
+
+def test_reissued_context_gets_a_new_expiry():
+    issued = IssuedContexts(ttl=10.0)
+    issued.add("a", 0.0)
+    issued.add("b", 5.0)
+    issued.add("a", 8.0)
+    issued.prune(12.0)  # b (expires 15) and a (expires 18) survive
+    assert issued.contains("a", 17.0) and issued.contains("b", 14.0)
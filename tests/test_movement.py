@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+
+from homeassistant.helpers import entity_registry as er
+
+from custom_components.simple_cover_service.movement import MovementScheduler, PendingMove
+
+
+class _Registry:
+    """cover.<gateway>_<n> belongs to the config entry <gateway>."""
+
+    def async_get(self, entity_id: str) -> SimpleNamespace:
+        return SimpleNamespace(config_entry_id=entity_id.split(".")[1].split("_")[0], platform="test")
+
+
+def _mover() -> MovementScheduler:
+    loop = asyncio.get_running_loop()
+    hass = SimpleNamespace(
+        data={er.DATA_REGISTRY: _Registry()},
+        async_create_background_task=lambda target, name, eager_start=False: loop.create_task(target, name=name),
+    )
+    return MovementScheduler(hass)
+
+
+class _Gateway:
+    """A send callback that holds each command for `duration` and records what ran when."""
+
+    def __init__(self, duration: float = 0.0) -> None:
+        self.duration = duration
+        self.sent: list[tuple[int, list[str]]] = []
+        self.started: list[float] = []
+        self.running = 0
+        self.peak = 0
+
+    async def send(self, send_pos: int, members: list[tuple[str, int]]) -> None:
+        self.sent.append((send_pos, [cover for cover, _ in members]))
+        self.started.append(asyncio.get_running_loop().time())
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        await asyncio.sleep(self.duration)
+        self.running -= 1
+
+
+def _move(cover: str, target: int, priority: float = 0.0) -> PendingMove:
+    return PendingMove(cover, target, target, priority)
+
+
+def test_same_position_is_one_command_and_priority_orders_the_queue():
+    async def run():
+        mover = _mover()
+        mover.async_configure("a", concurrency=1, rate=0, max_parallel=8)
+        gw = _Gateway()
+        mover.async_submit(
+            "a",
+            gw.send,
+            [_move("cover.x_1", 50, -10), _move("cover.x_2", 0, -100), _move("cover.x_3", 50, -20)],
+        )
+        await mover.async_drain()
+        return gw.sent
+
+    assert asyncio.run(run()) == [(0, ["cover.x_2"]), (50, ["cover.x_1", "cover.x_3"])]
+
+
+def test_concurrency_is_shared_by_entries_on_one_gateway():
+    async def run():
+        mover = _mover()
+        mover.async_configure("a", concurrency=2, rate=0, max_parallel=8)
+        mover.async_configure("b", concurrency=2, rate=0, max_parallel=8)
+        gw = _Gateway(0.01)
+        mover.async_submit("a", gw.send, [_move(f"cover.x_{i}", i) for i in range(3)])
+        mover.async_submit("b", gw.send, [_move(f"cover.x_{i}", i) for i in range(3, 6)])
+        await mover.async_drain()
+        return gw
+
+    gw = asyncio.run(run())
+    assert len(gw.sent) == 6
+    assert gw.peak == 2
+
+
+def test_gateways_run_in_parallel_up_to_max_parallel():
+    async def run(max_parallel):
+        mover = _mover()
+        mover.async_configure("a", concurrency=1, rate=0, max_parallel=max_parallel)
+        gw = _Gateway(0.01)
+        mover.async_submit("a", gw.send, [_move(f"cover.g{i}_1", 10) for i in range(4)])
+        await mover.async_drain()
+        return gw.peak
+
+    assert asyncio.run(run(8)) == 4
+    assert asyncio.run(run(2)) == 2
+
+
+def test_rate_spaces_commands_on_a_gateway():
+    async def run():
+        mover = _mover()
+        mover.async_configure("a", concurrency=4, rate=20, max_parallel=8)
+        gw = _Gateway()
+        mover.async_submit("a", gw.send, [_move(f"cover.x_{i}", i) for i in range(3)])
+        await mover.async_drain()
+        return gw.started
+
+    started = asyncio.run(run())
+    gaps = [b - a for a, b in zip(started, started[1:])]
+    assert len(gaps) == 2
+    assert min(gaps) >= 0.045
+
+
+def test_new_command_starts_while_a_slow_one_is_in_flight():
+    async def run():
+        mover = _mover()
+        mover.async_configure("a", concurrency=2, rate=0, max_parallel=8)
+        slow = _Gateway(0.5)
+        fast = _Gateway()
+        mover.async_submit("a", slow.send, [_move("cover.x_1", 10)])
+        await asyncio.sleep(0.01)
+        mover.async_submit("a", fast.send, [_move("cover.x_2", 20)])
+        await asyncio.sleep(0.05)
+        sent = list(fast.sent)
+        mover.async_cancel()
+        return sent
+
+    assert asyncio.run(run()) == [(20, ["cover.x_2"])]
+
+
+def test_removed_entry_loses_its_queued_commands():
+    async def run():
+        mover = _mover()
+        mover.async_configure("a", concurrency=1, rate=0, max_parallel=8)
+        mover.async_configure("b", concurrency=1, rate=0, max_parallel=8)
+        gw = _Gateway(0.01)
+        mover.async_submit("a", gw.send, [_move(f"cover.x_{i}", i) for i in range(3)])
+        mover.async_submit("b", gw.send, [_move("cover.x_9", 90)])
+        await asyncio.sleep(0)
+        mover.async_remove_entry("a")
+        await mover.async_drain()
+        return [pos for pos, _ in gw.sent]
+
+    # the first command of "a" was already in flight
+    assert asyncio.run(run()) == [0, 90]
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from custom_components.simple_cover_service.util.planner import DayPlan, build_day_plan, shift_daylight
+
+DAY = 86400.0
+T0 = 1718928000.0  # 2024-06-21 00:00 UTC
+
+
+def _plan(*daylight: tuple[float, float]) -> DayPlan:
+    return DayPlan(0.0, DAY, list(daylight))
+
+
+def test_transitions_skip_the_plan_bounds():
+    assert _plan((20000, 70000)).transitions() == [20000, 70000]
+    # daylight across midnight UTC: sunset comes before sunrise
+    assert _plan((0, 10000), (60000, DAY)).transitions() == [10000, 60000]
+    assert _plan((0, DAY)).transitions() == []
+    assert _plan().transitions() == []
+
+
+def test_shift_daylight_moves_sunrise_and_sunset():
+    plan = _plan((20000, 70000))
+    assert shift_daylight(plan, 1800, -3600) == [(21800, 66400)]
+    assert shift_daylight(plan, 0, 0) == [(20000, 70000)]
+    # clamped to the plan
+    assert shift_daylight(plan, -30000, 30000) == [(0, DAY)]
+
+
+def test_shift_daylight_keeps_midnight_bounds():
+    assert shift_daylight(_plan((0, 10000), (60000, DAY)), 600, 600) == [(0, 10600), (60600, DAY)]
+    assert shift_daylight(_plan((0, DAY)), 3600, -3600) == [(0, DAY)]
+
+
+def test_shift_daylight_drops_a_day_the_offsets_swallow():
+    assert shift_daylight(_plan((40000, 41000)), 600, -600) == []
+
+
+def test_built_plan_has_sunrise_and_sunset():
+    # Barcelona at midsummer: about 04:20 and 19:30 UTC
+    plan = build_day_plan([], T0, T0 + DAY, 41.39, 2.17)
+    sunrise, sunset = plan.transitions()
+    assert 4 * 3600 < sunrise - T0 < 4.75 * 3600
+    assert 19 * 3600 < sunset - T0 < 19.75 * 3600
+    assert plan.is_night(sunrise - 60) and not plan.is_night(sunrise + 60)
+    assert not plan.is_night(sunset - 60) and plan.is_night(sunset + 60)
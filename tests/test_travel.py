@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import pytest
+
+from custom_components.simple_cover_service.util.travel import TRAVEL_ALPHA, TravelModel
+
+
+def test_arrive_learns_each_direction():
+    model = TravelModel()
+    assert model.begin(0.0, 100, 20) is None  # speed unknown yet
+    assert model.moving and model.position(10.0) is None
+    model.arrive(40.0)
+    assert (model.up, model.down, model.samples) == (None, 0.5, 1)
+    assert not model.moving
+
+    model.begin(100.0, 20, 70)
+    model.arrive(110.0)
+    assert (model.up, model.down, model.samples) == (0.2, 0.5, 2)
+
+    # later readings are averaged in
+    model.begin(200.0, 70, 20)
+    model.arrive(250.0)
+    assert model.down == pytest.approx(0.5 + TRAVEL_ALPHA * (1.0 - 0.5))
+
+
+@pytest.mark.parametrize(
+    ("start", "target", "seconds"),
+    [
+        (None, 20, 10.0),  # start unknown
+        (50, 52, 10.0),  # too short a move
+        (100, 0, 0.5),  # faster than a real cover
+        (100, 0, 5000.0),  # slower than a real cover
+    ],
+)
+def test_arrive_ignores_implausible_moves(start, target, seconds):
+    model = TravelModel()
+    model.begin(0.0, start, target)
+    model.arrive(seconds)
+    assert (model.up, model.down, model.samples) == (None, None, 0)
+    assert model.position(seconds) == target
+
+
+def test_arrive_counts_once():
+    model = TravelModel()
+    model.begin(0.0, 100, 0)
+    model.arrive(50.0)
+    model.arrive(80.0)
+    assert (model.down, model.samples) == (0.5, 1)
+
+
+def test_position_interpolates_until_arrival():
+    model = TravelModel()
+    model.restore({"up": 0.2, "down": 0.5, "samples": 3})
+    assert model.position(0.0) is None  # nothing commanded
+
+    assert model.begin(0.0, 100, 20) == 40.0
+    assert model.position(0.0) == 100
+    assert model.position(20.0) == 60
+    assert model.position(40.0) == 20
+    assert model.position(100.0) == 20  # due: assumed there
+
+    model.begin(100.0, 20, 70)
+    assert model.position(105.0) == 45
+    model.arrive(106.0)
+    assert model.position(106.0) == 70
+
+    model.cancel()
+    assert model.position(200.0) is None and not model.moving